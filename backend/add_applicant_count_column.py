@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script
+Adds the denormalized applicant_count column to the internships table and
+fills it from the applications table.
+
+Usage:
+    python add_applicant_count_column.py
+"""
+
+import sys
+import os
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import text
+from app.db.session import SessionLocal
+from app.utils.applicant_counts import reconcile_applicant_counts
+
+
+def migrate_database():
+    """Add internships.applicant_count and backfill it"""
+    
+    db = SessionLocal()
+    
+    try:
+        print("\n" + "=" * 60)
+        print("🔧 Database Migration: Adding Internship Applicant Counts")
+        print("=" * 60 + "\n")
+        
+        # Add applicant_count column to internships table
+        print("⏳ Adding applicant_count column to internships table...")
+        try:
+            db.execute(text("""
+                ALTER TABLE internships 
+                ADD COLUMN IF NOT EXISTS applicant_count INTEGER NOT NULL DEFAULT 0
+            """))
+            db.commit()
+            print("✅ Successfully added applicant_count column to internships table")
+        except Exception as e:
+            print(f"⚠️  Note: {e}")
+            db.rollback()
+        
+        # Backfill counts for existing internships
+        print("⏳ Backfilling applicant counts...")
+        result = reconcile_applicant_counts(db)
+        if not result["success"]:
+            raise Exception(result["error"])
+        print(f"✅ {result['message']}")
+        
+        print("\n" + "=" * 60)
+        print("✅ DATABASE MIGRATION COMPLETED SUCCESSFULLY!")
+        print("=" * 60 + "\n")
+        
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate_database()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script
+Makes (student_id, internship_id) unique on the applications table and adds
+the idempotency_key column used by the apply endpoint.
+
+Existing duplicate applications are removed first: per student and
+internship the application furthest along (not pending), then the oldest,
+is kept. Applicant counts and daily stats are recomputed afterwards.
+
+Usage:
+    python add_application_unique_constraint.py
+"""
+
+import sys
+import os
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import text
+from app.db.session import SessionLocal
+from app.utils.applicant_counts import reconcile_applicant_counts
+from app.utils.application_stats import rebuild_daily_application_stats
+
+INDEXES = [
+    ("uq_applications_student_internship", "student_id, internship_id"),
+    ("uq_applications_student_idempotency_key", "student_id, idempotency_key"),
+]
+
+
+def migrate_database():
+    """Remove duplicate applications, then add the unique indexes"""
+    
+    db = SessionLocal()
+    
+    try:
+        print("\n" + "=" * 60)
+        print("🔧 Database Migration: Unique Applications per Student")
+        print("=" * 60 + "\n")
+        
+        print("⏳ Adding idempotency_key column to applications table...")
+        try:
+            db.execute(text("ALTER TABLE applications ADD COLUMN idempotency_key VARCHAR(255)"))
+            db.commit()
+            print("✅ Successfully added idempotency_key column to applications table")
+        except Exception as e:
+            print(f"⚠️  Note: {e}")
+            db.rollback()
+        
+        print("⏳ Removing duplicate applications...")
+        result = db.execute(text("""
+            DELETE FROM applications WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY student_id, internship_id
+                        ORDER BY CASE WHEN status = 'pending' THEN 1 ELSE 0 END, application_date, id
+                    ) AS position
+                    FROM applications
+                ) ranked WHERE position > 1
+            )
+        """))
+        db.commit()
+        removed = result.rowcount
+        print(f"✅ Removed {removed} duplicate application(s)")
+        
+        for name, columns in INDEXES:
+            print(f"⏳ Creating {name} on applications ({columns})...")
+            db.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS {name} ON applications ({columns})"))
+            db.commit()
+            print(f"✅ Successfully created {name}")
+        
+        if removed:
+            for step in (reconcile_applicant_counts, rebuild_daily_application_stats):
+                result = step(db)
+                if not result["success"]:
+                    raise Exception(result["error"])
+                print(f"✅ {result['message']}")
+        
+        print("\n" + "=" * 60)
+        print("✅ DATABASE MIGRATION COMPLETED SUCCESSFULLY!")
+        print("=" * 60 + "\n")
+        
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate_database()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script
+Adds applications.updated_at (the version stamp behind the applicant list
+and detail ETags) and fills it from application_date.
+
+Usage:
+    python add_application_updated_at.py
+"""
+
+import sys
+import os
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import text
+from app.db.session import SessionLocal
+
+
+def migrate_database():
+    """Add applications.updated_at and backfill it"""
+    
+    db = SessionLocal()
+    
+    try:
+        print("\n" + "=" * 60)
+        print("🔧 Database Migration: Adding Application updated_at")
+        print("=" * 60 + "\n")
+        
+        print("⏳ Adding updated_at column to applications table...")
+        try:
+            db.execute(text("ALTER TABLE applications ADD COLUMN updated_at TIMESTAMP"))
+            db.commit()
+            print("✅ Successfully added updated_at column to applications table")
+        except Exception as e:
+            print(f"⚠️  Note: {e}")
+            db.rollback()
+        
+        print("⏳ Backfilling updated_at from application_date...")
+        result = db.execute(text("UPDATE applications SET updated_at = application_date WHERE updated_at IS NULL"))
+        db.commit()
+        print(f"✅ Backfilled {result.rowcount} application(s)")
+        
+        print("\n" + "=" * 60)
+        print("✅ DATABASE MIGRATION COMPLETED SUCCESSFULLY!")
+        print("=" * 60 + "\n")
+        
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate_database()
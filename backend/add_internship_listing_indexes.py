@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script
+Adds the composite indexes used by the keyset-paginated, filterable public
+internship listing (GET /api/v1/internships/).
+
+Usage:
+    python add_internship_listing_indexes.py
+"""
+
+import sys
+import os
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import text
+from app.db.session import SessionLocal
+
+INDEXES = [
+    ("ix_internships_date_posted_id", "date_posted, id"),
+    ("ix_internships_location_date_posted", "location, date_posted, id"),
+    ("ix_internships_type_date_posted", "type, date_posted, id"),
+    ("ix_internships_level_date_posted", "level, date_posted, id"),
+    ("ix_internships_category_date_posted", "category, date_posted, id"),
+    ("ix_internships_stipend", "stipend"),
+    ("ix_internships_deadline", "deadline"),
+]
+
+
+def migrate_database():
+    """Create the internship listing indexes"""
+    
+    db = SessionLocal()
+    
+    try:
+        print("\n" + "=" * 60)
+        print("🔧 Database Migration: Adding Internship Listing Indexes")
+        print("=" * 60 + "\n")
+        
+        for name, columns in INDEXES:
+            print(f"⏳ Creating {name} on internships ({columns})...")
+            try:
+                db.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON internships ({columns})"))
+                db.commit()
+                print(f"✅ Successfully created {name}")
+            except Exception as e:
+                print(f"⚠️  Note: {e}")
+                db.rollback()
+        
+        print("\n" + "=" * 60)
+        print("✅ DATABASE MIGRATION COMPLETED SUCCESSFULLY!")
+        print("=" * 60 + "\n")
+        
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate_database()
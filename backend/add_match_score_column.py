@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script
+Adds the match_score column to the applications table, indexes it together
+with internship_id, and backfills scores for existing applications.
+
+Usage:
+    python add_match_score_column.py
+"""
+
+import sys
+import os
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import text
+from app.db.session import SessionLocal
+from app.models.internship import Internship
+from app.utils.match_scores import recompute_internship_match_scores
+
+
+def migrate_database():
+    """Add applications.match_score with its index and backfill it"""
+    
+    db = SessionLocal()
+    
+    try:
+        print("\n" + "=" * 60)
+        print("🔧 Database Migration: Adding Application Match Scores")
+        print("=" * 60 + "\n")
+        
+        # Add match_score column to applications table
+        print("⏳ Adding match_score column to applications table...")
+        try:
+            db.execute(text("""
+                ALTER TABLE applications 
+                ADD COLUMN IF NOT EXISTS match_score FLOAT
+            """))
+            db.commit()
+            print("✅ Successfully added match_score column to applications table")
+        except Exception as e:
+            print(f"⚠️  Note: {e}")
+            db.rollback()
+        
+        # Index used for ORDER BY match_score DESC LIMIT n per internship
+        print("⏳ Creating (internship_id, match_score) index...")
+        try:
+            db.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_applications_internship_match_score
+                ON applications (internship_id, match_score)
+            """))
+            db.commit()
+            print("✅ Successfully created ix_applications_internship_match_score")
+        except Exception as e:
+            print(f"⚠️  Note: {e}")
+            db.rollback()
+        
+        # Backfill scores for existing applications
+        print("⏳ Backfilling match scores...")
+        internship_ids = [row.id for row in db.query(Internship.id).all()]
+        updated = 0
+        for internship_id in internship_ids:
+            updated += recompute_internship_match_scores(internship_id, db)
+        print(f"✅ Backfilled match scores for {updated} application(s)")
+        
+        print("\n" + "=" * 60)
+        print("✅ DATABASE MIGRATION COMPLETED SUCCESSFULLY!")
+        print("=" * 60 + "\n")
+        
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate_database()
@@ -11,6 +11,8 @@ from app.db.session import SessionLocal
 from app.models.user import User
 from app.models.company import Company, EmployerProfile
 from app.schemas.token import TokenData
+from app.utils.matching import SCORING_MODES, SkillWeight
+from app.utils.skill_frequency import idf_weights
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"/api/v1/auth/login",
@@ -90,4 +92,17 @@ def get_current_active_company(
         raise HTTPException(
             status_code=404, detail="Employer profile not found"
         )
-    return employer_profile
\ No newline at end of file
+    return employer_profile
+
+
+def get_skill_weights(
+    scoring: str = "standard",
+    db: Session = Depends(get_db),
+) -> Optional[SkillWeight]:
+    # "standard": every skill counts the same; "idf": rare skills count more
+    if scoring not in SCORING_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"scoring must be one of: {', '.join(SCORING_MODES)}"
+        )
+    return idf_weights(db) if scoring == "idf" else None
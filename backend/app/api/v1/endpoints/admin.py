@@ -1,13 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_, or_
+from sqlalchemy import func, desc, and_, or_, select
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 from app.api.deps import get_current_user, get_db
 from app.models.user import User
 from app.models.company import Company
-from app.models.internship import Internship
+from app.models.internship import Internship, InternshipStatus
 from app.models.application import Application
+from app.utils import internship_search
+from app.utils.match_scores import MATCH_FIELDS, recompute_internship_match_scores
+from app.utils.match_cache import match_cache
+from app.utils.internship_catalog import internship_catalog
+from app.utils.scheduler import scheduler
+from app.models.scheduler import JobRun
 
 router = APIRouter()
 
@@ -40,7 +46,7 @@ async def get_dashboard_stats(
     
     # Get active internships
     active_internships = db.query(Internship).filter(
-        Internship.status == "active"
+        Internship.status == InternshipStatus.ACTIVE.value
     ).count()
     
     # Get verified companies
@@ -135,7 +141,7 @@ async def get_audit_logs(
     
     # Get recent internship approvals
     recent_internships = db.query(Internship).filter(
-        Internship.status == "active"
+        Internship.status == InternshipStatus.ACTIVE.value
     ).order_by(desc(Internship.id)).limit(limit // 2).all()
     
     for internship in recent_internships:
@@ -251,7 +257,7 @@ async def get_all_companies(
         active_postings = db.query(Internship).filter(
             and_(
                 Internship.company_id == company.id,
-                Internship.status == "active"
+                Internship.status == InternshipStatus.ACTIVE.value
             )
         ).count()
         
@@ -299,16 +305,24 @@ async def get_all_internships(
     query = db.query(Internship)
     
     if search:
-        query = query.filter(
-            or_(
-                Internship.title.ilike(f"%{search}%"),
-                Internship.location.ilike(f"%{search}%"),
-                Internship.category.ilike(f"%{search}%")
+        # Use the full-text index when available
+        matching_ids = internship_search.matching_internship_ids(db, search) if internship_search.search_available else None
+        if matching_ids is not None:
+            query = query.filter(Internship.id.in_(select(matching_ids.c.internship_id)))
+        else:
+            query = query.filter(
+                or_(
+                    Internship.title.ilike(f"%{search}%"),
+                    Internship.location.ilike(f"%{search}%"),
+                    Internship.category.ilike(f"%{search}%")
+                )
             )
-        )
     
     if status_filter and status_filter != "all":
-        query = query.filter(Internship.status == status_filter)
+        try:
+            query = query.filter(Internship.status == InternshipStatus.parse(status_filter).value)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid status: {status_filter}")
     
     if type_filter and type_filter != "all":
         query = query.filter(Internship.type == type_filter)
@@ -321,9 +335,7 @@ async def get_all_internships(
     for internship in internships:
         company = db.query(Company).filter(Company.id == internship.company_id).first()
         
-        application_count = db.query(Application).filter(
-            Application.internship_id == internship.id
-        ).count()
+        application_count = internship.applicant_count
         
         # Determine internship status
         if internship.is_suspended:
@@ -459,6 +471,7 @@ async def suspend_company(
         
         db.commit()
         db.refresh(company)
+        internship_catalog.invalidate()
         
         return {
             "message": "Company suspended successfully",
@@ -505,6 +518,7 @@ async def unsuspend_company(
         
         db.commit()
         db.refresh(company)
+        internship_catalog.invalidate()
         
         return {
             "message": "Company unsuspended successfully",
@@ -564,6 +578,7 @@ async def delete_company(
         # Delete company record
         db.delete(company)
         db.commit()
+        internship_catalog.invalidate()
         
         return {
             "message": "Company deleted successfully",
@@ -707,7 +722,7 @@ async def approve_internship(
     if not internship:
         raise HTTPException(status_code=404, detail="Internship not found")
     
-    internship.status = "active"
+    internship.status = InternshipStatus.ACTIVE.value
     db.commit()
     db.refresh(internship)
     
@@ -845,6 +860,50 @@ async def unsuspend_internship(
     return {"message": "Internship unsuspended successfully", "internship_id": internship.id, "is_suspended": internship.is_suspended}
 
 
+@router.get("/match-cache/stats")
+async def get_match_cache_stats(
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Hit/miss/eviction counters of this worker's match result cache"""
+    return match_cache.stats()
+
+
+@router.get("/scheduler/jobs")
+async def get_scheduler_jobs(
+    limit: int = 20,
+    db: Session = Depends(get_db),
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Periodic jobs: this worker's counters and the latest runs across all workers"""
+    runs = db.query(JobRun).order_by(desc(JobRun.started_at)).limit(min(max(limit, 1), 200)).all()
+    return {
+        **scheduler.stats(),
+        "recent_runs": [
+            {
+                "job_name": run.job_name,
+                "worker": run.worker,
+                "started_at": run.started_at,
+                "finished_at": run.finished_at,
+                "duration_ms": run.duration_ms,
+                "success": run.success,
+                "error": run.error,
+            }
+            for run in runs
+        ],
+    }
+
+
+@router.post("/scheduler/jobs/{job_name}/run")
+def run_scheduler_job(
+    job_name: str,
+    current_admin: User = Depends(get_current_admin_user)
+):
+    """Run a periodic job now on this worker (bypasses the job lease)"""
+    if job_name not in scheduler.jobs:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return scheduler.run_job(job_name, force=True)
+
+
 # Enhanced Admin Database Management Endpoints
 
 @router.patch("/users/{user_id}/update")
@@ -923,6 +982,7 @@ async def update_company(
 async def update_internship(
     internship_id: str,
     updates: Dict[str, Any],
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_admin: User = Depends(get_current_admin_user)
 ):
@@ -940,6 +1000,8 @@ async def update_internship(
         
         db.commit()
         db.refresh(internship)
+        if any(field in updates for field in MATCH_FIELDS):
+            background_tasks.add_task(recompute_internship_match_scores, internship_id)
         
         return {
             "message": "Internship updated successfully",
@@ -1,18 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Request, Response
+from sqlalchemy import false, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
+from typing import List, Optional
 import uuid
 from datetime import datetime
 from app.api import deps
-from app.schemas.application import Application, ApplicationCreate
-from app.models.application import Application as ApplicationModel
+from app.schemas.application import Application, ApplicationBulkStatusUpdate, ApplicationCreate
+from app.models.application import Application as ApplicationModel, ApplicationStatus, CONTACT_VISIBLE_STATUSES
 from app.models.internship import Internship as InternshipModel
 from app.models.user import User
-from app.models.company import Company
-from app.utils.matching import calculate_skills_match, calculate_detailed_match
-from sqlalchemy import func, or_
-from app.utils.email import send_email
-from app.core.config import settings
+from app.models.profile import StudentProfile
+from app.models.company import Company, EmployerProfile
+from app.utils.matching import SkillWeight
+from app.utils.match_scores import compute_match_score
+from app.utils.match_cache import cached_detailed_match, cached_detailed_match_batch
+from app.utils.etags import compute_etag, etag_matches
+from app.utils.application_stats import record_status_changes
+from app.utils.application_events import application_timeline, record_status_events
+from app.utils.offer_notifications import send_offer_notifications
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, encode_cursor, decode_cursor, after_desc_nulls_last
 
 router = APIRouter()
 
@@ -40,45 +47,73 @@ def apply_for_internship(
     application_in: ApplicationCreate,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_intern),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
 ):
-    db_internship = db.query(InternshipModel).filter(InternshipModel.id == application_in.internship_id).first()
+    """Apply to an internship (students only)
+
+    Duplicates are rejected by the unique (student_id, internship_id) index
+    rather than a prior lookup, so concurrent submissions cannot both
+    succeed. With an `Idempotency-Key` header, retrying the same request
+    returns the application it created instead of an error.
+    """
+    db_internship = db.get(InternshipModel, application_in.internship_id)
     if not db_internship:
         raise HTTPException(status_code=404, detail="Internship not found")
-    
-    # Check if already applied
-    existing_application = db.query(ApplicationModel).filter(
-        ApplicationModel.student_id == current_user.id,  # Use integer ID directly
-        ApplicationModel.internship_id == application_in.internship_id
-    ).first()
-    if existing_application:
-        raise HTTPException(status_code=400, detail="You have already applied to this internship")
+    company_id = db_internship.employer_profile_id
+    student_id = current_user.id
 
     # Generate UUID for the application
     application_id = str(uuid.uuid4())
+    applied_at = datetime.utcnow()
     
-    db_application = ApplicationModel(
+    db.add(ApplicationModel(
         id=application_id,
-        student_id=current_user.id,  # Use integer ID directly, not string
+        status=ApplicationStatus.PENDING.value,
+        student_id=student_id,  # Use integer ID directly, not string
         internship_id=application_in.internship_id,
-        application_date=datetime.utcnow()  # Explicitly set application date
-    )
-    db.add(db_application)
-    db.commit()
-    db.refresh(db_application)
-    # Get the related internship and company
-    internship = db.query(InternshipModel).filter(InternshipModel.id == db_application.internship_id).first()
-    company_id = internship.employer_profile_id if internship else None
-    from app.schemas.application import Application
+        application_date=applied_at,  # Explicitly set application date
+        match_score=compute_match_score(current_user.student_profile, db_internship),
+        idempotency_key=idempotency_key,
+    ))
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        existing_application = db.query(ApplicationModel).filter(
+            ApplicationModel.student_id == student_id,
+            or_(
+                ApplicationModel.internship_id == application_in.internship_id,
+                ApplicationModel.idempotency_key == idempotency_key if idempotency_key else false()
+            )
+        ).order_by((ApplicationModel.internship_id == application_in.internship_id).desc()).first()
+        if existing_application is None:
+            # Not a duplicate (e.g. the internship was deleted meanwhile)
+            raise HTTPException(status_code=404, detail="Internship not found")
+        if idempotency_key is None or existing_application.idempotency_key != idempotency_key:
+            raise HTTPException(status_code=400, detail="You have already applied to this internship")
+        if existing_application.internship_id != application_in.internship_id:
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used for a different internship")
+        # Retry of a request that already succeeded
+        return Application(
+            id=existing_application.id,
+            status=existing_application.status,
+            intern_id=existing_application.student_id,
+            internship_id=existing_application.internship_id,
+            company_id=str(company_id),
+            application_date=existing_application.application_date,
+            offer_sent_date=existing_application.offer_sent_date,
+            offer_response_date=existing_application.offer_response_date,
+            hired_date=existing_application.hired_date,
+        )
+    
+    # Built from known values: no refresh or internship re-read after the commit
     return Application(
-        id=db_application.id,
-        status=db_application.status,
-        intern_id=db_application.student_id,
-        internship_id=db_application.internship_id,
-        company_id=company_id,
-        application_date=db_application.application_date,
-        offer_sent_date=db_application.offer_sent_date,
-        offer_response_date=db_application.offer_response_date,
-        hired_date=db_application.hired_date,
+        id=application_id,
+        status=ApplicationStatus.PENDING.value,
+        intern_id=student_id,
+        internship_id=application_in.internship_id,
+        company_id=str(company_id),
+        application_date=applied_at,
     )
 
 @router.get("/my-applications")
@@ -151,7 +186,7 @@ def get_my_applications(
                 "salary": f"₹{internship.stipend:,}" if internship.stipend else None,
                 "duration": internship.duration,
                 "type": internship.type,
-                "status": app.status.lower(),
+                "status": app.status,
                 "application_date": app.application_date.isoformat() if app.application_date else None,
                 "offer_sent_date": app.offer_sent_date.isoformat() if app.offer_sent_date else None,
                 "offer_response_date": app.offer_response_date.isoformat() if app.offer_response_date else None,
@@ -170,7 +205,7 @@ def get_my_applications(
                 },
                 "work_experiences": work_experiences,
                 "projects": projects,
-                "status_priority": status_priority.get(app.status.lower(), 999)  # Add priority for sorting
+                "status_priority": status_priority.get(app.status, 999)  # Add priority for sorting
             })
     
     # Sort by status priority (Offered first, then Accepted, Pending, Rejected)
@@ -190,15 +225,11 @@ def get_my_offers(
     """Get all offers (applications with status='Offered' or 'Accepted') for the current intern with internship and company details"""
     print(f"DEBUG: Current user ID: {current_user.id}, Email: {current_user.email}, Role: {current_user.role}")
     
-    # Query applications where status indicates an offer or accepted state.
-    # Use case-insensitive matching and allow variations like 'offered', 'offer_accepted', 'offer accepted', etc.
-    # Accept different variants of offer/accepted status
+    # Query applications where status indicates an offer or accepted state
+    # (statuses are stored canonical, see ApplicationStatus)
     applications = db.query(ApplicationModel).filter(
         ApplicationModel.student_id == current_user.id,
-        or_(
-            func.lower(ApplicationModel.status).like('%offer%'),
-            func.lower(ApplicationModel.status).in_(['accepted', 'offer_accepted', 'offer accepted'])
-        )
+        ApplicationModel.status.in_([ApplicationStatus.OFFERED.value, ApplicationStatus.ACCEPTED.value])
     ).all()
     
     offers_list = []
@@ -220,7 +251,7 @@ def get_my_offers(
                 "stipend": internship.stipend,
                 "location": internship.location,
                 "startDate": internship.date_posted.isoformat() if internship.date_posted else None,
-                "status": app.status.lower(),
+                "status": app.status,
                 "application_date": app.application_date.isoformat() if app.application_date else None,
                 "offer_sent_date": app.offer_sent_date.isoformat() if app.offer_sent_date else None,
                 "offer_response_date": app.offer_response_date.isoformat() if app.offer_response_date else None,
@@ -239,31 +270,56 @@ def get_my_offers(
 @router.get("/{internship_id}/applicants")
 def get_applicants_with_match_score(
     internship_id: str,  # Changed to string for UUID
+    skip: int = 0,
+    limit: Optional[int] = None,
     db: Session = Depends(deps.get_db),
     current_company: Company = Depends(deps.get_current_active_company),
+    skill_weights: Optional[SkillWeight] = Depends(deps.get_skill_weights),
 ):
+    """Get applicants for an internship ranked by match score (optionally paginated)
+
+    With `scoring=idf` every applicant of the internship is scored and ranked
+    before `skip`/`limit` are applied, since the persisted match score is the
+    standard one.
+    """
     db_internship = db.query(InternshipModel).filter(InternshipModel.id == internship_id).first()
     if not db_internship or db_internship.employer_profile_id != current_company.id:
         raise HTTPException(status_code=404, detail="Internship not found")
 
-    applications = db.query(ApplicationModel).filter(ApplicationModel.internship_id == internship_id).all()
+    query = db.query(ApplicationModel).options(
+        joinedload(ApplicationModel.student).joinedload(User.student_profile)
+    ).filter(
+        ApplicationModel.internship_id == internship_id
+    ).order_by(
+        ApplicationModel.match_score.desc().nullslast(),
+        ApplicationModel.application_date
+    )
+    if skill_weights is None:
+        # Rank and page in the database using the persisted match score
+        query = query.offset(skip).limit(limit)
+    applications = query.all()
+    
+    # Get student skills from their profiles and normalize to list/string
+    students_skills = [
+        _normalize_skills(app.student.student_profile.skills if getattr(app.student, 'student_profile', None) else None)
+        for app in applications
+    ]
+    
+    # Score all applicants against the internship in one vectorized pass
+    # (pairs whose profile and posting are unchanged come from the match cache)
+    all_match_details = cached_detailed_match_batch(
+        [getattr(app.student, 'student_profile', None) for app in applications],
+        [", ".join(skills_list) if skills_list else "" for skills_list in students_skills],
+        db_internship,
+        required_skills=db_internship.required_skills or db_internship.skills,
+        internship_level=db_internship.level,
+        skill_weights=skill_weights
+    )
     
     applicants_with_scores = []
-    for app in applications:
+    for app, student_skills_list, match_details in zip(applications, students_skills, all_match_details):
         student = app.student  # Get the student user
         
-        # Get student skills from their profile and normalize to list/string
-        student_skills_list = _normalize_skills(student.student_profile.skills if getattr(student, 'student_profile', None) else None)
-        student_skills = ", ".join(student_skills_list) if student_skills_list else ""
-        
-        # Use the detailed match calculation
-        match_details = calculate_detailed_match(
-            user_skills=student_skills,
-            required_skills=db_internship.required_skills or db_internship.skills,
-            user_level=None,  # Can be added to user profile later
-            internship_level=db_internship.level
-        )
-        
         applicants_with_scores.append({
             "application_id": app.id,
             "applicant_id": student.id,
@@ -285,60 +341,143 @@ def get_applicants_with_match_score(
     
     # Sort by match percentage descending
     applicants_with_scores.sort(key=lambda x: x['match_percentage'], reverse=True)
+    if skill_weights is not None:
+        applicants_with_scores = applicants_with_scores[max(skip, 0):][:limit]
         
     return applicants_with_scores
 
+def _company_applications_page(
+    query,
+    current_company: Company,
+    skip: int,
+    limit: Optional[int],
+    cursor: Optional[str],
+    status: Optional[str],
+    internship_id: Optional[str],
+):
+    """Restrict an Application query to one page of the company's applications,
+    ranked in the database by persisted match score. Returns (query, page size)."""
+    query = query.join(
+        InternshipModel, InternshipModel.id == ApplicationModel.internship_id
+    ).filter(InternshipModel.employer_profile_id == current_company.id)
+    if status is not None:
+        try:
+            query = query.filter(ApplicationModel.status == ApplicationStatus.parse(status).value)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
+    if internship_id is not None:
+        query = query.filter(ApplicationModel.internship_id == internship_id)
+    
+    if cursor is not None:
+        if limit is None:
+            limit = DEFAULT_PAGE_SIZE
+        try:
+            last_score, last_id = decode_cursor(cursor, 2)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(after_desc_nulls_last(ApplicationModel.match_score, ApplicationModel.id, last_score, last_id))
+    if limit is not None and (limit < 1 or limit > MAX_PAGE_SIZE):
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    
+    query = query.order_by(
+        ApplicationModel.match_score.desc().nullslast(),
+        ApplicationModel.id.desc()
+    ).offset(skip if cursor is None else 0).limit(limit)
+    return query, limit
+
 @router.get("/company/all-applicants")
 def get_all_company_applicants(
+    response: Response,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    internship_id: Optional[str] = None,
     db: Session = Depends(deps.get_db),
     current_company: Company = Depends(deps.get_current_active_company),
+    skill_weights: Optional[SkillWeight] = Depends(deps.get_skill_weights),
 ):
-    """Get all applicants for all internships posted by the current company"""
-    # Get all internships for this company
-    company_internships = db.query(InternshipModel).filter(InternshipModel.employer_profile_id == current_company.id).all()
-    internship_ids = [internship.id for internship in company_internships]
+    """Get all applicants for all internships posted by the current company, ranked by match score
+
+    - **status** / **internship_id**: Only applications with this status / to this internship
+    - **cursor**: Keyset pagination on (match_score, id). When a page of
+      `limit` rows is full, the cursor for the next page is returned in the
+      `X-Next-Cursor` response header. `skip` is still accepted without a cursor.
+
+    Applicants, profiles, work experiences and projects are loaded in a fixed
+    number of queries, however many applications are returned.
+
+    Pages are cut by the persisted (standard) match score, so `scoring=idf`
+    is only accepted for the full, unpaginated list.
+    """
+    if skill_weights is not None and (skip or limit is not None or cursor is not None):
+        raise HTTPException(status_code=400, detail="scoring=idf cannot be combined with skip, limit or cursor")
+    query, limit = _company_applications_page(
+        db.query(ApplicationModel), current_company, skip, limit, cursor, status, internship_id
+    )
+    applications = query.options(
+        joinedload(ApplicationModel.student).joinedload(User.student_profile),
+        joinedload(ApplicationModel.student).selectinload(User.work_experiences),
+        joinedload(ApplicationModel.student).selectinload(User.projects),
+    ).all()
     
-    # Get all applications for these internships
-    applications = db.query(ApplicationModel).filter(ApplicationModel.internship_id.in_(internship_ids)).all()
+    if limit is not None and len(applications) == limit:
+        last = applications[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.match_score, last.id)
     
-    applicants_list = []
+    # One lookup for the internships on this page
+    page_internship_ids = {app.internship_id for app in applications}
+    internships_by_id = {
+        internship.id: internship
+        for internship in db.query(InternshipModel).filter(InternshipModel.id.in_(page_internship_ids)).all()
+    } if page_internship_ids else {}
+    
+    # Score applicants in one vectorized batch per internship
+    applications_by_internship = {}
     for app in applications:
-        student = app.student  # Get the student user
-        internship = db.query(InternshipModel).filter(InternshipModel.id == app.internship_id).first()
-        
-        if student and internship:
-            # Get student skills from their profile
+        applications_by_internship.setdefault(app.internship_id, []).append(app)
+    
+    match_details_by_application = {}
+    for batch_internship_id, batch in applications_by_internship.items():
+        batch_internship = internships_by_id[batch_internship_id]
+        students_skills = []
+        for app in batch:
             student_skills = ""
-            if student.student_profile and student.student_profile.skills:
+            student = app.student
+            if student and student.student_profile and student.student_profile.skills:
                 if isinstance(student.student_profile.skills, list):
                     student_skills = ", ".join(student.student_profile.skills)
                 else:
                     student_skills = str(student.student_profile.skills)
-            
-            # Calculate detailed match
-            match_details = calculate_detailed_match(
-                user_skills=student_skills,
-                required_skills=internship.required_skills or internship.skills,
-                user_level=None,  # Can be added to user profile later
-                internship_level=internship.level
-            )
+            students_skills.append(student_skills)
+        batch_details = cached_detailed_match_batch(
+            [app.student.student_profile if app.student else None for app in batch],
+            students_skills,
+            batch_internship,
+            required_skills=batch_internship.required_skills or batch_internship.skills,
+            internship_level=batch_internship.level,
+            skill_weights=skill_weights
+        )
+        for app, match_details in zip(batch, batch_details):
+            match_details_by_application[app.id] = match_details
+    
+    applicants_list = []
+    for app in applications:
+        student = app.student  # Get the student user
+        internship = internships_by_id.get(app.internship_id)
+        
+        if student and internship:
+            match_details = match_details_by_application[app.id]
             
             # Determine if contact details should be visible
-            # Only show contact details if status is 'Offer Accepted', 'Hired', or 'accepted'
-            can_view_contact = app.status.lower() in ['offer accepted', 'offer_accepted', 'accepted', 'hired']
+            # Only show contact details once the offer was accepted (or the student hired)
+            can_view_contact = app.status in CONTACT_VISIBLE_STATUSES
             
             # Get student profile data
-            student_profile = student.student_profile if getattr(student, 'student_profile', None) else None
-            
-            # Get work experiences and projects directly from database
-            from app.models.profile import WorkExperience, Project as ProjectModel
-            
-            work_experiences_query = db.query(WorkExperience).filter(
-                WorkExperience.user_id == student.id
-            ).all()
+            student_profile = student.student_profile
             
             work_experiences = []
-            for exp in work_experiences_query:
+            for exp in student.work_experiences:
                 work_experiences.append({
                     "id": exp.id,
                     "company": exp.company,
@@ -348,12 +487,8 @@ def get_all_company_applicants(
                     "description": exp.description,
                 })
             
-            projects_query = db.query(ProjectModel).filter(
-                ProjectModel.user_id == student.id
-            ).all()
-            
             projects = []
-            for proj in projects_query:
+            for proj in student.projects:
                 projects.append({
                     "id": proj.id,
                     "title": proj.title,
@@ -413,10 +548,169 @@ def get_all_company_applicants(
     
     return applicants_list
 
+@router.get("/company/applicants/summary")
+def get_company_applicant_summaries(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    internship_id: Optional[str] = None,
+    db: Session = Depends(deps.get_db),
+    current_company: Company = Depends(deps.get_current_active_company),
+):
+    """Compact applicant list for the company (name, match score, status, internship)
+
+    Same filters, ranking and pagination as `/company/all-applicants`, read in
+    a single query of the listed columns; fetch the full profile of one
+    applicant with `GET /applications/applicant/{application_id}`. Match
+    scores are the persisted ones. Responses carry an ETag; send it back in
+    `If-None-Match` to get 304 Not Modified while nothing listed has changed.
+    """
+    query, limit = _company_applications_page(
+        db.query(
+            ApplicationModel.id, ApplicationModel.student_id, ApplicationModel.status,
+            ApplicationModel.application_date, ApplicationModel.match_score, ApplicationModel.updated_at,
+            ApplicationModel.internship_id, InternshipModel.title.label("internship_title"),
+            User.full_name, User.email, User.updated_at.label("user_updated_at"),
+            StudentProfile.updated_at.label("profile_updated_at"),
+        ).join(User, User.id == ApplicationModel.student_id).outerjoin(
+            StudentProfile, StudentProfile.user_id == ApplicationModel.student_id
+        ),
+        current_company, skip, limit, cursor, status, internship_id
+    )
+    rows = query.all()
+    
+    if limit is not None and len(rows) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(rows[-1].match_score, rows[-1].id)
+    
+    etag = compute_etag(
+        current_company.id, skip, limit, cursor, status, internship_id,
+        [(row.id, row.updated_at, row.user_updated_at, row.profile_updated_at, row.internship_title) for row in rows]
+    )
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    
+    return [
+        {
+            "application_id": row.id,
+            "applicant_id": row.student_id,
+            "name": row.full_name or row.email.split('@')[0],
+            "match_percentage": row.match_score,
+            "match_score": f"{row.match_score:.0f}%" if row.match_score is not None else None,
+            "status": row.status,
+            "applied_date": row.application_date.isoformat() if row.application_date else None,
+            "internship_id": row.internship_id,
+            "internship_title": row.internship_title,
+        }
+        for row in rows
+    ]
+
+@router.patch("/bulk-status")
+def bulk_update_application_status(
+    update_in: ApplicationBulkStatusUpdate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(deps.get_db),
+    current_company: Company = Depends(deps.get_current_active_company),
+):
+    """Change the status of many applications at once (company only)
+
+    Targets the listed `application_ids` and/or every application to
+    `internship_id`, optionally only those currently in `current_status`
+    (e.g. reject all pending applicants of a closed posting). Every listed
+    application must belong to one of the company's internships, otherwise
+    nothing is changed. The change is a single UPDATE; offer emails are sent
+    in the background after it commits.
+    """
+    # parse() reads a blank value as pending; here that would silently move applications back to pending
+    if not update_in.status.strip():
+        raise HTTPException(status_code=400, detail="status must not be blank")
+    if update_in.current_status is not None and not update_in.current_status.strip():
+        raise HTTPException(status_code=400, detail="current_status must not be blank")
+    try:
+        new_status = ApplicationStatus.parse(update_in.status).value
+        current_status = ApplicationStatus.parse(update_in.current_status).value if update_in.current_status is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid status: {e}")
+    if not update_in.application_ids and update_in.internship_id is None:
+        raise HTTPException(status_code=400, detail="Provide application_ids or internship_id")
+    
+    if update_in.internship_id is not None:
+        owner = db.query(InternshipModel.employer_profile_id).filter(InternshipModel.id == update_in.internship_id).scalar()
+        if owner is None:
+            raise HTTPException(status_code=404, detail="Internship not found")
+        if owner != current_company.id:
+            raise HTTPException(status_code=403, detail="Not authorized to update these applications")
+    
+    applications = ApplicationModel.__table__
+    internships = InternshipModel.__table__
+    query = select(
+        applications.c.id, applications.c.internship_id, applications.c.student_id,
+        applications.c.application_date, applications.c.status, internships.c.employer_profile_id
+    ).join(internships, internships.c.id == applications.c.internship_id)
+    if update_in.application_ids:
+        query = query.where(applications.c.id.in_(set(update_in.application_ids)))
+    else:
+        query = query.where(applications.c.internship_id == update_in.internship_id)
+    # Lock the rows so concurrent changes cannot interleave with the rollup update (no-op on SQLite)
+    rows = db.execute(query.with_for_update(of=applications)).all()
+    
+    if update_in.application_ids:
+        missing = set(update_in.application_ids) - {row.id for row in rows}
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Application(s) not found: {', '.join(sorted(missing))}")
+        if any(row.employer_profile_id != current_company.id for row in rows):
+            raise HTTPException(status_code=403, detail="Not authorized to update these applications")
+    
+    targets = [
+        row for row in rows
+        if (update_in.internship_id is None or row.internship_id == update_in.internship_id)
+        and (current_status is None or row.status == current_status)
+    ]
+    changed = [row for row in targets if row.status != new_status]
+    changed_ids = [row.id for row in changed]
+    
+    if changed:
+        now = datetime.utcnow()
+        values = {"status": new_status, "updated_at": now}
+        # Track workflow timestamps
+        if new_status == ApplicationStatus.OFFERED.value:
+            values["offer_sent_date"] = func.coalesce(applications.c.offer_sent_date, now)
+        elif new_status == ApplicationStatus.ACCEPTED.value:
+            values["offer_response_date"] = func.coalesce(applications.c.offer_response_date, now)
+        elif new_status == ApplicationStatus.HIRED.value:
+            values["hired_date"] = func.coalesce(applications.c.hired_date, now)
+        try:
+            db.execute(update(applications).where(applications.c.id.in_(changed_ids)).values(**values))
+            record_status_changes(db.connection(), [
+                (row.internship_id, row.application_date, row.status, new_status) for row in changed
+            ])
+            record_status_events(db.connection(), [
+                (row.id, row.internship_id, row.student_id, row.status, new_status) for row in changed
+            ])
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise HTTPException(status_code=500, detail=f"Failed to update status: {str(e)}")
+        
+        if new_status == ApplicationStatus.OFFERED.value:
+            background_tasks.add_task(send_offer_notifications, changed_ids)
+    
+    return {
+        "status": new_status,
+        "matched": len(targets),
+        "updated": len(changed),
+        "application_ids": changed_ids,
+    }
+
 @router.patch("/{application_id}/status")
 def update_application_status(
     application_id: str,  # Changed to string for UUID
     status: str,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(deps.get_db),
     current_company: Company = Depends(deps.get_current_active_company),
 ):
@@ -434,35 +728,22 @@ def update_application_status(
     if not internship or internship.employer_profile_id != current_company.id:
         raise HTTPException(status_code=403, detail="Not authorized to update this application")
     
-    # Normalize incoming status to canonical lowercase forms
-    normalized = status.strip().lower().replace(' ', '_')
-    print(f"DEBUG: Normalized status: {normalized}")
-    
-    # Map variants to canonical statuses
-    canonical_map = {
-        'offered': 'offered',
-        'offer_sent': 'offered',
-        'under_review': 'reviewed',
-        'offer_accepted': 'accepted',
-        'accepted': 'accepted',
-        'declined': 'declined',
-        'rejected': 'rejected',
-        'hired': 'hired',
-        'pending': 'pending',
-        'reviewed': 'reviewed',
-    }
-    application.status = canonical_map.get(normalized, status)
+    # Map the incoming status (any casing or legacy spelling) to its canonical form
+    try:
+        application.status = ApplicationStatus.parse(status).value
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
     print(f"DEBUG: New application status after mapping: {application.status}")
 
     # Track workflow timestamps
-    if application.status == 'offered' and not application.offer_sent_date:
+    if application.status == ApplicationStatus.OFFERED.value and not application.offer_sent_date:
         application.offer_sent_date = datetime.utcnow()
         print(f"DEBUG: Set offer_sent_date to {application.offer_sent_date}")
 
-    if application.status == 'accepted' and not application.offer_response_date:
+    if application.status == ApplicationStatus.ACCEPTED.value and not application.offer_response_date:
         application.offer_response_date = datetime.utcnow()
 
-    if application.status == 'hired' and not application.hired_date:
+    if application.status == ApplicationStatus.HIRED.value and not application.hired_date:
         application.hired_date = datetime.utcnow()
     
     try:
@@ -474,43 +755,52 @@ def update_application_status(
         print(f"ERROR: Failed to commit status update: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to update status: {str(e)}")
 
-    # If the company just sent an offer, notify the student via email
-    try:
-        # Only notify when status is 'offered'
-        if application.status and application.status.lower() == 'offered':
-            student = application.student
-            # internship is already fetched above
-            employer_profile = internship.employer_profile if internship and hasattr(internship, 'employer_profile') else None
-            company_name = employer_profile.company_name if employer_profile and hasattr(employer_profile, 'company_name') else getattr(current_company, 'name', 'I-Intern')
-
-            if student and getattr(student, 'email', None):
-                from app.core.config import settings
-                frontend_url = getattr(settings, 'FRONTEND_URL', 'http://localhost:8081')
-                offer_link = f"{frontend_url}/student/offers"  # frontend route where student sees offers
-
-                subject = f"You have received an internship offer from {company_name}"
-                body = f"Hello {getattr(student, 'full_name', None) or student.email},\n\nCongratulations! You have received an offer for the internship '{internship.title if internship else 'an internship'}' from {company_name}.\n\nVisit your offers page to view and respond to the offer: {offer_link}\n\nBest regards,\nI-Intern Team"
-
-                html_body = f"<p>Hello {getattr(student, 'full_name', None) or student.email},</p>" \
-                            f"<p>Congratulations! You have received an offer for the internship '<strong>{internship.title if internship else 'an internship'}</strong>' from <strong>{company_name}</strong>.</p>" \
-                            f"<p><a href=\"{offer_link}\">Click here to view your offers and respond</a></p>" \
-                            f"<p>Best regards,<br/>I-Intern Team</p>"
-
-                sent = send_email(student.email, subject, body, html_body)
-                print(f"Email offer sent to {student.email}: {sent}")
-            else:
-                print("No student email available to send offer notification")
-    except Exception as e:
-        print(f"Failed to send offer notification email: {e}")
+    # If the company just sent an offer, notify the student via email (after the response)
+    if application.status == ApplicationStatus.OFFERED.value:
+        background_tasks.add_task(send_offer_notifications, [application.id])
     return application
 
+@router.get("/{application_id}/timeline")
+def get_application_timeline(
+    application_id: str,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+):
+    """Status history of an application, oldest first (its student or the posting company)"""
+    events = application_timeline(db, application_id)
+    if not events:
+        raise HTTPException(status_code=404, detail="Application not found")
+    
+    if current_user.id != events[0].student_id:
+        owner_user_id = db.query(EmployerProfile.user_id).join(
+            InternshipModel, InternshipModel.employer_profile_id == EmployerProfile.id
+        ).filter(InternshipModel.id == events[0].internship_id).scalar()
+        if owner_user_id != current_user.id:
+            raise HTTPException(status_code=403, detail="Not authorized to view this application")
+    
+    return [
+        {
+            "from_status": event.from_status,
+            "to_status": event.to_status,
+            "created_at": event.created_at.isoformat(),
+        }
+        for event in events
+    ]
+
 @router.get("/applicant/{application_id}")
 def get_applicant_details(
     application_id: str,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     current_company: Company = Depends(deps.get_current_active_company),
 ):
-    """Get detailed information about a specific applicant"""
+    """Get detailed information about a specific applicant
+
+    Responses carry an ETag built from the application, internship, user and
+    profile `updated_at` stamps; a matching `If-None-Match` gets 304 Not
+    Modified without loading work experiences or projects.
+    """
     print(f"DEBUG: Getting applicant details for application {application_id}")
     
     # Get the application
@@ -532,6 +822,16 @@ def get_applicant_details(
     
     # Get student profile and skills
     student_profile = student.student_profile if hasattr(student, 'student_profile') else None
+    
+    etag = compute_etag(
+        application.id, application.updated_at, internship.updated_at, student.updated_at,
+        student_profile.updated_at if student_profile else None
+    )
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    
     student_skills = ""
     if student_profile and student_profile.skills:
         if isinstance(student_profile.skills, list):
@@ -540,7 +840,9 @@ def get_applicant_details(
             student_skills = str(student_profile.skills)
     
     # Calculate detailed match
-    match_details = calculate_detailed_match(
+    match_details = cached_detailed_match(
+        student_profile,
+        internship,
         user_skills=student_skills,
         required_skills=internship.required_skills or internship.skills,
         user_level=None,
@@ -548,7 +850,7 @@ def get_applicant_details(
     )
     
     # Determine if contact details should be visible
-    can_view_contact = application.status.lower() in ['offer accepted', 'offer_accepted', 'accepted', 'hired']
+    can_view_contact = application.status in CONTACT_VISIBLE_STATUSES
     
     # Get work experiences directly from the database
     from app.models.profile import WorkExperience, Project as ProjectModel
@@ -647,14 +949,14 @@ def respond_to_offer(
         raise HTTPException(status_code=403, detail="Not authorized to respond to this offer")
     
     # Verify the application has an offer
-    if application.status.lower() not in ['offered', 'accepted', 'declined']:
+    if application.status not in [ApplicationStatus.OFFERED.value, ApplicationStatus.ACCEPTED.value, ApplicationStatus.DECLINED.value]:
         raise HTTPException(status_code=400, detail="This application does not have an active offer")
     
     # Update status based on response
     if response.lower() == "accepted":
-        application.status = "Accepted"
+        application.status = ApplicationStatus.ACCEPTED.value
     elif response.lower() == "declined":
-        application.status = "Declined"
+        application.status = ApplicationStatus.DECLINED.value
     else:
         raise HTTPException(status_code=400, detail="Invalid response. Must be 'accepted' or 'declined'")
     
@@ -680,7 +982,7 @@ def respond_to_offer(
         "salary": f"₹{internship.stipend:,}" if internship and internship.stipend else None,
         "stipend": internship.stipend if internship else None,
         "location": internship.location if internship else None,
-        "status": application.status.lower(),
+        "status": application.status,
         "application_date": application.application_date.isoformat() if application.application_date else None,
         "offer_sent_date": application.offer_sent_date.isoformat() if application.offer_sent_date else None,
         "offer_response_date": application.offer_response_date.isoformat() if application.offer_response_date else None,
@@ -1,16 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, selectinload
 from typing import List, Dict, Any, Optional
+import csv
 import uuid
 from datetime import date, datetime, timedelta, timezone
-from sqlalchemy import func, extract
+from sqlalchemy import case, func
 from app.api import deps
 from app.schemas.internship import Internship, InternshipCreate, InternshipUpdate, InternshipPartialUpdate
-from app.models.internship import Internship as InternshipModel
+from app.models.internship import Internship as InternshipModel, InternshipStatus
 from app.models.company import Company
-from app.models.application import Application as ApplicationModel
+from app.models.application import Application as ApplicationModel, ApplicationStatus, CONTACT_VISIBLE_STATUSES, HIRED_STATUSES
+from app.models.application_event import ApplicationEvent
+from app.models.application_stats import DailyApplicationStat
 from app.models.user import User
-from app.utils.matching import calculate_skills_match, calculate_detailed_match
+from app.models.profile import StudentProfile
+from app.models.skill import Skill, StudentSkill
+from app.utils.matching import SkillWeight, calculate_skills_match, calculate_detailed_match, match_engine
+from app.utils import internship_index, internship_search
+from app.utils.application_stats import FUNNEL_STAGES, company_daily_counts, company_status_counts
+from app.utils.application_events import company_daily_activity, company_stage_conversion, company_time_to_hire
+from app.utils.archive_internships import archive_expired_internships as archive_expired
+from app.utils.internship_catalog import CatalogEntry, internship_catalog
+from app.utils.internship_facets import compute_facets
+from app.utils.internship_import import MAX_IMPORT_ROWS, import_internships, parse_csv
+from app.utils.match_scores import MATCH_FIELDS, recompute_internship_match_scores
+from app.utils.match_cache import match_cache, match_cache_key, cached_detailed_match
+from app.utils.match_scores import student_skills_string
+from app.utils.skills import internship_skill_names
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, encode_cursor, decode_cursor
 
 router = APIRouter()
 
@@ -22,94 +40,45 @@ def get_company_dashboard_stats(
     """Get dashboard statistics for the logged-in company"""
     
     try:
-        # Get all internships for this company
-        company_internships = db.query(InternshipModel).filter(
-            InternshipModel.employer_profile_id == current_company.id
-        ).all()
-        
-        # Calculate total internships
-        total_internships = len(company_internships)
-        
-        # Calculate active internships (status = 'Active' or 'active')
-        active_internships = len([i for i in company_internships if str(i.status).lower() == 'active'])
-        
-        # Get all applications for this company's internships
-        internship_ids = [internship.id for internship in company_internships]
-        all_applications = db.query(ApplicationModel).filter(
-            ApplicationModel.internship_id.in_(internship_ids)
-        ).all() if internship_ids else []
-        
-        # Calculate total applicants
-        total_applicants = len(all_applications)
-        
-        # Calculate total hires (applications with status 'Hired' or 'Accepted')
-        total_hires = len([
-            app for app in all_applications 
-            if app.status and app.status.lower() in ['hired', 'accepted', 'offer accepted', 'offer_accepted']
-        ])
-        
-        # Calculate pending reviews
-        pending_reviews = len([
-            app for app in all_applications 
-            if app.status and app.status.lower() in ['pending', 'under review']
-        ])
-        
-        # Calculate time-based statistics
         now = datetime.now(timezone.utc)
         one_week_ago = now - timedelta(days=7)
         one_month_ago = now - timedelta(days=30)
+        two_months_ago = now - timedelta(days=60)
+        two_weeks_later = now + timedelta(days=14)
+        # date_posted is a DATE: the first whole day at or after one_week_ago
+        first_day_this_week = (one_week_ago - timedelta(microseconds=1)).date() + timedelta(days=1)
         
-        # Helper function to safely parse dates
-        def parse_date_safely(date_value):
-            """Safely parse date from various formats"""
-            if date_value is None:
-                return None
-            try:
-                # If it's already a datetime object
-                if isinstance(date_value, datetime):
-                    return date_value.replace(tzinfo=timezone.utc) if date_value.tzinfo is None else date_value
-                # If it's a date object (not datetime)
-                if isinstance(date_value, date):
-                    return datetime.combine(date_value, datetime.min.time()).replace(tzinfo=timezone.utc)
-                # If it's a string, try parsing
-                if isinstance(date_value, str):
-                    # Try ISO format first
-                    try:
-                        parsed = datetime.fromisoformat(date_value.replace('Z', '+00:00'))
-                        return parsed.replace(tzinfo=timezone.utc) if parsed.tzinfo is None else parsed
-                    except:
-                        # Try parsing as date only
-                        try:
-                            parsed_date = date.fromisoformat(date_value)
-                            return datetime.combine(parsed_date, datetime.min.time()).replace(tzinfo=timezone.utc)
-                        except:
-                            pass
-                return None
-            except Exception as e:
-                print(f"Error parsing date {date_value}: {e}")
-                return None
-        
-        # New internships this week
-        new_internships_week = 0
-        for i in company_internships:
-            posted_date = parse_date_safely(i.date_posted)
-            if posted_date and posted_date >= one_week_ago:
-                new_internships_week += 1
+        def count_if(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
         
-        # New applicants this month
-        new_applicants_month = 0
-        for app in all_applications:
-            app_date = parse_date_safely(app.application_date)
-            if app_date and app_date >= one_month_ago:
-                new_applicants_month += 1
+        # One aggregate over the company's internships ...
+        is_active = InternshipModel.status == InternshipStatus.ACTIVE.value
+        (total_internships, active_internships, new_internships_week, ending_soon) = db.query(
+            func.count(InternshipModel.id),
+            count_if(is_active),
+            count_if(InternshipModel.date_posted >= first_day_this_week),
+            count_if(is_active & (InternshipModel.deadline <= two_weeks_later.date())),
+        ).filter(
+            InternshipModel.employer_profile_id == current_company.id
+        ).one()
         
-        # Previous month applicants for percentage calculation
-        two_months_ago = now - timedelta(days=60)
-        prev_month_applicants = 0
-        for app in all_applications:
-            app_date = parse_date_safely(app.application_date)
-            if app_date and two_months_ago <= app_date < one_month_ago:
-                prev_month_applicants += 1
+        # ... and one over their applications
+        is_hire = ApplicationModel.status.in_(HIRED_STATUSES)
+        this_month = ApplicationModel.application_date >= one_month_ago
+        (total_applicants, total_hires, pending_reviews,
+         new_applicants_month, prev_month_applicants, new_hires_month) = db.query(
+            func.count(ApplicationModel.id),
+            count_if(is_hire),
+            count_if(ApplicationModel.status == ApplicationStatus.PENDING.value),
+            count_if(this_month),
+            count_if((ApplicationModel.application_date >= two_months_ago)
+                     & (ApplicationModel.application_date < one_month_ago)),
+            count_if(is_hire & this_month),
+        ).join(
+            InternshipModel, InternshipModel.id == ApplicationModel.internship_id
+        ).filter(
+            InternshipModel.employer_profile_id == current_company.id
+        ).one()
         
         # Calculate applicants percentage change
         applicants_change = 0
@@ -118,23 +87,6 @@ def get_company_dashboard_stats(
         elif new_applicants_month > 0:
             applicants_change = 100  # 100% increase if we had 0 before
         
-        # New hires this month
-        new_hires_month = 0
-        for app in all_applications:
-            if app.status and app.status.lower() in ['hired', 'accepted', 'offer accepted', 'offer_accepted']:
-                app_date = parse_date_safely(app.application_date)
-                if app_date and app_date >= one_month_ago:
-                    new_hires_month += 1
-        
-        # Ending soon (within 2 weeks)
-        two_weeks_later = now + timedelta(days=14)
-        ending_soon = 0
-        for i in company_internships:
-            if str(i.status).lower() == 'active' and i.deadline is not None:
-                deadline_date = parse_date_safely(i.deadline)
-                if deadline_date and deadline_date <= two_weeks_later:
-                    ending_soon += 1
-        
         return {
             "total_internships": total_internships,
             "active_internships": active_internships,
@@ -166,43 +118,35 @@ def get_monthly_applications(
     db: Session = Depends(deps.get_db),
     current_company: Company = Depends(deps.get_current_active_company),
 ):
-    """Get monthly applications trend for the last 6 months"""
+    """Get monthly applications trend for the last 6 months (from the daily rollup)"""
     
-    # Get all internships for this company
-    company_internships = db.query(InternshipModel).filter(
+    has_internships = db.query(InternshipModel.id).filter(
         InternshipModel.employer_profile_id == current_company.id
-    ).all()
-    
-    internship_ids = [internship.id for internship in company_internships]
-    
-    if not internship_ids:
+    ).first()
+    if not has_internships:
         return {"months": [], "data": []}
     
-    # Get applications for the last 6 months
-    six_months_ago = datetime.now(timezone.utc) - timedelta(days=180)
+    six_months_ago = (datetime.now(timezone.utc) - timedelta(days=180)).date()
     
-    applications = db.query(
-        extract('month', ApplicationModel.application_date).label('month'),
-        extract('year', ApplicationModel.application_date).label('year'),
-        func.count(ApplicationModel.id).label('total'),
-        func.sum(func.case((ApplicationModel.status.in_(['Hired', 'hired', 'Accepted', 'accepted']), 1), else_=0)).label('hired'),
-        func.sum(func.case((ApplicationModel.status.in_(['Rejected', 'rejected']), 1), else_=0)).label('rejected')
-    ).filter(
-        ApplicationModel.internship_id.in_(internship_ids),
-        ApplicationModel.application_date >= six_months_ago
-    ).group_by('month', 'year').order_by('year', 'month').all()
+    monthly: Dict[tuple, Dict[str, int]] = {}
+    for day, status, count in company_daily_counts(db, current_company.id, since=six_months_ago):
+        totals = monthly.setdefault((day.year, day.month), {"total": 0, "hired": 0, "rejected": 0})
+        totals["total"] += count
+        if status in HIRED_STATUSES:
+            totals["hired"] += count
+        elif status == 'rejected':
+            totals["rejected"] += count
     
     # Format the data
     month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
     
     result = []
-    for app in applications:
-        month_name = month_names[int(app.month) - 1]
+    for (year, month), totals in sorted(monthly.items()):
         result.append({
-            "month": month_name,
-            "total_applications": int(app.total) if app.total else 0,
-            "hired": int(app.hired) if app.hired else 0,
-            "rejected": int(app.rejected) if app.rejected else 0
+            "month": month_names[month - 1],
+            "total_applications": totals["total"],
+            "hired": totals["hired"],
+            "rejected": totals["rejected"]
         })
     
     return result
@@ -212,43 +156,47 @@ def get_hiring_funnel(
     db: Session = Depends(deps.get_db),
     current_company: Company = Depends(deps.get_current_active_company),
 ):
-    """Get hiring funnel data showing application flow through stages"""
-    
-    # Get all internships for this company
-    company_internships = db.query(InternshipModel).filter(
-        InternshipModel.employer_profile_id == current_company.id
-    ).all()
-    
-    internship_ids = [internship.id for internship in company_internships]
-    
-    if not internship_ids:
-        return {
-            "applied": 0,
-            "screened": 0,
-            "interviewed": 0,
-            "offered": 0,
-            "hired": 0
-        }
+    """Get hiring funnel data showing application flow through stages (from the daily rollup)"""
     
-    # Get all applications
-    all_applications = db.query(ApplicationModel).filter(
-        ApplicationModel.internship_id.in_(internship_ids)
-    ).all()
-    
-    # Count applications by stage
-    applied = len(all_applications)
-    screened = len([app for app in all_applications if app.status.lower() in ['reviewed', 'under review', 'shortlisted', 'offered', 'accepted', 'hired']])
-    interviewed = len([app for app in all_applications if app.status.lower() in ['shortlisted', 'offered', 'accepted', 'hired']])
-    offered = len([app for app in all_applications if app.status.lower() in ['offered', 'accepted', 'hired']])
-    hired = len([app for app in all_applications if app.status.lower() in ['accepted', 'hired']])
+    counts = company_status_counts(db, current_company.id)
     
-    return {
-        "applied": applied,
-        "screened": screened,
-        "interviewed": interviewed,
-        "offered": offered,
-        "hired": hired
-    }
+    funnel = {"applied": sum(counts.values())}
+    for stage, statuses in FUNNEL_STAGES.items():
+        funnel[stage] = sum(counts.get(status, 0) for status in statuses)
+    return funnel
+
+@router.get("/company/analytics/time-to-hire")
+def get_time_to_hire(
+    days: int = 365,
+    db: Session = Depends(deps.get_db),
+    current_company: Company = Depends(deps.get_current_active_company),
+):
+    """Average and median days from application to hire, for hires in the last `days` days (from the event log)"""
+    since = (datetime.now(timezone.utc) - timedelta(days=days)).date()
+    return company_time_to_hire(db, current_company.id, since)
+
+@router.get("/company/analytics/stage-conversion")
+def get_stage_conversion(
+    days: int = 90,
+    db: Session = Depends(deps.get_db),
+    current_company: Company = Depends(deps.get_current_active_company),
+):
+    """Funnel stages reached by the applications of the last `days` days, with stage-to-stage conversion (from the event log)"""
+    since = (datetime.now(timezone.utc) - timedelta(days=days)).date()
+    return company_stage_conversion(db, current_company.id, since)
+
+@router.get("/company/analytics/daily-activity")
+def get_daily_activity(
+    days: int = 30,
+    db: Session = Depends(deps.get_db),
+    current_company: Company = Depends(deps.get_current_active_company),
+):
+    """Status changes per day and status over the last `days` days (from the event log)"""
+    since = (datetime.now(timezone.utc) - timedelta(days=days)).date()
+    activity: Dict[str, Dict[str, int]] = {}
+    for day, status, count in company_daily_activity(db, current_company.id, since):
+        activity.setdefault(str(day), {})[status] = count
+    return [{"date": day, "counts": counts} for day, counts in activity.items()]
 
 @router.post("/", response_model=Internship)
 def create_internship(
@@ -276,73 +224,188 @@ def create_internship(
     db.refresh(db_internship)
     return db_internship
 
+@router.post("/bulk")
+async def bulk_import_internships(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(deps.get_db),
+    current_company: Company = Depends(deps.get_current_active_company),
+):
+    """
+    Create or update many internships at once.
+
+    Accepts a JSON array of internship objects, a text/csv body, or a
+    multipart upload with a CSV `file`. Rows with the `id` of one of the
+    company's postings update it; other rows create postings. Invalid rows
+    are reported per row and the valid ones are written in one transaction.
+    """
+    content_type = request.headers.get("content-type", "")
+    try:
+        if content_type.startswith("multipart/form-data"):
+            form = await request.form()
+            upload = form.get("file")
+            if upload is None or isinstance(upload, str):
+                raise HTTPException(status_code=400, detail="Upload a CSV file in the 'file' field")
+            rows = parse_csv(await upload.read())
+        elif content_type.startswith("text/csv"):
+            rows = parse_csv(await request.body())
+        else:
+            rows = await request.json()
+    except (ValueError, UnicodeDecodeError, csv.Error):
+        raise HTTPException(status_code=400, detail="Could not parse the request body")
+
+    if not isinstance(rows, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array of internships")
+    if len(rows) > MAX_IMPORT_ROWS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_IMPORT_ROWS} internships per import")
+
+    result = await run_in_threadpool(import_internships, db, current_company.id, rows)
+    for internship_id in result.pop("updated_ids"):
+        background_tasks.add_task(recompute_internship_match_scores, internship_id)
+    result.pop("created_ids")
+    return result
+
+class _ListingFilters:
+    """Optional query parameters shared by the public listing and its facets"""
+
+    def __init__(
+        self,
+        location: Optional[str] = None,
+        type: Optional[str] = None,
+        level: Optional[str] = None,
+        category: Optional[str] = None,
+        min_stipend: Optional[int] = None,
+        max_stipend: Optional[int] = None,
+        deadline_from: Optional[date] = None,
+        deadline_to: Optional[date] = None,
+    ):
+        self.location = location
+        self.type = type
+        self.level = level
+        self.category = category
+        self.min_stipend = min_stipend
+        self.max_stipend = max_stipend
+        self.deadline_from = deadline_from
+        self.deadline_to = deadline_to
+
+    def cache_key(self) -> tuple:
+        return (self.location, self.type, self.level, self.category,
+                self.min_stipend, self.max_stipend, self.deadline_from, self.deadline_to)
+
+    def matches(self, internship, exclude: Optional[str] = None) -> bool:
+        """Whether an internship passes the filters, optionally ignoring one facet's own filter"""
+        if self.location and exclude != "location" and internship.location != self.location:
+            return False
+        if self.type and exclude != "type" and internship.type != self.type:
+            return False
+        if self.level and exclude != "level" and internship.level != self.level:
+            return False
+        if self.category and exclude != "category" and internship.category != self.category:
+            return False
+        if exclude != "stipend" and (self.min_stipend is not None or self.max_stipend is not None):
+            if internship.stipend is None:
+                return False
+            if self.min_stipend is not None and internship.stipend < self.min_stipend:
+                return False
+            if self.max_stipend is not None and internship.stipend > self.max_stipend:
+                return False
+        if self.deadline_from is not None or self.deadline_to is not None:
+            if internship.deadline is None:
+                return False
+            if self.deadline_from is not None and internship.deadline < self.deadline_from:
+                return False
+            if self.deadline_to is not None and internship.deadline > self.deadline_to:
+                return False
+        return True
+
 @router.get("/", response_model=List[Internship])
-def read_internships(db: Session = Depends(deps.get_db)):
-    """Get all visible internships (publicly accessible for interns)
+def read_internships(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    filters: _ListingFilters = Depends(),
+    db: Session = Depends(deps.get_db),
+):
+    """Get visible internships (publicly accessible for interns), newest first
 
     This endpoint will return internships that are not explicitly archived/closed/draft
     and are not suspended by admin. It will also respect the deadline (include
     those with no deadline or whose deadline hasn't passed).
-    """
-    # Exclude internships with statuses that should not be publicly visible
-    excluded_statuses = ['archived', 'closed', 'draft']
 
-    internships = db.query(InternshipModel).filter(
-        # Exclude suspended postings
-        InternshipModel.is_suspended != True,
-        # Exclude explicit negative statuses (case-insensitive). This keeps
-        # internships with NULL/empty/unknown status (e.g. transferred) visible.
-        func.lower(func.coalesce(InternshipModel.status, '')).notin_(excluded_statuses),
-        # Include internships with no deadline or deadline not passed
-        func.coalesce(InternshipModel.deadline, date.today() + timedelta(days=365)) >= date.today()
-    ).all()
+    - **limit** / **cursor**: Keyset pagination on (date_posted, id). When a
+      page is full, the cursor for the next page is returned in the
+      `X-Next-Cursor` response header. Without either, every match is returned.
+    - **location**, **type**, **level**, **category**: Exact match
+    - **min_stipend** / **max_stipend**: Stipend range (inclusive)
+    - **deadline_from** / **deadline_to**: Deadline window (inclusive)
+    """
+    paginate = cursor is not None or limit is not None
+    if paginate:
+        if limit is None:
+            limit = DEFAULT_PAGE_SIZE
+        if limit < 1 or limit > MAX_PAGE_SIZE:
+            raise HTTPException(status_code=400, detail=f"limit must be between 1 and {MAX_PAGE_SIZE}")
     
-    # Add company_name and applicant_count to each internship
-    for internship in internships:
-        if internship.employer_profile:
-            internship.company_name = internship.employer_profile.company_name
-            internship.company_logo = internship.employer_profile.logo_url
-        internship.applicant_count = len(internship.applications)
+    after_key = None
+    if cursor is not None:
+        try:
+            last_posted, last_id = decode_cursor(cursor, 2)
+            last_posted = date.fromisoformat(last_posted) if last_posted is not None else None
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        after_key = (last_posted is not None, last_posted or date.min, last_id)
+    
+    # Served from the in-process catalog snapshot (see app/utils/internship_catalog.py)
+    internship_catalog.ensure_fresh(db)
+    if paginate:
+        internships = internship_catalog.page(filters.matches, after_key, limit)
+    else:
+        internships = internship_catalog.visible(filters.matches)
+    
+    if paginate and len(internships) == limit:
+        last = internships[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.date_posted, last.id)
     return internships
 
-@router.get("/with-match", response_model=List[Dict[str, Any]])
-def read_internships_with_match(
+@router.get("/facets")
+def read_internship_facets(
+    filters: _ListingFilters = Depends(),
     db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_active_intern),
 ):
-    """Get all internships with match percentages for the current student"""
-    # Mirror the public visibility rules used by `read_internships` so that
-    # recommendations only include postings that should be visible to interns.
-    excluded_statuses = ['archived', 'closed', 'draft']
-    internships = db.query(InternshipModel).filter(
-        InternshipModel.is_suspended != True,
-        func.lower(func.coalesce(InternshipModel.status, '')).notin_(excluded_statuses),
-        func.coalesce(InternshipModel.deadline, date.today() + timedelta(days=365)) >= date.today()
-    ).all()
+    """Counts per category, type, level, location and stipend bucket (publicly accessible)
+
+    Accepts the same filters as `GET /internships/`. Each facet is counted
+    with every filter applied except its own, so a client can show how many
+    postings each alternative value would return.
+    """
+    internship_catalog.ensure_fresh(db)
+    return compute_facets(filters, cache_key=filters.cache_key())
+
+@router.get("/search")
+def search_internships(
+    q: str,
+    skip: int = 0,
+    limit: int = DEFAULT_PAGE_SIZE,
+    db: Session = Depends(deps.get_db),
+):
+    """Full-text search over visible internships (publicly accessible)
+
+    Searches title, description, skills, category, location and company name.
+    Results are ranked best first; `snippet` is HTML-escaped text with the
+    matched terms in <mark> tags.
+    """
+    if not internship_search.search_available:
+        raise HTTPException(status_code=503, detail="Search is not available")
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {MAX_PAGE_SIZE}")
     
-    # Get user skills from student profile
-    user_skills = ""
-    if current_user.student_profile and current_user.student_profile.skills:
-        if isinstance(current_user.student_profile.skills, list):
-            user_skills = ", ".join(current_user.student_profile.skills)
-        else:
-            user_skills = str(current_user.student_profile.skills)
+    total, rows = internship_search.search_internships(db, q, skip=max(skip, 0), limit=limit)
     
-    internships_with_match = []
-    for internship in internships:
-        # Calculate match percentage
-        match_details = calculate_detailed_match(
-            user_skills=user_skills,
-            required_skills=str(internship.required_skills or internship.skills or ""),
-            user_level="",  # Can be added to user profile later
-            internship_level=str(internship.level or "")
-        )
-        
-        internship_data = {
+    results = []
+    for internship, score, snippet in rows:
+        results.append({
             "id": internship.id,
             "title": internship.title,
-            "description": internship.description,
-            "company_id": str(internship.employer_profile_id),
             "company_name": internship.employer_profile.company_name if internship.employer_profile else None,
             "company_logo": internship.employer_profile.logo_url if internship.employer_profile else None,
             "location": internship.location,
@@ -352,21 +415,134 @@ def read_internships_with_match(
             "level": internship.level,
             "category": internship.category,
             "skills": internship.skills,
-            "requirements": internship.requirements,
-            "benefits": internship.benefits,
-            "required_skills": internship.required_skills,
             "deadline": internship.deadline,
             "date_posted": internship.date_posted,
-            "status": internship.status,
-            "applicant_count": len(internship.applications),
-            "match_percentage": match_details['match_percentage'],
-            "match_score": f"{match_details['match_percentage']:.0f}%",
-            "skill_match": match_details['skill_match_percentage'],
-            "matching_skills": match_details['matching_skills'],
-            "missing_skills": match_details['missing_skills'],
-        }
-        
-        internships_with_match.append(internship_data)
+            "applicant_count": internship.applicant_count,
+            "score": round(float(score), 4),
+            "snippet": snippet,
+        })
+    
+    return {
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "results": results
+    }
+
+def _internship_with_match(internship: CatalogEntry, match_details: dict) -> Dict[str, Any]:
+    """Serialize a catalog entry together with the student's match details"""
+    return {
+        "id": internship.id,
+        "title": internship.title,
+        "description": internship.description,
+        "company_id": str(internship.employer_profile_id),
+        "company_name": internship.company_name,
+        "company_logo": internship.company_logo,
+        "location": internship.location,
+        "stipend": internship.stipend,
+        "duration": internship.duration,
+        "type": internship.type,
+        "level": internship.level,
+        "category": internship.category,
+        "skills": internship.skills,
+        "requirements": internship.requirements,
+        "benefits": internship.benefits,
+        "required_skills": internship.required_skills,
+        "deadline": internship.deadline,
+        "date_posted": internship.date_posted,
+        "status": internship.status,
+        "applicant_count": internship.applicant_count,
+        "match_percentage": match_details['match_percentage'],
+        "match_score": f"{match_details['match_percentage']:.0f}%",
+        "skill_match": match_details['skill_match_percentage'],
+        "matching_skills": match_details['matching_skills'],
+        "missing_skills": match_details['missing_skills'],
+    }
+
+
+@router.get("/with-match", response_model=List[Dict[str, Any]])
+def read_internships_with_match(
+    limit: Optional[int] = None,
+    min_score: Optional[float] = None,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_intern),
+    skill_weights: Optional[SkillWeight] = Depends(deps.get_skill_weights),
+):
+    """Get all internships with match percentages for the current student
+
+    - **limit**: Return only the best `limit` matches
+    - **min_score**: Return only matches scoring at least `min_score`
+    - **scoring**: "standard" (every skill counts the same) or "idf" (rare skills count more)
+
+    When either option is given, only internships sharing at least one skill
+    with the student are considered (served from the in-process skill index).
+    """
+    # Get user skills from student profile
+    user_skills = ""
+    if current_user.student_profile and current_user.student_profile.skills:
+        if isinstance(current_user.student_profile.skills, list):
+            user_skills = ", ".join(current_user.student_profile.skills)
+        else:
+            user_skills = str(current_user.student_profile.skills)
+    
+    if limit is not None or min_score is not None:
+        if limit is not None and limit < 1:
+            raise HTTPException(status_code=400, detail="limit must be at least 1")
+        ranked = internship_index.recommend(
+            db, user_skills, limit=limit, min_score=min_score or 0.0, user_level="",
+            skill_weights=skill_weights
+        )
+        if not ranked:
+            return []
+        # recommend() already refreshed the catalog the winners are read from
+        results = []
+        for internship_id, match_details in ranked:
+            entry = internship_catalog.get(internship_id)
+            if entry is not None:
+                results.append(_internship_with_match(entry, match_details))
+        return results
+    
+    # Same visibility rules as `read_internships`, served from the catalog snapshot
+    internship_catalog.ensure_fresh(db)
+    internships = internship_catalog.visible()
+    
+    # Reuse scores cached for unchanged (profile, posting) versions.
+    # IDF scores depend on the whole catalog, so they are never cached.
+    student_profile = current_user.student_profile
+    matches = {}
+    uncached = []
+    for internship in internships:
+        cache_key = match_cache_key(student_profile, internship) if skill_weights is None else None
+        cached = match_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            matches[internship.id] = cached
+        else:
+            uncached.append(internship)
+    
+    # Score the student against the remaining postings in one pass
+    # (the catalog keeps their skill bitsets indexed in match_engine)
+    computed = match_engine.match_all(
+        user_skills,
+        [internship.id for internship in uncached],
+        user_level="",  # Can be added to user profile later
+        skill_weights=skill_weights
+    )
+    for internship in uncached:
+        match_details = computed.get(internship.id) or calculate_detailed_match(
+            user_skills=user_skills,
+            required_skills=str(internship.required_skills or internship.skills or ""),
+            user_level="",
+            internship_level=str(internship.level or ""),
+            skill_weights=skill_weights
+        )
+        matches[internship.id] = match_details
+        cache_key = match_cache_key(student_profile, internship) if skill_weights is None else None
+        if cache_key is not None:
+            match_cache.set(cache_key, match_details)
+    
+    internships_with_match = []
+    for internship in internships:
+        internships_with_match.append(_internship_with_match(internship, matches[internship.id]))
     
     # Sort by match percentage descending
     internships_with_match.sort(key=lambda x: x['match_percentage'], reverse=True)
@@ -386,7 +562,6 @@ def read_company_internships(
         if internship.employer_profile:
             internship.company_name = internship.employer_profile.company_name
             internship.company_logo = internship.employer_profile.logo_url
-        internship.applicant_count = len(internship.applications)
     return internships
 
 @router.get("/company/{internship_id}", response_model=Internship)
@@ -405,7 +580,6 @@ def read_company_internship(
     if internship.employer_profile:
         internship.company_name = internship.employer_profile.company_name
         internship.company_logo = internship.employer_profile.logo_url
-    internship.applicant_count = len(internship.applications)
     return internship
 
 @router.get("/{internship_id}", response_model=Internship)
@@ -421,16 +595,138 @@ def read_internship(
     - **Role**: Intern/Student
     - **Returns**: Full internship details including company info and applicant count
     """
+    internship_catalog.ensure_fresh(db)
+    entry = internship_catalog.get(internship_id, include_expired=True)
+    if entry is not None:
+        return entry
+    # Hidden postings (suspended, closed, draft) are not in the catalog
     internship = db.query(InternshipModel).filter(InternshipModel.id == internship_id).first()
     if not internship:
         raise HTTPException(status_code=404, detail="Internship not found")
-    # Add company_name and applicant_count
+    # Add company_name
     if internship.employer_profile:
         internship.company_name = internship.employer_profile.company_name
         internship.company_logo = internship.employer_profile.logo_url
-    internship.applicant_count = len(internship.applications)
     return internship
 
+@router.get("/{internship_id}/suggested-candidates")
+def get_suggested_candidates(
+    internship_id: str,
+    skip: int = 0,
+    limit: int = 20,
+    min_score: float = 0.0,
+    db: Session = Depends(deps.get_db),
+    current_company: Company = Depends(deps.get_current_active_company),
+):
+    """
+    Rank students (including those who have not applied) by how well they match an internship
+
+    - **Role**: Company (must own the internship)
+    - Candidates come from the student_skills index, so only students sharing at
+      least one required skill are considered
+    - Contact details stay hidden unless the student has an accepted offer for this internship
+    """
+    internship = db.query(InternshipModel).filter(InternshipModel.id == internship_id).first()
+    if not internship or str(internship.employer_profile_id) != str(current_company.id):
+        raise HTTPException(status_code=404, detail="Internship not found")
+    
+    required = internship_skill_names(internship)
+    if not required:
+        return {"total": 0, "candidates": []}
+    
+    # Without a student level the score only depends on how many required skills
+    # overlap, so min_score translates into a minimum overlap pushed down to SQL
+    total_required = len(required)
+    min_overlap = next(
+        (
+            overlap for overlap in range(1, total_required + 1)
+            if round(((overlap / total_required) * 100 * 0.7) + (100.0 * 0.3), 2) >= min_score
+        ),
+        None
+    )
+    if min_overlap is None:
+        return {"total": 0, "candidates": []}
+    
+    overlap_count = func.count(StudentSkill.skill_id).label('overlap')
+    ranked_query = db.query(
+        StudentProfile.user_id,
+        overlap_count
+    ).join(
+        StudentSkill, StudentSkill.student_profile_id == StudentProfile.id
+    ).join(
+        Skill, StudentSkill.skill_id == Skill.id
+    ).join(
+        User, User.id == StudentProfile.user_id
+    ).filter(
+        Skill.name.in_(required),
+        User.is_suspended != True
+    ).group_by(
+        StudentProfile.user_id
+    ).having(
+        overlap_count >= min_overlap
+    )
+    
+    total = ranked_query.count()
+    page = ranked_query.order_by(overlap_count.desc(), StudentProfile.user_id).offset(skip).limit(limit).all()
+    user_ids = [row.user_id for row in page]
+    if not user_ids:
+        return {"total": total, "candidates": []}
+    
+    students = {
+        student.id: student
+        for student in db.query(User).options(
+            selectinload(User.student_profile)
+        ).filter(User.id.in_(user_ids)).all()
+    }
+    application_status = {
+        row.student_id: row.status
+        for row in db.query(ApplicationModel.student_id, ApplicationModel.status).filter(
+            ApplicationModel.internship_id == internship_id,
+            ApplicationModel.student_id.in_(user_ids)
+        ).all()
+    }
+    
+    candidates = []
+    for user_id in user_ids:
+        student = students.get(user_id)
+        if not student:
+            continue
+        student_profile = student.student_profile
+        match_details = cached_detailed_match(
+            student_profile,
+            internship,
+            user_skills=student_skills_string(student_profile),
+            required_skills=internship.required_skills or internship.skills,
+            user_level=None,
+            internship_level=internship.level
+        )
+        status = application_status.get(user_id)
+        can_view_contact = status in CONTACT_VISIBLE_STATUSES
+        
+        candidates.append({
+            "applicant_id": student.id,
+            "name": student.full_name or student.email.split('@')[0],
+            "email": student.email if can_view_contact else None,  # Hide email until offer accepted
+            "phone": student.phone if can_view_contact else None,  # Hide phone until offer accepted
+            "university": student_profile.university if student_profile else None,
+            "major": student_profile.major if student_profile else None,
+            "graduation_year": student_profile.graduation_year if student_profile else None,
+            "skills": student_profile.skills if student_profile and student_profile.skills else [],
+            "match_percentage": match_details['match_percentage'],
+            "match_score": f"{match_details['match_percentage']:.0f}%",
+            "skill_match": match_details['skill_match_percentage'],
+            "matching_skills": match_details['matching_skills'],
+            "missing_skills": match_details['missing_skills'],
+            "has_applied": status is not None,
+            "application_status": status,
+            "can_view_contact_details": can_view_contact,
+        })
+    
+    return {
+        "total": total,
+        "candidates": candidates
+    }
+
 @router.get("/public/{internship_id}", response_model=Internship)
 def read_public_internship(
     internship_id: str,
@@ -450,14 +746,13 @@ def read_public_internship(
     # Do not show if suspended or explicitly archived/closed/draft
     if internship.is_suspended:
         raise HTTPException(status_code=404, detail="Internship not available")
-    if str(internship.status or '').lower() in ['archived', 'closed', 'draft']:
+    if internship.status != InternshipStatus.ACTIVE.value:
         raise HTTPException(status_code=404, detail="Internship not available")
     
-    # Add company_name and applicant_count
+    # Add company_name
     if internship.employer_profile:
         internship.company_name = internship.employer_profile.company_name
         internship.company_logo = internship.employer_profile.logo_url
-    internship.applicant_count = len(internship.applications)
     return internship
 
 
@@ -465,6 +760,7 @@ def read_public_internship(
 def update_internship(
     internship_id: str,  # Changed to string for UUID
     internship_in: InternshipUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(deps.get_db),
     current_company: Company = Depends(deps.get_current_active_company),
 ):
@@ -478,12 +774,15 @@ def update_internship(
     db.add(db_internship)
     db.commit()
     db.refresh(db_internship)
+    if any(getattr(internship_in, field) for field in MATCH_FIELDS):
+        background_tasks.add_task(recompute_internship_match_scores, internship_id)
     return db_internship
 
 @router.patch("/{internship_id}", response_model=Internship)
 def partial_update_internship(
     internship_id: str,
     internship_in: InternshipPartialUpdate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(deps.get_db),
     current_company: Company = Depends(deps.get_current_active_company),
 ):
@@ -514,6 +813,8 @@ def partial_update_internship(
     db.add(db_internship)
     db.commit()
     db.refresh(db_internship)
+    if any(field in update_data for field in MATCH_FIELDS):
+        background_tasks.add_task(recompute_internship_match_scores, internship_id)
     print(f"DEBUG: Update successful! New status: {db_internship.status}")
     return db_internship
 
@@ -528,13 +829,21 @@ def delete_internship(
         raise HTTPException(status_code=404, detail="Internship not found")
 
     # Delete all applications associated with this internship first
-    # This prevents foreign key constraint violations
-    applications = db.query(ApplicationModel).filter(
+    # This prevents foreign key constraint violations. A single bulk DELETE
+    # (the internship and its applicant_count go away with it).
+    db.query(ApplicationModel).filter(
         ApplicationModel.internship_id == internship_id
-    ).all()
-    
-    for application in applications:
-        db.delete(application)
+    ).delete(synchronize_session=False)
+    # The bulk DELETE skips the Application mapper events, and the ON DELETE
+    # CASCADE on these tables is not enforced on SQLite: remove the
+    # internship's daily stats and event history in the same transaction
+    db.query(DailyApplicationStat).filter(
+        DailyApplicationStat.internship_id == internship_id
+    ).delete(synchronize_session=False)
+    db.query(ApplicationEvent).filter(
+        ApplicationEvent.internship_id == internship_id
+    ).delete(synchronize_session=False)
+    db.expire(db_internship, ['applications'])
     
     # Now delete the internship
     db.delete(db_internship)
@@ -550,35 +859,9 @@ def archive_expired_internships(
 ):
     """
     Archive all internships that have passed their deadline
-    This can be called manually or scheduled as a cron job
+    This also runs hourly from the in-process scheduler; call it to archive immediately
     """
-    today = date.today()
-    
-    # Find all active internships past their deadline
-    expired_internships = db.query(InternshipModel).filter(
-        InternshipModel.status == 'Active',
-        InternshipModel.deadline < today
-    ).all()
-    
-    archived_count = 0
-    archived_ids = []
-    
-    # Archive each expired internship
-    for internship in expired_internships:
-        internship.status = 'Archived'  # type: ignore
-        internship.archived_at = datetime.now(timezone.utc)  # type: ignore
-        archived_count += 1
-        archived_ids.append(internship.id)
-    
-    # Commit the changes
-    db.commit()
-    
-    return {
-        "success": True,
-        "archived_count": archived_count,
-        "archived_ids": archived_ids,
-        "message": f"Successfully archived {archived_count} expired internship(s)"
-    }
+    return archive_expired(db)
 
 
 @router.get("/company/archived", response_model=List[Internship])
@@ -589,15 +872,14 @@ def get_archived_internships(
     """Get all archived internships for the current company"""
     internships = db.query(InternshipModel).filter(
         InternshipModel.employer_profile_id == current_company.id,
-        InternshipModel.status == 'Archived'
+        InternshipModel.status == InternshipStatus.ARCHIVED.value
     ).order_by(InternshipModel.archived_at.desc()).all()
     
-    # Add company_name and applicant_count to each internship
+    # Add company_name to each internship
     for internship in internships:
         if internship.company:
             internship.company_name = internship.company.company_name
             internship.company_logo = internship.company.logo_url
-        internship.applicant_count = len(internship.applications)
     
     return internships
 
@@ -610,15 +892,14 @@ def get_active_internships(
     """Get all active internships for the current company"""
     internships = db.query(InternshipModel).filter(
         InternshipModel.employer_profile_id == current_company.id,
-        InternshipModel.status == 'Active'
+        InternshipModel.status == InternshipStatus.ACTIVE.value
     ).order_by(InternshipModel.date_posted.desc()).all()
     
-    # Add company_name and applicant_count to each internship
+    # Add company_name to each internship
     for internship in internships:
         if internship.company:
             internship.company_name = internship.company.company_name
             internship.company_logo = internship.company.logo_url
-        internship.applicant_count = len(internship.applications)
     
     return internships
 
@@ -631,15 +912,14 @@ def get_draft_internships(
     """Get all draft internships for the current company"""
     internships = db.query(InternshipModel).filter(
         InternshipModel.employer_profile_id == current_company.id,
-        InternshipModel.status == 'Draft'
+        InternshipModel.status == InternshipStatus.DRAFT.value
     ).order_by(InternshipModel.date_posted.desc()).all()
     
-    # Add company_name and applicant_count to each internship
+    # Add company_name to each internship
     for internship in internships:
         if internship.company:
             internship.company_name = internship.company.company_name
             internship.company_logo = internship.company.logo_url
-        internship.applicant_count = len(internship.applications)
     
     return internships
 
@@ -658,7 +938,7 @@ def manually_archive_internship(
     if not db_internship or str(db_internship.employer_profile_id) != str(current_company.id):
         raise HTTPException(status_code=404, detail="Internship not found")
     
-    db_internship.status = 'Archived'  # type: ignore
+    db_internship.status = InternshipStatus.ARCHIVED.value  # type: ignore
     db_internship.archived_at = datetime.now(timezone.utc)  # type: ignore
     
     db.commit()
@@ -704,7 +984,7 @@ def clone_internship(
         required_skills=db_internship.required_skills,
         deadline=None,  # User must set new deadline
         date_posted=date.today(),
-        status='Draft'  # Clone as draft
+        status=InternshipStatus.DRAFT.value  # Clone as draft
     )
 
     db.add(cloned_internship)
@@ -726,7 +1006,7 @@ def get_internships_expiring_soon(
     
     expiring_internships = db.query(InternshipModel).filter(
         InternshipModel.employer_profile_id == current_company.id,
-        InternshipModel.status == 'Active',
+        InternshipModel.status == InternshipStatus.ACTIVE.value,
         InternshipModel.deadline >= today,
         InternshipModel.deadline <= future_date
     ).all()
@@ -739,7 +1019,7 @@ def get_internships_expiring_soon(
             "title": internship.title,
             "deadline": internship.deadline,
             "days_remaining": days_remaining,
-            "applicant_count": len(internship.applications)
+            "applicant_count": internship.applicant_count
         })
     
     return {
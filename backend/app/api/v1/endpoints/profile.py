@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File
 from sqlalchemy.orm import Session
 from typing import List
 import os
@@ -17,6 +17,7 @@ from app.schemas.profile import (
 from app.schemas.user_profile import UserProfileUpdate
 from app.models.profile import WorkExperience, Project
 from app.models.user import User
+from app.utils.match_scores import recompute_student_match_scores
 
 router = APIRouter()
 
@@ -474,6 +475,7 @@ def get_student_profile(
 @router.put("/student-profile")
 def update_student_profile(
     profile_data: dict,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_user),
 ):
@@ -520,6 +522,10 @@ def update_student_profile(
         db.commit()
         db.refresh(student_profile)
         
+        # Skills drive application match scores; refresh them off the request path
+        if 'skills' in profile_data:
+            background_tasks.add_task(recompute_student_match_scores, current_user.id)
+        
         print(f"DEBUG: Successfully updated student profile for user {current_user.id}")
         
         # Return updated profile
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.orm import Session
 from app.api import deps
 from app.schemas.user_profile import UserProfile, UserProfileUpdate
 from app.models.user import User
+from app.utils.match_scores import recompute_student_match_scores
 
 router = APIRouter()
 
@@ -69,6 +70,7 @@ def get_my_profile(
 @router.put("/profile")
 def update_my_profile(
     profile_data: dict,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_user),
 ):
@@ -146,6 +148,9 @@ def update_my_profile(
         db.refresh(db_user)
         if student_profile:
             db.refresh(student_profile)
+            # Skills drive application match scores; refresh them off the request path
+            if 'skills' in profile_data:
+                background_tasks.add_task(recompute_student_match_scores, db_user.id)
         
         print(f"DEBUG: Successfully updated profile for user {db_user.id}")
         
@@ -35,6 +35,13 @@ class Settings(BaseSettings):
     COOKIE_DOMAIN: Optional[str] = None  # .yourdomain.com for production, None for dev
     COOKIE_HTTPONLY: Optional[bool] = True  # Prevent JavaScript access (security)
     COOKIE_MAX_AGE: Optional[int] = 604800  # 7 days in seconds
+    
+    # Per-process match result cache
+    MATCH_CACHE_SIZE: int = 50000  # Max cached student/internship pairs
+    MATCH_CACHE_TTL_SECONDS: int = 600  # Drop unused entries after 10 minutes
+
+    # In-process periodic jobs (archiving, counter reconciliation, rollups)
+    SCHEDULER_ENABLED: bool = True
 
     class Config:
         env_file = ".env"
@@ -7,12 +7,17 @@ from app.db.session import engine
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
 from app.core.config import settings
+from app.utils.internship_search import setup_search
+from app.utils.scheduler import scheduler
 
 # Get environment (prefer central settings)
 ENVIRONMENT = getattr(settings, "ENVIRONMENT", os.getenv("ENVIRONMENT", "development"))
 
 Base.metadata.create_all(bind=engine)
 
+# Full-text search tables/triggers (FTS5 on SQLite, tsvector on PostgreSQL)
+setup_search(engine)
+
 app = FastAPI(
     title="I-Intern API",
     description="Backend API for I-Intern Platform",
@@ -154,6 +159,19 @@ app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
 
 app.include_router(api_router, prefix="/api/v1")
 
+# ===========================
+# PERIODIC JOBS
+# ===========================
+# Every worker starts the scheduler; job leases make sure only one runs each job
+@app.on_event("startup")
+async def start_scheduler():
+    if settings.SCHEDULER_ENABLED:
+        scheduler.start()
+
+@app.on_event("shutdown")
+async def stop_scheduler():
+    await scheduler.stop()
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to the i-Intern API"}
\ No newline at end of file
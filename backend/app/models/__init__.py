@@ -7,12 +7,20 @@ Optimized Models - Clean Architecture
 - Application: Student applications
 - WorkExperience: Work history
 - Project: Student projects
+- Skill / InternshipSkill / StudentSkill: Normalized skills
+- DailyApplicationStat: Pre-aggregated application counts
+- ApplicationEvent: Append-only application status history
+- JobLock / JobRun: Periodic job leases and run history
 """
 from app.models.user import User
 from app.models.company import EmployerProfile
 from app.models.profile import StudentProfile, WorkExperience, Project
 from app.models.internship import Internship
 from app.models.application import Application
+from app.models.skill import Skill, InternshipSkill, StudentSkill
+from app.models.application_stats import DailyApplicationStat
+from app.models.application_event import ApplicationEvent
+from app.models.scheduler import JobLock, JobRun
 
 __all__ = [
     "User",
@@ -21,5 +29,23 @@ __all__ = [
     "Internship", 
     "Application", 
     "WorkExperience", 
-    "Project"
+    "Project",
+    "Skill",
+    "InternshipSkill",
+    "StudentSkill",
+    "DailyApplicationStat",
+    "ApplicationEvent",
+    "JobLock",
+    "JobRun"
 ]
+
+# Keep the skill association tables, IDF frequencies, applicant counts,
+# application rollups and event log, catalog snapshot and ETag stamps in sync
+# on write
+import app.utils.skills  # noqa: E402,F401
+import app.utils.skill_frequency  # noqa: E402,F401
+import app.utils.applicant_counts  # noqa: E402,F401
+import app.utils.application_stats  # noqa: E402,F401
+import app.utils.application_events  # noqa: E402,F401
+import app.utils.internship_facets  # noqa: E402,F401
+import app.utils.etags  # noqa: E402,F401
@@ -1,25 +1,74 @@
 """
 Application Model - Links Students to Internships
 """
-from sqlalchemy import Column, Integer, String, ForeignKey, Enum as SAEnum, DateTime
-from sqlalchemy.orm import relationship
+import enum
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float, Index, CheckConstraint
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from datetime import datetime
 from app.db.base import Base
 
 
-class ApplicationStatus(SAEnum):
+class ApplicationStatus(str, enum.Enum):
+    """Canonical (lowercase) application statuses as stored in the database"""
     PENDING = "pending"
     REVIEWED = "reviewed"
+    SHORTLISTED = "shortlisted"
+    OFFERED = "offered"
     ACCEPTED = "accepted"
+    DECLINED = "declined"
     REJECTED = "rejected"
+    HIRED = "hired"
+
+    @classmethod
+    def parse(cls, value) -> "ApplicationStatus":
+        """Canonical status for any casing/spelling of a status ("Under Review",
+        "offer_accepted", ...); empty means pending. Raises ValueError for
+        unknown statuses."""
+        if isinstance(value, cls):
+            return value
+        normalized = str(value or "").strip().lower().replace(" ", "_")
+        return cls(STATUS_ALIASES.get(normalized, normalized) or cls.PENDING.value)
+
+
+# Legacy spellings and frontend labels ('Offer Rejected' -> "offer_rejected", ...) -> canonical status
+STATUS_ALIASES = {
+    "applied": ApplicationStatus.PENDING.value,
+    "under_review": ApplicationStatus.REVIEWED.value,
+    "reviewing": ApplicationStatus.REVIEWED.value,
+    "offer_sent": ApplicationStatus.OFFERED.value,
+    "offer_pending": ApplicationStatus.OFFERED.value,
+    "offer_accepted": ApplicationStatus.ACCEPTED.value,
+    "offer_rejected": ApplicationStatus.DECLINED.value,
+    "offer_declined": ApplicationStatus.DECLINED.value,
+}
+
+# Employers only see a candidate's email/phone once an offer was accepted
+CONTACT_VISIBLE_STATUSES = [ApplicationStatus.ACCEPTED.value, ApplicationStatus.HIRED.value]
+
+# Statuses counted as hires
+HIRED_STATUSES = [ApplicationStatus.ACCEPTED.value, ApplicationStatus.HIRED.value]
 
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        # Applicant lists are ranked by match score within an internship
+        Index("ix_applications_internship_match_score", "internship_id", "match_score"),
+        # Per-internship status counts and filters
+        Index("ix_applications_internship_status", "internship_id", "status"),
+        # One application per student and internship; the apply path relies on it
+        Index("uq_applications_student_internship", "student_id", "internship_id", unique=True),
+        # Client retry keys (Idempotency-Key header) are unique per student
+        Index("uq_applications_student_idempotency_key", "student_id", "idempotency_key", unique=True),
+        CheckConstraint(
+            "status IN ('pending', 'reviewed', 'shortlisted', 'offered', 'accepted', 'declined', 'rejected', 'hired')",
+            name="ck_applications_status"
+        ),
+    )
 
     id = Column(String, primary_key=True, index=True)  # UUID as string
-    status = Column(String, default=ApplicationStatus.PENDING)
+    status = Column(String, nullable=False, default=ApplicationStatus.PENDING.value, server_default="pending")  # ApplicationStatus
     
     # Foreign Keys
     student_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)  # References users.id (student)
@@ -33,6 +82,19 @@ class Application(Base):
     offer_response_date = Column(DateTime(timezone=True), nullable=True)  # When candidate responded
     hired_date = Column(DateTime(timezone=True), nullable=True)  # When candidate was officially hired
     
+    # Persisted match percentage (kept up to date when skills change)
+    match_score = Column(Float, nullable=True)
+    
+    # Idempotency-Key of the request that created the application, if any
+    idempotency_key = Column(String(255), nullable=True)
+    
+    # Bumped on every write; version stamp for applicant ETags (app/utils/etags.py)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
     # Relationships
     student = relationship("User", back_populates="applications")  # Link to User (student)
-    internship = relationship("Internship", back_populates="applications")
\ No newline at end of file
+    internship = relationship("Internship", back_populates="applications")
+
+    @validates("status")
+    def _canonical_status(self, key, value):
+        return ApplicationStatus.parse(value).value
@@ -0,0 +1,37 @@
+"""
+Application Event Model - Append-only history of application statuses
+- ApplicationEvent: One row per status an application entered (including
+  its initial status when it was created)
+
+Written on every status change (see app/utils/application_events.py), so
+timelines, time-to-hire and stage conversion are index range scans over
+this table instead of reconstructions from the applications table.
+"""
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
+from app.db.base import Base
+from datetime import datetime
+
+
+class ApplicationEvent(Base):
+    """An application moved from `from_status` (None when created) to `to_status`"""
+    __tablename__ = "application_events"
+    __table_args__ = (
+        # Company analytics: events of an employer's internships within a time window
+        Index("ix_application_events_internship_created", "internship_id", "created_at"),
+        # A student's activity
+        Index("ix_application_events_student_created", "student_id", "created_at"),
+        # One application's timeline
+        Index("ix_application_events_application_created", "application_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    # Not a foreign key: history outlives the application row
+    application_id = Column(String, nullable=False)
+    internship_id = Column(String, ForeignKey("internships.id", ondelete="CASCADE"), nullable=False)
+    student_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    from_status = Column(String, nullable=True)  # ApplicationStatus; None for the application's creation
+    to_status = Column(String, nullable=False)  # ApplicationStatus
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # UTC
+
+    def __repr__(self):
+        return f"<ApplicationEvent(application_id={self.application_id}, {self.from_status} -> {self.to_status})>"
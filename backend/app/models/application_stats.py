@@ -0,0 +1,23 @@
+"""
+Application Stats Model - Pre-aggregated application counts for analytics
+- DailyApplicationStat: Applications per internship, application day and
+  normalized status
+
+Kept current on write (see app/utils/application_stats.py); employer
+analytics read these rows instead of scanning the applications table.
+"""
+from sqlalchemy import Column, Integer, String, ForeignKey, Date
+from app.db.base import Base
+
+
+class DailyApplicationStat(Base):
+    """Number of applications to an internship, made on `day`, currently in `status`"""
+    __tablename__ = "daily_application_stats"
+
+    internship_id = Column(String, ForeignKey("internships.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)  # UTC day of Application.application_date
+    status = Column(String, primary_key=True)  # Normalized, see normalize_status
+    count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    def __repr__(self):
+        return f"<DailyApplicationStat(internship_id={self.internship_id}, day={self.day}, status={self.status}, count={self.count})>"
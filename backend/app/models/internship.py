@@ -1,14 +1,47 @@
 """
 Internship Model - Linked to EmployerProfile
 """
-from sqlalchemy import Column, Integer, String, ForeignKey, Date, Text, DateTime, Boolean
-from sqlalchemy.orm import relationship
+import enum
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Text, DateTime, Boolean, Index, CheckConstraint
+from sqlalchemy.orm import relationship, validates
 from app.db.base import Base
 from datetime import datetime
 
 
+class InternshipStatus(str, enum.Enum):
+    """Canonical (lowercase) internship statuses as stored in the database"""
+    ACTIVE = "active"
+    CLOSED = "closed"
+    DRAFT = "draft"
+    ARCHIVED = "archived"
+
+    @classmethod
+    def parse(cls, value) -> "InternshipStatus":
+        """Canonical status for any casing of a status; empty means active.
+        Raises ValueError for unknown statuses."""
+        if isinstance(value, cls):
+            return value
+        normalized = str(value or "").strip().lower()
+        return cls(normalized or cls.ACTIVE.value)
+
+
 class Internship(Base):
     __tablename__ = "internships"
+    __table_args__ = (
+        # Public listing: keyset pagination on (date_posted, id), optionally
+        # narrowed by an equality filter that shares the same sort order
+        Index("ix_internships_date_posted_id", "date_posted", "id"),
+        Index("ix_internships_location_date_posted", "location", "date_posted", "id"),
+        Index("ix_internships_type_date_posted", "type", "date_posted", "id"),
+        Index("ix_internships_level_date_posted", "level", "date_posted", "id"),
+        Index("ix_internships_category_date_posted", "category", "date_posted", "id"),
+        # Range filters
+        Index("ix_internships_stipend", "stipend"),
+        Index("ix_internships_deadline", "deadline"),
+        # Visibility: status = 'active' AND deadline >= today
+        Index("ix_internships_status_deadline", "status", "deadline"),
+        CheckConstraint("status IN ('active', 'closed', 'draft', 'archived')", name="ck_internships_status"),
+    )
 
     id = Column(String, primary_key=True, index=True)  # UUID as string
     title = Column(String, index=True)
@@ -38,13 +71,21 @@ class Internship(Base):
     # Dates and status
     deadline = Column(Date, nullable=True)
     date_posted = Column(Date, nullable=True)
-    status = Column(String, nullable=True)  # Active, Closed, Draft, Archived
+    status = Column(String, nullable=False, default=InternshipStatus.ACTIVE.value, server_default="active")  # InternshipStatus
     archived_at = Column(DateTime, nullable=True)  # Timestamp when archived
     
+    # Denormalized number of applications (see app/utils/applicant_counts.py)
+    applicant_count = Column(Integer, nullable=False, default=0, server_default="0")
+    
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     employer_profile = relationship("EmployerProfile", back_populates="internships")
-    applications = relationship("Application", back_populates="internship", cascade="all, delete-orphan")
\ No newline at end of file
+    applications = relationship("Application", back_populates="internship", cascade="all, delete-orphan")
+    skill_links = relationship("InternshipSkill", back_populates="internship", cascade="all, delete-orphan")
+
+    @validates("status")
+    def _canonical_status(self, key, value):
+        return InternshipStatus.parse(value).value
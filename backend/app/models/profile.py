@@ -56,6 +56,9 @@ class StudentProfile(Base):
     # Relationship back to User
     user = relationship("User", back_populates="student_profile")
     
+    # Normalized skills (kept in sync with `skills`)
+    skill_links = relationship("StudentSkill", back_populates="student_profile", cascade="all, delete-orphan")
+    
     def __repr__(self):
         return f"<StudentProfile(id={self.id}, user_id={self.user_id})>"
 
@@ -0,0 +1,44 @@
+"""
+Scheduler Models - Periodic job coordination and history
+- JobLock: One row per job; the worker holding an unexpired lease runs it
+- JobRun: One row per job execution, with its duration and outcome
+
+See app/utils/scheduler.py.
+"""
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, Index
+from app.db.base import Base
+from datetime import datetime
+
+
+class JobLock(Base):
+    """Lease on a periodic job, shared by every worker"""
+    __tablename__ = "job_locks"
+
+    name = Column(String, primary_key=True)
+    owner = Column(String, nullable=True)  # Worker id (host:pid:random)
+    locked_until = Column(DateTime, nullable=False)  # UTC; the lease is free after this
+
+    def __repr__(self):
+        return f"<JobLock(name={self.name}, owner={self.owner}, locked_until={self.locked_until})>"
+
+
+class JobRun(Base):
+    """One execution of a periodic job"""
+    __tablename__ = "job_runs"
+    __table_args__ = (
+        # Latest runs of a job
+        Index("ix_job_runs_job_started", "job_name", "started_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String, nullable=False)
+    worker = Column(String, nullable=True)
+    started_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+    duration_ms = Column(Integer, nullable=True)
+    success = Column(Boolean, nullable=True)  # NULL while running
+    result = Column(Text, nullable=True)  # JSON summary returned by the job
+    error = Column(Text, nullable=True)
+
+    def __repr__(self):
+        return f"<JobRun(job_name={self.job_name}, started_at={self.started_at}, success={self.success})>"
@@ -0,0 +1,56 @@
+"""
+Skill Models - Canonical skill vocabulary and indexed associations
+- Skill: One row per normalized (stripped, lowercased) skill name
+- InternshipSkill: Skills required by an internship
+- StudentSkill: Skills listed on a student profile
+
+The comma-separated / JSON skill columns stay the source of truth for display;
+these tables are kept in sync on write (see app/utils/skills.py) so skill
+lookups become indexed joins.
+"""
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
+from sqlalchemy.orm import relationship
+from app.db.base import Base
+from datetime import datetime
+
+
+class Skill(Base):
+    """Canonical skill"""
+    __tablename__ = "skills"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, nullable=False, index=True)  # Normalized name
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<Skill(id={self.id}, name={self.name})>"
+
+
+class InternshipSkill(Base):
+    """Internship -> Skill association"""
+    __tablename__ = "internship_skills"
+    __table_args__ = (
+        # "Which internships need X"
+        Index("ix_internship_skills_skill_internship", "skill_id", "internship_id"),
+    )
+
+    internship_id = Column(String, ForeignKey("internships.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True)
+
+    internship = relationship("Internship", back_populates="skill_links")
+    skill = relationship("Skill", lazy="joined")
+
+
+class StudentSkill(Base):
+    """StudentProfile -> Skill association"""
+    __tablename__ = "student_skills"
+    __table_args__ = (
+        # "Which students know X"
+        Index("ix_student_skills_skill_profile", "skill_id", "student_profile_id"),
+    )
+
+    student_profile_id = Column(Integer, ForeignKey("student_profiles.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id", ondelete="CASCADE"), primary_key=True)
+
+    student_profile = relationship("StudentProfile", back_populates="skill_links")
+    skill = relationship("Skill", lazy="joined")
@@ -5,6 +5,13 @@ from typing import Optional, List
 class ApplicationCreate(BaseModel):
     internship_id: str  # UUID as string
 
+# Bulk status change: explicit applications and/or a filter
+class ApplicationBulkStatusUpdate(BaseModel):
+    status: str
+    application_ids: Optional[List[str]] = None  # These applications ...
+    internship_id: Optional[str] = None  # ... or every application to this internship
+    current_status: Optional[str] = None  # Only applications currently in this status (e.g. "pending")
+
 # Intern profile details for company view
 class InternProfile(BaseModel):
     id: int
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
 from typing import Optional
 from datetime import date
+from app.models.internship import InternshipStatus
 
 class InternshipBase(BaseModel):
     title: str
@@ -19,6 +20,10 @@ class InternshipBase(BaseModel):
     date_posted: Optional[date] = None
     status: Optional[str] = None
 
+    @validator('status')
+    def canonical_status(cls, v):
+        return InternshipStatus.parse(v).value if v is not None else None
+
 class InternshipCreate(InternshipBase):
     pass
 
@@ -42,6 +47,10 @@ class InternshipPartialUpdate(BaseModel):
     date_posted: Optional[date] = None
     status: Optional[str] = None
 
+    @validator('status')
+    def canonical_status(cls, v):
+        return InternshipStatus.parse(v).value if v is not None else None
+
 class Internship(InternshipBase):
     id: str  # UUID as string
     employer_profile_id: int  # ForeignKey to EmployerProfile
@@ -0,0 +1,99 @@
+"""
+Denormalized `Internship.applicant_count`.
+
+Every Application inserted or deleted through the ORM adjusts its
+internship's counter with a single `UPDATE ... SET applicant_count =
+applicant_count +/- 1` on the flush connection, so the change is atomic and
+commits or rolls back together with the application row.
+
+Bulk deletes (`query.delete()`) and raw SQL bypass the ORM events;
+`reconcile_applicant_counts` recounts from the applications table and fixes
+any drift. It runs daily from the in-process scheduler (app/utils/scheduler.py).
+"""
+from typing import Optional
+from sqlalchemy import event, func, select, update
+from sqlalchemy.orm import Session
+from app.models.application import Application
+from app.models.internship import Internship
+from app.db.session import SessionLocal
+
+_internships = Internship.__table__
+
+
+def _adjust(connection, internship_id: str, delta: int) -> None:
+    if internship_id is None:
+        return
+    # updated_at is pinned: its onupdate would otherwise bump the posting's
+    # version (and every cached match against it) on each application
+    connection.execute(
+        update(_internships)
+        .where(_internships.c.id == internship_id)
+        .values(applicant_count=_internships.c.applicant_count + delta, updated_at=_internships.c.updated_at)
+    )
+
+
+@event.listens_for(Application, "after_insert")
+def _application_inserted(mapper, connection, target):
+    _adjust(connection, target.internship_id, 1)
+
+
+@event.listens_for(Application, "after_delete")
+def _application_deleted(mapper, connection, target):
+    _adjust(connection, target.internship_id, -1)
+
+
+def _actual_count():
+    applications = Application.__table__
+    return select(func.count(applications.c.id)).where(
+        applications.c.internship_id == _internships.c.id
+    ).scalar_subquery()
+
+
+def reconcile_applicant_counts(db: Optional[Session] = None) -> dict:
+    """
+    Recount applications per internship and fix drifted counters
+
+    Args:
+        db: Database session (optional, will create new one if not provided)
+
+    Returns:
+        dict: Summary with the number of internships corrected
+    """
+    close_session = False
+    if db is None:
+        db = SessionLocal()
+        close_session = True
+
+    try:
+        actual = _actual_count()
+        result = db.execute(
+            update(_internships)
+            .where(func.coalesce(_internships.c.applicant_count, -1) != actual)
+            .values(applicant_count=actual, updated_at=_internships.c.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+        return {
+            "success": True,
+            "corrected_count": result.rowcount,
+            "message": f"Corrected applicant counts for {result.rowcount} internship(s)"
+        }
+
+    except Exception as e:
+        db.rollback()
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "Failed to reconcile applicant counts"
+        }
+
+    finally:
+        if close_session:
+            db.close()
+
+
+if __name__ == "__main__":
+    # For running as a scheduled job
+    result = reconcile_applicant_counts()
+    print(result)
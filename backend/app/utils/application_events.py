@@ -0,0 +1,135 @@
+"""
+Append-only application event log (`application_events`).
+
+Every Application inserted through the ORM, and every status change made
+through it, appends one event on the flush connection, so the history
+commits or rolls back together with the application. Bulk status UPDATEs
+append theirs with `record_status_events`. Events are never updated.
+
+The analytics below read only events of one company's internships inside a
+time window: `internship_id IN (...) AND created_at >= since` is a range scan
+per internship on ix_application_events_internship_created.
+"""
+from datetime import date, datetime, timedelta
+from statistics import median
+from typing import Dict, Iterable, List
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.orm import Session
+from app.models.application import Application, HIRED_STATUSES
+from app.models.application_event import ApplicationEvent
+from app.models.internship import Internship
+from app.utils.application_stats import FUNNEL_STAGES
+
+_events = ApplicationEvent.__table__
+
+
+def record_status_events(connection, changes: Iterable[tuple]) -> None:
+    """
+    Append events for status changes written without the ORM.
+
+    Args:
+        changes: (application_id, internship_id, student_id, old status, new status) per application
+    """
+    now = datetime.utcnow()
+    rows = [
+        {"application_id": application_id, "internship_id": internship_id, "student_id": student_id,
+         "from_status": old_status, "to_status": new_status, "created_at": now}
+        for application_id, internship_id, student_id, old_status, new_status in changes
+        if old_status != new_status
+    ]
+    if rows:
+        connection.execute(_events.insert(), rows)
+
+
+@event.listens_for(Application, "after_insert")
+def _application_created(mapper, connection, target):
+    record_status_events(connection, [(target.id, target.internship_id, target.student_id, None, target.status)])
+
+
+@event.listens_for(Application, "after_update")
+def _application_updated(mapper, connection, target):
+    history = inspect(target).attrs["status"].history
+    if history.deleted and history.added:
+        record_status_events(connection, [
+            (target.id, target.internship_id, target.student_id, history.deleted[0], history.added[0])
+        ])
+
+
+# ========== QUERIES ==========
+
+def _company_internship_ids(employer_profile_id: int):
+    return select(Internship.id).where(Internship.employer_profile_id == employer_profile_id).scalar_subquery()
+
+
+def application_timeline(db: Session, application_id: str) -> List[ApplicationEvent]:
+    """Events of one application, oldest first"""
+    return db.query(ApplicationEvent).filter(
+        ApplicationEvent.application_id == application_id
+    ).order_by(ApplicationEvent.created_at, ApplicationEvent.id).all()
+
+
+def company_daily_activity(db: Session, employer_profile_id: int, since: date) -> List[tuple]:
+    """(day, to_status, count) of a company's application events since `since`, oldest day first"""
+    day = func.date(ApplicationEvent.created_at)
+    return db.query(day, ApplicationEvent.to_status, func.count(ApplicationEvent.id)).filter(
+        ApplicationEvent.internship_id.in_(_company_internship_ids(employer_profile_id)),
+        ApplicationEvent.created_at >= datetime.combine(since, datetime.min.time())
+    ).group_by(day, ApplicationEvent.to_status).order_by(day).all()
+
+
+def company_time_to_hire(db: Session, employer_profile_id: int, since: date) -> dict:
+    """Days from application to hire, for a company's hires since `since`"""
+    internship_ids = _company_internship_ids(employer_profile_id)
+    hired_at: Dict[str, datetime] = {}
+    for application_id, created_at in db.query(ApplicationEvent.application_id, ApplicationEvent.created_at).filter(
+        ApplicationEvent.internship_id.in_(internship_ids),
+        ApplicationEvent.created_at >= datetime.combine(since, datetime.min.time()),
+        ApplicationEvent.to_status.in_(HIRED_STATUSES)
+    ):
+        if application_id not in hired_at or created_at < hired_at[application_id]:
+            hired_at[application_id] = created_at
+
+    durations = []
+    if hired_at:
+        # The creation events of those applications, by application id
+        for application_id, created_at in db.query(ApplicationEvent.application_id, ApplicationEvent.created_at).filter(
+            ApplicationEvent.application_id.in_(hired_at),
+            ApplicationEvent.from_status.is_(None)
+        ):
+            durations.append((hired_at[application_id] - created_at) / timedelta(days=1))
+
+    return {
+        "hires": len(hired_at),
+        "average_days": round(sum(durations) / len(durations), 1) if durations else None,
+        "median_days": round(median(durations), 1) if durations else None,
+    }
+
+
+def company_stage_conversion(db: Session, employer_profile_id: int, since: date) -> dict:
+    """
+    How many of the applications made since `since` reached each funnel stage
+    (at any point, even if they moved on or were rejected later), and the
+    share of each stage that reached the next one.
+    """
+    reached: Dict[str, set] = {}
+    applied = set()
+    for application_id, from_status, to_status in db.query(
+        ApplicationEvent.application_id, ApplicationEvent.from_status, ApplicationEvent.to_status
+    ).filter(
+        ApplicationEvent.internship_id.in_(_company_internship_ids(employer_profile_id)),
+        ApplicationEvent.created_at >= datetime.combine(since, datetime.min.time())
+    ):
+        if from_status is None:
+            applied.add(application_id)
+        reached.setdefault(application_id, set()).add(to_status)
+
+    stages = {"applied": len(applied)}
+    for stage, statuses in FUNNEL_STAGES.items():
+        stages[stage] = sum(1 for application_id in applied if reached[application_id] & set(statuses))
+
+    names = list(stages)
+    conversion = {
+        f"{previous}_to_{stage}": round(stages[stage] / stages[previous] * 100, 1) if stages[previous] else None
+        for previous, stage in zip(names, names[1:])
+    }
+    return {"stages": stages, "conversion_percent": conversion}
@@ -0,0 +1,216 @@
+"""
+Daily application rollup (`daily_application_stats`) for employer analytics.
+
+Every Application inserted, updated or deleted through the ORM moves one
+count between (internship, day, status) rows with a single upsert on the
+flush connection, so the rollup commits or rolls back together with the
+application. `day` is the UTC day the application was made and `status` is
+its current status, normalized by `normalize_status`; a status change moves
+the application from its old status row to the new one on the same day.
+
+Bulk status UPDATEs report their changes with `record_status_changes`.
+Bulk deletes (`query.delete()`) and raw SQL bypass the ORM events;
+`rebuild_daily_application_stats` recomputes the table from the
+applications table. It runs daily from the in-process scheduler
+(app/utils/scheduler.py).
+"""
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import delete, event, func, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.application import Application
+from app.models.application_stats import DailyApplicationStat
+from app.models.internship import Internship
+from app.db.session import SessionLocal
+
+UNKNOWN_STATUS = "unknown"
+
+# Hiring funnel stage -> normalized statuses that have reached it
+FUNNEL_STAGES = {
+    "screened": ('reviewed', 'shortlisted', 'offered', 'accepted', 'hired'),
+    "interviewed": ('shortlisted', 'offered', 'accepted', 'hired'),
+    "offered": ('offered', 'accepted', 'hired'),
+    "hired": ('accepted', 'hired'),
+}
+
+_stats = DailyApplicationStat.__table__
+
+
+def normalize_status(status: Optional[str]) -> str:
+    """'Under Review' -> 'under_review'; empty -> 'unknown'"""
+    return (status or "").strip().lower().replace(" ", "_") or UNKNOWN_STATUS
+
+
+def _normalized_status_sql(column):
+    # Same as normalize_status, in SQL
+    return func.coalesce(func.nullif(func.replace(func.lower(func.trim(column)), " ", "_"), ""), UNKNOWN_STATUS)
+
+
+def _day(applied_at: Optional[datetime]) -> date:
+    if applied_at is None:
+        return datetime.now(timezone.utc).date()
+    if applied_at.tzinfo is not None:
+        applied_at = applied_at.astimezone(timezone.utc)
+    return applied_at.date()
+
+
+def _adjust(connection, internship_id: Optional[str], day: date, status: str, delta: int) -> None:
+    if internship_id is None:
+        return
+    if delta < 0:
+        connection.execute(
+            update(_stats)
+            .where(_stats.c.internship_id == internship_id, _stats.c.day == day, _stats.c.status == status)
+            .values(count=_stats.c.count + delta)
+        )
+        return
+    dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+    statement = dialect.insert(_stats).values(internship_id=internship_id, day=day, status=status, count=delta)
+    connection.execute(statement.on_conflict_do_update(
+        index_elements=[_stats.c.internship_id, _stats.c.day, _stats.c.status],
+        set_={"count": _stats.c.count + delta}
+    ))
+
+
+def _previous(target, field: str):
+    history = inspect(target).attrs[field].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, field)
+
+
+@event.listens_for(Application, "after_insert")
+def _application_inserted(mapper, connection, target):
+    _adjust(connection, target.internship_id, _day(target.application_date), normalize_status(target.status), 1)
+
+
+@event.listens_for(Application, "after_update")
+def _application_updated(mapper, connection, target):
+    old = (_previous(target, "internship_id"), _day(_previous(target, "application_date")),
+           normalize_status(_previous(target, "status")))
+    new = (target.internship_id, _day(target.application_date), normalize_status(target.status))
+    if old != new:
+        _adjust(connection, *old, -1)
+        _adjust(connection, *new, 1)
+
+
+@event.listens_for(Application, "after_delete")
+def _application_deleted(mapper, connection, target):
+    _adjust(connection, target.internship_id, _day(target.application_date), normalize_status(target.status), -1)
+
+
+def record_status_changes(connection, changes: Iterable[tuple]) -> None:
+    """
+    Move rollup counts for status changes written with a bulk UPDATE (which
+    bypasses the mapper events above).
+
+    Args:
+        changes: (internship_id, application_date, old status, new status) per application
+    """
+    deltas: Dict[tuple, int] = {}
+    for internship_id, applied_at, old_status, new_status in changes:
+        day = _day(applied_at)
+        old_key = (internship_id, day, normalize_status(old_status))
+        new_key = (internship_id, day, normalize_status(new_status))
+        if old_key != new_key:
+            deltas[old_key] = deltas.get(old_key, 0) - 1
+            deltas[new_key] = deltas.get(new_key, 0) + 1
+    for (internship_id, day, status), delta in deltas.items():
+        if delta:
+            _adjust(connection, internship_id, day, status, delta)
+
+
+# ========== QUERIES ==========
+
+def company_status_counts(
+    db: Session,
+    employer_profile_id: int,
+    since: Optional[date] = None,
+    until: Optional[date] = None
+) -> Dict[str, int]:
+    """Applications to a company's internships per normalized status, optionally within [since, until)"""
+    query = db.query(DailyApplicationStat.status, func.sum(DailyApplicationStat.count)).join(
+        Internship, Internship.id == DailyApplicationStat.internship_id
+    ).filter(Internship.employer_profile_id == employer_profile_id)
+    if since is not None:
+        query = query.filter(DailyApplicationStat.day >= since)
+    if until is not None:
+        query = query.filter(DailyApplicationStat.day < until)
+    return {status: int(total or 0) for status, total in query.group_by(DailyApplicationStat.status).all()}
+
+
+def company_daily_counts(
+    db: Session,
+    employer_profile_id: int,
+    since: Optional[date] = None
+) -> List[tuple]:
+    """(day, status, count) rows for a company's internships, oldest day first"""
+    query = db.query(
+        DailyApplicationStat.day, DailyApplicationStat.status, func.sum(DailyApplicationStat.count)
+    ).join(
+        Internship, Internship.id == DailyApplicationStat.internship_id
+    ).filter(Internship.employer_profile_id == employer_profile_id)
+    if since is not None:
+        query = query.filter(DailyApplicationStat.day >= since)
+    return query.group_by(DailyApplicationStat.day, DailyApplicationStat.status).order_by(
+        DailyApplicationStat.day
+    ).all()
+
+
+# ========== REBUILD ==========
+
+def rebuild_daily_application_stats(db: Optional[Session] = None) -> dict:
+    """
+    Recompute daily_application_stats from the applications table
+
+    Args:
+        db: Database session (optional, will create new one if not provided)
+
+    Returns:
+        dict: Summary with the number of rollup rows written
+    """
+    close_session = False
+    if db is None:
+        db = SessionLocal()
+        close_session = True
+
+    try:
+        applications = Application.__table__
+        applied_at = applications.c.application_date
+        if db.get_bind().dialect.name == "postgresql":
+            applied_at = func.timezone("UTC", applied_at)
+        day = func.date(applied_at)
+        status = _normalized_status_sql(applications.c.status)
+        rollup = select(
+            applications.c.internship_id, day, status, func.count(applications.c.id)
+        ).group_by(applications.c.internship_id, day, status)
+
+        db.execute(delete(_stats))
+        db.execute(_stats.insert().from_select(["internship_id", "day", "status", "count"], rollup))
+        rows = db.query(func.count()).select_from(_stats).scalar()
+        db.commit()
+
+        return {
+            "success": True,
+            "row_count": rows,
+            "message": f"Rebuilt {rows} daily application stat row(s)"
+        }
+
+    except Exception as e:
+        db.rollback()
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "Failed to rebuild daily application stats"
+        }
+
+    finally:
+        if close_session:
+            db.close()
+
+
+if __name__ == "__main__":
+    # For running as a scheduled job
+    result = rebuild_daily_application_stats()
+    print(result)
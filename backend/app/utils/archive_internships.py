@@ -1,12 +1,15 @@
 """
 Utility script to archive expired internships
-This should be run as a scheduled task (cron job) daily
+Runs hourly from the in-process scheduler (see app/utils/scheduler.py); can
+also be run standalone
 """
 from datetime import date, datetime, timezone
 from typing import Optional
+from sqlalchemy import update
 from sqlalchemy.orm import Session
-from app.models.internship import Internship
+from app.models.internship import Internship, InternshipStatus
 from app.db.session import SessionLocal
+from app.utils.internship_catalog import internship_catalog
 
 
 def archive_expired_internships(db: Optional[Session] = None) -> dict:
@@ -28,25 +31,22 @@ def archive_expired_internships(db: Optional[Session] = None) -> dict:
     try:
         today = date.today()
         
-        # Find all active internships past their deadline
-        expired_internships = db.query(Internship).filter(
-            Internship.status == 'Active',
-            Internship.deadline < today
-        ).all()
-        
-        archived_count = 0
-        archived_ids = []
-        
-        # Archive each expired internship
-        for internship in expired_internships:
-            internship.status = 'Archived'  # type: ignore
-            internship.archived_at = datetime.now(timezone.utc)  # type: ignore
-            archived_count += 1
-            archived_ids.append(internship.id)
+        # One bulk UPDATE over ix_internships_status_deadline; updated_at is
+        # bumped too, so other workers' catalog snapshots pick the change up
+        internships = Internship.__table__
+        archived_ids = [row.id for row in db.execute(
+            update(internships)
+            .where(internships.c.status == InternshipStatus.ACTIVE.value, internships.c.deadline < today)
+            .values(status=InternshipStatus.ARCHIVED.value, archived_at=datetime.now(timezone.utc))
+            .returning(internships.c.id)
+        ).all()]
+        archived_count = len(archived_ids)
         
         # Commit the changes
         db.commit()
         
+        internship_catalog.mark_stale(archived_ids)
+        
         return {
             "success": True,
             "archived_count": archived_count,
@@ -90,7 +90,7 @@ def get_internships_expiring_soon(days: int = 7, db: Optional[Session] = None) -
         future_date = today + timedelta(days=days)
         
         expiring_internships = db.query(Internship).filter(
-            Internship.status == 'Active',
+            Internship.status == InternshipStatus.ACTIVE.value,
             Internship.deadline >= today,
             Internship.deadline <= future_date
         ).all()
@@ -0,0 +1,48 @@
+"""
+ETags for the employer applicant views.
+
+An ETag is a hash of the version stamps (`updated_at` values) of the rows a
+response is built from, so a conditional request can be answered with 304
+before the body is assembled: only the stamps are read, not bios, work
+experiences or projects, and nothing is scored.
+
+Work experiences and projects have no stamp of their own. Writing one bumps
+the owner's `student_profiles.updated_at` (mapper events below, on the flush
+connection), so the profile stamp covers everything on the applicant detail
+page.
+"""
+import hashlib
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import event, update
+from app.models.profile import Project, StudentProfile, WorkExperience
+
+_profiles = StudentProfile.__table__
+
+
+def compute_etag(*parts) -> str:
+    """Weak ETag over version stamps (ids, timestamps, query parameters)"""
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value matches `etag` (weak comparison)"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag.removeprefix("W/") for candidate in candidates)
+
+
+def _touch_profile(connection, user_id: Optional[int]) -> None:
+    if user_id is None:
+        return
+    connection.execute(update(_profiles).where(_profiles.c.user_id == user_id).values(updated_at=datetime.utcnow()))
+
+
+for _model in (WorkExperience, Project):
+    @event.listens_for(_model, "after_insert")
+    @event.listens_for(_model, "after_update")
+    @event.listens_for(_model, "after_delete")
+    def _profile_section_written(mapper, connection, target):
+        _touch_profile(connection, target.user_id)
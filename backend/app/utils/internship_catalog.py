@@ -0,0 +1,377 @@
+"""
+Process-local snapshot of the publicly visible internship catalog.
+
+The public listing, facets, with-match and detail reads are served from this
+snapshot instead of re-running the visibility filter against the database on
+every request. Each posting is one `CatalogEntry` (`__slots__`, no per-object
+dict) holding the fields those endpoints return, its skills as interned skill
+ids (shared with `match_engine`'s vocabulary) and interned strings for the
+low-cardinality columns.
+
+`match_engine` is kept in step with the snapshot: every entry added, replaced
+or dropped here is indexed in or removed from it, so skill recommendations
+(app/utils/internship_index.py) share the snapshot's visibility rules and
+freshness.
+
+Freshness:
+  - Writes committed through this process's sessions mark the touched
+    internships (and internships whose applications or company changed)
+    stale; they are re-read with one query on the next access.
+  - Every CATALOG_POLL_SECONDS the snapshot polls for rows whose `updated_at`
+    moved past the watermark (internships and employer profiles, so company
+    renames/logo changes show up), which picks up writes from other workers.
+  - A full reload every CATALOG_RELOAD_SECONDS drops rows deleted elsewhere
+    and corrects counters changed by bulk SQL.
+
+Deadlines are checked at read time, so postings disappear the day their
+deadline passes without a refresh.
+"""
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import event, func, or_
+from sqlalchemy.orm import Session
+from app.models.application import Application
+from app.models.company import EmployerProfile
+from app.models.internship import Internship, InternshipStatus
+from app.utils.matching import match_engine, parse_skill_set
+
+CATALOG_POLL_SECONDS = 5
+CATALOG_RELOAD_SECONDS = 300
+
+# Re-read rows this far behind the watermark, so writes committed late with an
+# earlier updated_at (long transactions, clock skew between workers) are not missed
+WATERMARK_OVERLAP = timedelta(seconds=30)
+
+_STALE_KEY = "internship_catalog_stale"
+_STALE_COMPANIES_KEY = "internship_catalog_stale_companies"
+_DELETED_KEY = "internship_catalog_deleted"
+
+
+class CatalogEntry:
+    """One visible internship, shaped like the `Internship` response schema"""
+
+    __slots__ = (
+        "id", "title", "description", "employer_profile_id", "company_name", "company_logo",
+        "location", "stipend", "duration", "type", "level", "category", "skills", "requirements",
+        "benefits", "required_skills", "skill_ids", "deadline", "date_posted", "status",
+        "applicant_count", "updated_at",
+    )
+
+    def __init__(self, internship: Internship, company_name: Optional[str], company_logo: Optional[str]):
+        self.id = internship.id
+        self.title = internship.title
+        self.description = internship.description
+        self.employer_profile_id = internship.employer_profile_id
+        self.company_name = _intern(company_name)
+        self.company_logo = company_logo
+        self.location = _intern(internship.location)
+        self.stipend = internship.stipend
+        self.duration = _intern(internship.duration)
+        self.type = _intern(internship.type)
+        self.level = _intern(internship.level)
+        self.category = _intern(internship.category)
+        self.skills = internship.skills
+        self.requirements = internship.requirements
+        self.benefits = internship.benefits
+        self.required_skills = internship.required_skills
+        intern_skill = match_engine.vocabulary.intern
+        self.skill_ids = array("I", sorted(
+            intern_skill(skill) for skill in parse_skill_set(internship.required_skills or internship.skills)
+        ))
+        self.deadline = internship.deadline
+        self.date_posted = internship.date_posted
+        self.status = _intern(internship.status)
+        self.applicant_count = internship.applicant_count or 0
+        self.updated_at = internship.updated_at
+
+    def sort_key(self) -> tuple:
+        # Ascending key; the listing walks it backwards (date_posted DESC NULLS LAST, id DESC)
+        return (self.date_posted is not None, self.date_posted or date.min, self.id)
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def listed_filters() -> list:
+    """SQLAlchemy filter clauses for the visibility rules that don't depend on today's date"""
+    return [
+        # Exclude suspended postings
+        Internship.is_suspended != True,
+        # Only active postings (statuses are stored canonical, see InternshipStatus)
+        Internship.status == InternshipStatus.ACTIVE.value,
+    ]
+
+
+def visible_internship_filters() -> list:
+    """SQLAlchemy filter clauses for internships that students may see"""
+    return listed_filters() + [
+        # Include internships with no deadline or deadline not passed
+        or_(Internship.deadline.is_(None), Internship.deadline >= date.today())
+    ]
+
+
+def is_listed(internship: Internship) -> bool:
+    """Python-side equivalent of `listed_filters` for a loaded internship"""
+    return not internship.is_suspended and internship.status == InternshipStatus.ACTIVE.value
+
+
+def is_visible(internship: Internship) -> bool:
+    """Python-side equivalent of `visible_internship_filters` for a loaded internship"""
+    return is_listed(internship) and (internship.deadline is None or internship.deadline >= date.today())
+
+
+def _engine_item(entry: CatalogEntry) -> tuple:
+    """(internship_id, required skills, level) as indexed in match_engine"""
+    return entry.id, str(entry.required_skills or entry.skills or ""), str(entry.level or "")
+
+
+def _deadline_ok(entry: CatalogEntry, today: date) -> bool:
+    return entry.deadline is None or entry.deadline >= today
+
+
+class InternshipCatalog:
+    """Snapshot of listed internships with incremental, watermark-based refresh"""
+
+    def __init__(self):
+        self._entries: Dict[str, CatalogEntry] = {}
+        self._order: Optional[List[CatalogEntry]] = None
+        self._keys: Optional[List[tuple]] = None
+        self._stale: Set[str] = set()
+        self._stale_companies: Set[int] = set()
+        self._lock = threading.RLock()
+        self._loaded_at: Optional[float] = None
+        self._polled_at: float = 0.0
+        self._internship_watermark: Optional[datetime] = None
+        self._company_watermark: Optional[datetime] = None
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ---------- refresh ----------
+
+    def _query(self, db: Session):
+        return db.query(Internship, EmployerProfile.company_name, EmployerProfile.logo_url).outerjoin(
+            EmployerProfile, EmployerProfile.id == Internship.employer_profile_id
+        )
+
+    def _apply(self, rows: Iterable[tuple], removed_ids: Iterable[str] = ()) -> None:
+        # Caller holds the lock
+        for internship, company_name, company_logo in rows:
+            if is_listed(internship):
+                entry = CatalogEntry(internship, company_name, company_logo)
+                self._entries[internship.id] = entry
+                match_engine.index(*_engine_item(entry))
+            else:
+                self._entries.pop(internship.id, None)
+                match_engine.remove(internship.id)
+            if internship.updated_at and (self._internship_watermark is None
+                                          or internship.updated_at > self._internship_watermark):
+                self._internship_watermark = internship.updated_at
+        for internship_id in removed_ids:
+            self._entries.pop(internship_id, None)
+            match_engine.remove(internship_id)
+        self._order = None
+        self._keys = None
+        self.version += 1
+
+    def reload(self, db: Session) -> int:
+        """Replace the snapshot with every listed internship. Returns the number loaded."""
+        rows = self._query(db).filter(*listed_filters()).all()
+        company_watermark = db.query(func.max(EmployerProfile.updated_at)).scalar()
+        # Readers don't take the lock: build the new snapshot off to the side
+        # and swap it in, rather than emptying and refilling the live one
+        entries = {}
+        internship_watermark = None
+        for internship, company_name, company_logo in rows:
+            entries[internship.id] = CatalogEntry(internship, company_name, company_logo)
+            if internship.updated_at and (internship_watermark is None or internship.updated_at > internship_watermark):
+                internship_watermark = internship.updated_at
+        with self._lock:
+            match_engine.replace(_engine_item(entry) for entry in entries.values())
+            self._entries = entries
+            self._order = None
+            self._keys = None
+            self.version += 1
+            self._internship_watermark = internship_watermark
+            self._company_watermark = company_watermark
+            self._stale.clear()
+            self._stale_companies.clear()
+            self._loaded_at = self._polled_at = time.monotonic()
+        return len(rows)
+
+    def _reload_ids(self, db: Session, internship_ids: Set[str]) -> None:
+        rows = self._query(db).filter(Internship.id.in_(internship_ids)).all()
+        found = {internship.id for internship, _, _ in rows}
+        with self._lock:
+            # Ids that no longer exist were deleted
+            self._apply(rows, internship_ids - found)
+
+    def _poll(self, db: Session) -> None:
+        with self._lock:
+            changed = set(self._stale)
+            company_ids = set(self._stale_companies)
+            self._stale.clear()
+            self._stale_companies.clear()
+            self._polled_at = time.monotonic()
+        recent = db.query(Internship.id)
+        if self._internship_watermark is not None:
+            recent = recent.filter(Internship.updated_at >= self._internship_watermark - WATERMARK_OVERLAP)
+        changed.update(row.id for row in recent.all())
+        if self._company_watermark is not None:
+            companies = db.query(EmployerProfile.id, EmployerProfile.updated_at).filter(
+                EmployerProfile.updated_at >= self._company_watermark - WATERMARK_OVERLAP
+            ).all()
+            if companies:
+                self._company_watermark = max(self._company_watermark, max(c.updated_at for c in companies))
+                company_ids.update(c.id for c in companies)
+        if company_ids:
+            changed.update(row.id for row in db.query(Internship.id).filter(
+                Internship.employer_profile_id.in_(company_ids)
+            ).all())
+        if changed:
+            self._reload_ids(db, changed)
+
+    def ensure_fresh(self, db: Session) -> None:
+        """Load, poll or re-read stale rows as needed; usually a no-op"""
+        now = time.monotonic()
+        if self._loaded_at is None or now - self._loaded_at > CATALOG_RELOAD_SECONDS:
+            self.reload(db)
+        elif self._stale or self._stale_companies or now - self._polled_at > CATALOG_POLL_SECONDS:
+            self._poll(db)
+
+    def mark_stale(self, internship_ids: Iterable[str] = (), company_ids: Iterable[int] = ()) -> None:
+        with self._lock:
+            self._stale.update(internship_ids)
+            self._stale_companies.update(company_ids)
+
+    def discard(self, internship_ids: Iterable[str]) -> None:
+        with self._lock:
+            for internship_id in internship_ids:
+                self._entries.pop(internship_id, None)
+                match_engine.remove(internship_id)
+            self._order = None
+            self._keys = None
+            self.version += 1
+
+    def invalidate(self) -> None:
+        """Force a full reload on next use (e.g. after bulk SQL updates)"""
+        self._loaded_at = None
+
+    # ---------- reads ----------
+
+    def _sorted(self) -> Tuple[List[CatalogEntry], List[tuple]]:
+        with self._lock:
+            if self._order is None:
+                self._order = sorted(self._entries.values(), key=CatalogEntry.sort_key)
+                self._keys = [entry.sort_key() for entry in self._order]
+            return self._order, self._keys
+
+    def get(self, internship_id: str, include_expired: bool = False) -> Optional[CatalogEntry]:
+        """A visible internship by id (None if unknown, hidden or - unless
+        `include_expired` - past its deadline)"""
+        entry = self._entries.get(internship_id)
+        if entry is None or not (include_expired or _deadline_ok(entry, date.today())):
+            return None
+        return entry
+
+    def visible(self, predicate: Optional[Callable[[CatalogEntry], bool]] = None) -> List[CatalogEntry]:
+        """Visible entries, newest first, optionally filtered"""
+        today = date.today()
+        order, _ = self._sorted()
+        return [
+            entry for entry in reversed(order)
+            if _deadline_ok(entry, today) and (predicate is None or predicate(entry))
+        ]
+
+    def page(
+        self,
+        predicate: Optional[Callable[[CatalogEntry], bool]],
+        after_key: Optional[tuple],
+        limit: int
+    ) -> List[CatalogEntry]:
+        """Up to `limit` visible entries sorting after `after_key` (newest first)"""
+        today = date.today()
+        order, keys = self._sorted()
+        position = len(order) if after_key is None else bisect_left(keys, after_key)
+        page = []
+        for index in range(position - 1, -1, -1):
+            entry = order[index]
+            if _deadline_ok(entry, today) and (predicate is None or predicate(entry)):
+                page.append(entry)
+                if len(page) == limit:
+                    break
+        return page
+
+    def memory_report(self) -> dict:
+        """Approximate bytes held by the snapshot, and the same scaled to 10k postings"""
+        with self._lock:
+            entries = list(self._entries.values())
+        seen: Set[int] = set()
+        total = sys.getsizeof(self._entries)
+        for entry in entries:
+            total += sys.getsizeof(entry)
+            for name in CatalogEntry.__slots__:
+                value = getattr(entry, name)
+                if value is None or isinstance(value, (bool, int)) and -5 <= value <= 256:
+                    continue
+                if id(value) not in seen:
+                    seen.add(id(value))
+                    total += sys.getsizeof(value)
+        count = len(entries)
+        return {
+            "entries": count,
+            "bytes": total,
+            "bytes_per_entry": round(total / count) if count else 0,
+            "bytes_per_10k": round(total / count * 10000) if count else 0,
+            "skill_vocabulary_size": len(match_engine.vocabulary),
+            "version": self.version,
+        }
+
+
+internship_catalog = InternshipCatalog()
+
+
+# ========== SESSION EVENTS ==========
+
+@event.listens_for(Session, "after_flush")
+def _stage_catalog_changes(session, flush_context):
+    stale = session.info.setdefault(_STALE_KEY, set())
+    stale_companies = session.info.setdefault(_STALE_COMPANIES_KEY, set())
+    deleted = session.info.setdefault(_DELETED_KEY, set())
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Internship):
+            stale.add(obj.id)
+        elif isinstance(obj, Application) and obj in session.new:
+            stale.add(obj.internship_id)
+        elif isinstance(obj, EmployerProfile):
+            stale_companies.add(obj.id)
+    for obj in session.deleted:
+        if isinstance(obj, Internship):
+            deleted.add(obj.id)
+        elif isinstance(obj, Application):
+            stale.add(obj.internship_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_catalog_changes(session):
+    stale = session.info.pop(_STALE_KEY, None)
+    stale_companies = session.info.pop(_STALE_COMPANIES_KEY, None)
+    deleted = session.info.pop(_DELETED_KEY, None)
+    if deleted:
+        internship_catalog.discard(deleted)
+    if stale or stale_companies:
+        internship_catalog.mark_stale((stale or set()) - (deleted or set()), stale_companies or ())
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_catalog_changes(session, previous_transaction):
+    session.info.pop(_STALE_KEY, None)
+    session.info.pop(_STALE_COMPANIES_KEY, None)
+    session.info.pop(_DELETED_KEY, None)
@@ -0,0 +1,85 @@
+"""
+Facet counts for the internship browse page.
+
+Counts per category, type, level, location and stipend bucket are computed
+over the visible internships in the in-process catalog snapshot (see
+app/utils/internship_catalog.py). Each facet applies every active filter
+except its own, so the counts show what the user would get by changing that
+filter.
+
+Results are cached per (catalog version, filter set) for
+FACET_CACHE_TTL_SECONDS; any change to the snapshot bumps its version, so
+cached counts never outlive the postings they were computed from.
+"""
+from collections import Counter
+from typing import Dict, Hashable, List, Optional
+from app.utils.internship_catalog import CatalogEntry, internship_catalog
+from app.utils.match_cache import LRUCache
+
+FACET_CACHE_TTL_SECONDS = 60
+
+FACET_FIELDS = ("category", "type", "level", "location")
+
+# (bucket label, min stipend, max stipend); None means unbounded
+STIPEND_BUCKETS = [
+    ("unpaid", 0, 0),
+    ("1-5000", 1, 5000),
+    ("5001-10000", 5001, 10000),
+    ("10001-20000", 10001, 20000),
+    ("20001+", 20001, None),
+]
+STIPEND_NOT_DISCLOSED = "not_disclosed"
+
+facet_cache = LRUCache(maxsize=1000, ttl_seconds=FACET_CACHE_TTL_SECONDS)
+
+
+def stipend_bucket(stipend: Optional[int]) -> str:
+    if stipend is None:
+        return STIPEND_NOT_DISCLOSED
+    for label, low, high in STIPEND_BUCKETS:
+        if stipend >= low and (high is None or stipend <= high):
+            return label
+    return STIPEND_NOT_DISCLOSED
+
+
+def compute_facets(filters, cache_key: Hashable = None) -> Dict:
+    """
+    Facet counts for a filter set over the current catalog snapshot.
+
+    Args:
+        filters: Object with `matches(entry, exclude=None)`, optionally
+            ignoring the filter for one facet
+        cache_key: Hashable identity of the filter set (None disables caching)
+    """
+    key = (internship_catalog.version, cache_key) if cache_key is not None else None
+    if key is not None:
+        cached = facet_cache.get(key)
+        if cached is not None:
+            return cached
+
+    entries: List[CatalogEntry] = internship_catalog.visible()
+    facets: Dict[str, List[Dict]] = {}
+
+    for name in FACET_FIELDS:
+        counts = Counter(
+            getattr(entry, name) for entry in entries
+            if getattr(entry, name) and filters.matches(entry, exclude=name)
+        )
+        facets[name] = [
+            {"value": value, "count": count}
+            for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        ]
+
+    counts = Counter(stipend_bucket(entry.stipend) for entry in entries if filters.matches(entry, exclude="stipend"))
+    facets["stipend"] = [
+        {"bucket": label, "min": low, "max": high, "count": counts.get(label, 0)}
+        for label, low, high in STIPEND_BUCKETS
+    ] + [{"bucket": STIPEND_NOT_DISCLOSED, "min": None, "max": None, "count": counts.get(STIPEND_NOT_DISCLOSED, 0)}]
+
+    result = {
+        "total": sum(1 for entry in entries if filters.matches(entry)),
+        "facets": facets,
+    }
+    if key is not None:
+        facet_cache.set(key, result)
+    return result
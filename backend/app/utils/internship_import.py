@@ -0,0 +1,202 @@
+"""
+Bulk internship import for employers (POST /internships/bulk).
+
+Rows are validated one by one with `InternshipCreate`; invalid rows are
+reported and skipped. Valid rows are written in one transaction with
+executemany upserts (`INSERT ... ON CONFLICT (id) DO UPDATE`) in batches of
+BATCH_SIZE. A row with an `id` of an existing posting of the same company
+updates it; any other row creates a posting, under the row's `id` (a UUID,
+so re-running an import is idempotent) or a new one.
+
+Core statements bypass the ORM flush listeners, so the side tables they
+maintain are updated here in bulk: internship_skills (the normalized skill
+links), the IDF frequency table and the catalog snapshot (which also feeds
+the skill index).
+The full-text index is maintained by database triggers. Applicant counts
+are not touched, because no applications change.
+"""
+import csv
+import io
+import uuid
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.internship import Internship, InternshipStatus
+from app.models.skill import Skill, InternshipSkill
+from app.schemas.internship import InternshipCreate
+from app.utils.internship_catalog import internship_catalog
+from app.utils.matching import parse_skill_set
+from app.utils.skill_frequency import skill_frequencies
+
+# Rows per executemany
+BATCH_SIZE = 500
+
+# Rows accepted per request
+MAX_IMPORT_ROWS = 5000
+
+_internships = Internship.__table__
+_FIELDS = tuple(InternshipCreate.model_fields)
+
+
+def parse_csv(content: bytes) -> List[dict]:
+    """Rows of a CSV file with a header line; empty cells become None"""
+    reader = csv.DictReader(io.StringIO(content.decode("utf-8-sig")))
+    return [
+        {key.strip(): (value.strip() or None) if isinstance(value, str) else value
+         for key, value in row.items() if key}
+        for row in reader
+    ]
+
+
+def _validate(raw_rows: list) -> Tuple[List[Tuple[int, Optional[str], dict]], List[dict]]:
+    """(row index, requested id, validated fields) for valid rows, and error results"""
+    valid, errors = [], []
+    seen_ids = set()
+    for index, raw in enumerate(raw_rows):
+        if not isinstance(raw, dict):
+            errors.append({"row": index, "status": "error", "errors": [{"loc": [], "msg": "Row must be an object"}]})
+            continue
+        raw = dict(raw)
+        row_id = raw.pop("id", None)
+        row_id = str(row_id) if row_id else None
+        if row_id is not None:
+            try:
+                row_id = str(uuid.UUID(row_id))
+            except ValueError:
+                errors.append({"row": index, "id": row_id, "status": "error",
+                               "errors": [{"loc": ["id"], "msg": "id must be a UUID"}]})
+                continue
+        if row_id is not None and row_id in seen_ids:
+            errors.append({"row": index, "id": row_id, "status": "error",
+                           "errors": [{"loc": ["id"], "msg": "Duplicate id in this import"}]})
+            continue
+        try:
+            data = InternshipCreate(**raw).dict()
+        except ValidationError as e:
+            errors.append({"row": index, "id": row_id, "status": "error",
+                           "errors": [{"loc": list(err["loc"]), "msg": err["msg"]} for err in e.errors()]})
+            continue
+        if row_id is not None:
+            seen_ids.add(row_id)
+        valid.append((index, row_id, data))
+    return valid, errors
+
+
+def _upsert_statement(dialect_name: str):
+    dialect = postgresql if dialect_name == "postgresql" else sqlite
+    statement = dialect.insert(_internships)
+    return statement.on_conflict_do_update(
+        index_elements=[_internships.c.id],
+        set_={name: statement.excluded[name] for name in _FIELDS + ("updated_at",)},
+        # Never take over another company's posting, even if it appeared after the pre-check
+        where=_internships.c.employer_profile_id == statement.excluded.employer_profile_id
+    )
+
+
+def _link_skills(db: Session, skills_by_internship: Dict[str, set], updated_ids: List[str]) -> None:
+    names = set().union(*skills_by_internship.values()) if skills_by_internship else set()
+    skill_ids: Dict[str, int] = {}
+    if names:
+        skill_ids = dict(db.execute(select(Skill.name, Skill.id).where(Skill.name.in_(names))).all())
+        missing = names - set(skill_ids)
+        if missing:
+            dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+            now = datetime.utcnow()
+            db.execute(dialect.insert(Skill.__table__).on_conflict_do_nothing(index_elements=["name"]),
+                       [{"name": name, "created_at": now} for name in missing])
+            skill_ids.update(db.execute(select(Skill.name, Skill.id).where(Skill.name.in_(missing))).all())
+    if updated_ids:
+        db.execute(delete(InternshipSkill.__table__).where(InternshipSkill.__table__.c.internship_id.in_(updated_ids)))
+    links = [
+        {"internship_id": internship_id, "skill_id": skill_ids[name]}
+        for internship_id, skills in skills_by_internship.items()
+        for name in skills
+    ]
+    if links:
+        db.execute(InternshipSkill.__table__.insert(), links)
+
+
+def import_internships(db: Session, employer_profile_id: int, raw_rows: list) -> dict:
+    """
+    Validate and upsert internships for one company in a single transaction.
+
+    Returns:
+        dict: created/updated/failed counts, the ids written and one result per input row
+    """
+    valid, results = _validate(raw_rows)
+
+    requested_ids = [row_id for _, row_id, _ in valid if row_id is not None]
+    existing = {}
+    for start in range(0, len(requested_ids), BATCH_SIZE):
+        for row in db.execute(select(
+            _internships.c.id, _internships.c.employer_profile_id, _internships.c.status,
+            _internships.c.date_posted, _internships.c.is_suspended
+        ).where(_internships.c.id.in_(requested_ids[start:start + BATCH_SIZE]))).all():
+            existing[row.id] = row
+
+    now = datetime.utcnow()
+    today = date.today()
+    params, visible, skills_by_internship = [], {}, {}
+    created_ids, updated_ids = [], []
+    for index, row_id, data in valid:
+        current = existing.get(row_id) if row_id is not None else None
+        if current is not None and current.employer_profile_id != employer_profile_id:
+            results.append({"row": index, "id": row_id, "status": "error",
+                            "errors": [{"loc": ["id"], "msg": "Internship not found"}]})
+            continue
+        internship_id = row_id or str(uuid.uuid4())
+        if current is not None:
+            # Like PUT /internships/{id}: keep the current status and posting date unless given
+            data["status"] = data["status"] or current.status
+            data["date_posted"] = data["date_posted"] or current.date_posted
+            updated_ids.append(internship_id)
+        else:
+            data["status"] = data["status"] or InternshipStatus.ACTIVE.value
+            data["date_posted"] = data["date_posted"] or today
+            created_ids.append(internship_id)
+        params.append({
+            **data,
+            "id": internship_id,
+            "employer_profile_id": employer_profile_id,
+            "is_suspended": False,
+            "applicant_count": 0,
+            "created_at": now,
+            "updated_at": now,
+        })
+        skills_by_internship[internship_id] = parse_skill_set(data["required_skills"] or data["skills"])
+        suspended = bool(current.is_suspended) if current is not None else False
+        visible[internship_id] = (
+            not suspended and data["status"] == InternshipStatus.ACTIVE.value
+            and (data["deadline"] is None or data["deadline"] >= today)
+        )
+        results.append({"row": index, "id": internship_id,
+                        "status": "updated" if current is not None else "created"})
+
+    if params:
+        try:
+            statement = _upsert_statement(db.get_bind().dialect.name)
+            for start in range(0, len(params), BATCH_SIZE):
+                db.execute(statement, params[start:start + BATCH_SIZE])
+            _link_skills(db, skills_by_internship, updated_ids)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        internship_catalog.mark_stale(skills_by_internship)
+        if skill_frequencies.loaded_at is not None:
+            for internship_id, skills in skills_by_internship.items():
+                skill_frequencies.update(('internship', internship_id), skills if visible[internship_id] else None)
+
+    results.sort(key=lambda result: result["row"])
+    return {
+        "created": len(created_ids),
+        "updated": len(updated_ids),
+        "failed": sum(1 for result in results if result["status"] == "error"),
+        "created_ids": created_ids,
+        "updated_ids": updated_ids,
+        "results": results,
+    }
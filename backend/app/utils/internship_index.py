@@ -0,0 +1,43 @@
+"""
+Skill recommendations over publicly visible internships.
+
+Served from `match_engine` (see app/utils/matching.py), which the internship
+catalog snapshot (app/utils/internship_catalog.py) keeps loaded with every
+listed internship. Visibility, refresh and invalidation are the catalog's:
+this module only makes sure the snapshot is fresh and drops postings whose
+deadline has passed.
+"""
+from typing import Iterable, List, Optional
+from sqlalchemy.orm import Session
+from app.utils.internship_catalog import internship_catalog
+from app.utils.matching import SkillWeight, match_engine
+
+
+def recommend(
+    db: Session,
+    user_skills,
+    limit: Optional[int] = None,
+    min_score: float = 0.0,
+    user_level: str = None,
+    skill_weights: Optional[SkillWeight] = None
+) -> List[tuple]:
+    """
+    Return the best (internship_id, match details) pairs for a student.
+
+    Only internships that share at least one skill with the student are scored,
+    so the cost depends on the overlap rather than on the catalog size.
+    """
+    internship_catalog.ensure_fresh(db)
+
+    candidate_ids: Iterable[str] = [
+        internship_id for internship_id in match_engine.candidates(user_skills)
+        if internship_catalog.get(internship_id) is not None
+    ]
+    return match_engine.top_matches(
+        user_skills,
+        candidate_ids,
+        limit=limit,
+        min_score=min_score or 0.0,
+        user_level=user_level,
+        skill_weights=skill_weights
+    )
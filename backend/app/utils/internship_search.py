@@ -0,0 +1,281 @@
+"""
+Full-text search over internships.
+
+The backend is picked from `settings.DATABASE_URL`:
+  - SQLite: an FTS5 virtual table `internships_fts`, ranked with bm25() and
+    highlighted with snippet()
+  - PostgreSQL: a `internship_search_documents` table holding a weighted
+    tsvector per internship behind a GIN index, ranked with ts_rank_cd() and
+    highlighted with ts_headline()
+
+Both are filled and kept in sync by database triggers on `internships`
+(insert/update/delete) and `employer_profiles` (company renames), so writes
+from any code path or script are picked up. `setup_search` creates the
+structures idempotently at startup and backfills them on first run.
+
+Indexed fields: title, description, skills/required_skills, category,
+location and the company name.
+
+Usage (rebuild the search index):
+    python -m app.utils.internship_search
+"""
+import html
+import re
+from typing import List, Optional, Tuple
+from sqlalchemy import column, func, literal, literal_column, table, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query, Session, joinedload
+from app.core.config import settings
+from app.models.internship import Internship
+from app.utils.internship_catalog import visible_internship_filters
+
+IS_SQLITE = settings.DATABASE_URL.startswith("sqlite")
+
+SNIPPET_START = "<mark>"
+SNIPPET_END = "</mark>"
+
+# snippet()/ts_headline() copy the indexed text verbatim, so they mark matches
+# with these private-use characters; `highlight` escapes the text and only
+# then turns them into <mark> tags
+_MATCH_START = "\ue000"
+_MATCH_END = "\ue001"
+
+# Set by setup_search; False when the database lacks FTS5 / the setup failed
+search_available = False
+
+_fts = table("internships_fts", column("internship_id"))
+_documents = table("internship_search_documents", column("internship_id"), column("document"))
+
+# bm25 column weights, in internships_fts column order (internship_id is unindexed)
+_BM25_WEIGHTS = (0.0, 10.0, 1.0, 5.0, 2.0, 2.0, 3.0)
+
+_SQLITE_SETUP = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS internships_fts USING fts5(
+        internship_id UNINDEXED, title, description, skills, category, location, company_name,
+        tokenize = 'porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS internships_fts_insert AFTER INSERT ON internships BEGIN
+        INSERT INTO internships_fts (internship_id, title, description, skills, category, location, company_name)
+        VALUES (
+            NEW.id, NEW.title, NEW.description,
+            COALESCE(NEW.skills, '') || ' ' || COALESCE(NEW.required_skills, ''),
+            NEW.category, NEW.location,
+            (SELECT company_name FROM employer_profiles WHERE id = NEW.employer_profile_id)
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS internships_fts_update
+    AFTER UPDATE OF title, description, skills, required_skills, category, location, employer_profile_id
+    ON internships BEGIN
+        DELETE FROM internships_fts WHERE internship_id = OLD.id;
+        INSERT INTO internships_fts (internship_id, title, description, skills, category, location, company_name)
+        VALUES (
+            NEW.id, NEW.title, NEW.description,
+            COALESCE(NEW.skills, '') || ' ' || COALESCE(NEW.required_skills, ''),
+            NEW.category, NEW.location,
+            (SELECT company_name FROM employer_profiles WHERE id = NEW.employer_profile_id)
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS internships_fts_delete AFTER DELETE ON internships BEGIN
+        DELETE FROM internships_fts WHERE internship_id = OLD.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS internships_fts_company AFTER UPDATE OF company_name ON employer_profiles BEGIN
+        UPDATE internships SET title = title WHERE employer_profile_id = NEW.id;
+    END
+    """,
+]
+
+_POSTGRES_SETUP = [
+    """
+    CREATE TABLE IF NOT EXISTS internship_search_documents (
+        internship_id VARCHAR PRIMARY KEY,
+        document TSVECTOR NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_internship_search_documents_document
+    ON internship_search_documents USING GIN (document)
+    """,
+    """
+    CREATE OR REPLACE FUNCTION internship_search_refresh() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            DELETE FROM internship_search_documents WHERE internship_id = OLD.id;
+            RETURN OLD;
+        END IF;
+        INSERT INTO internship_search_documents (internship_id, document)
+        VALUES (
+            NEW.id,
+            setweight(to_tsvector('english', COALESCE(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', COALESCE(NEW.skills, '') || ' ' || COALESCE(NEW.required_skills, '')), 'B') ||
+            setweight(to_tsvector('english',
+                COALESCE(NEW.category, '') || ' ' || COALESCE(NEW.location, '') || ' ' ||
+                COALESCE((SELECT company_name FROM employer_profiles WHERE id = NEW.employer_profile_id), '')
+            ), 'C') ||
+            setweight(to_tsvector('english', COALESCE(NEW.description, '')), 'D')
+        )
+        ON CONFLICT (internship_id) DO UPDATE SET document = EXCLUDED.document;
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS internships_search_refresh ON internships",
+    """
+    CREATE TRIGGER internships_search_refresh
+    AFTER INSERT OR DELETE OR UPDATE OF title, description, skills, required_skills, category, location, employer_profile_id
+    ON internships FOR EACH ROW EXECUTE FUNCTION internship_search_refresh()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION internship_search_company_refresh() RETURNS trigger AS $$
+    BEGIN
+        UPDATE internships SET title = title WHERE employer_profile_id = NEW.id;
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS employer_profiles_search_refresh ON employer_profiles",
+    """
+    CREATE TRIGGER employer_profiles_search_refresh
+    AFTER UPDATE OF company_name ON employer_profiles
+    FOR EACH ROW EXECUTE FUNCTION internship_search_company_refresh()
+    """,
+]
+
+
+def _search_table() -> str:
+    return "internships_fts" if IS_SQLITE else "internship_search_documents"
+
+
+def rebuild_search_index(connection) -> None:
+    """Re-run the sync triggers for every internship (a no-op UPDATE fires them)"""
+    connection.execute(text(f"DELETE FROM {_search_table()}"))
+    connection.execute(text("UPDATE internships SET title = title"))
+
+
+def setup_search(engine: Engine) -> bool:
+    """Create the search table, index and triggers; backfill when empty. Returns availability."""
+    global search_available
+    try:
+        with engine.begin() as connection:
+            for statement in (_SQLITE_SETUP if IS_SQLITE else _POSTGRES_SETUP):
+                connection.execute(text(statement))
+            indexed = connection.execute(text(f"SELECT COUNT(*) FROM {_search_table()}")).scalar()
+            if not indexed and connection.execute(text("SELECT COUNT(*) FROM internships")).scalar():
+                rebuild_search_index(connection)
+                print("Internship search index backfilled")
+        search_available = True
+    except Exception as e:
+        print(f"⚠️  Internship search unavailable: {e}")
+        search_available = False
+    return search_available
+
+
+def _fts5_query(q: str) -> Optional[str]:
+    # Quote every word so user input can't produce FTS5 syntax errors;
+    # the last word is matched as a prefix (search-as-you-type)
+    words = re.findall(r"\w+", q)
+    if not words:
+        return None
+    return " ".join(f'"{word}"' for word in words) + "*"
+
+
+def search_query(db: Session, q: str) -> Optional[Tuple[Query, object, object]]:
+    """
+    Build the ranked search over visible internships.
+
+    Returns:
+        (query, rank expression, snippet expression), or None when `q` has no
+        searchable words. Lower rank is better on SQLite (bm25), so callers
+        should use `order_by_rank`; snippets are raw text and must go through
+        `highlight` before they are returned.
+    """
+    if IS_SQLITE:
+        match = _fts5_query(q)
+        if match is None:
+            return None
+        fts = literal_column("internships_fts")
+        rank = func.bm25(fts, *_BM25_WEIGHTS)
+        snippet = func.snippet(fts, -1, _MATCH_START, _MATCH_END, "…", 16)
+        query = db.query(Internship).join(
+            _fts, _fts.c.internship_id == Internship.id
+        ).filter(fts.op("MATCH")(match))
+    else:
+        if not re.search(r"\w", q):
+            return None
+        tsquery = func.websearch_to_tsquery("english", q)
+        rank = func.ts_rank_cd(_documents.c.document, tsquery)
+        snippet = func.ts_headline(
+            "english",
+            func.coalesce(Internship.description, "") + literal(" ") + func.coalesce(Internship.skills, ""),
+            tsquery,
+            f"StartSel={_MATCH_START}, StopSel={_MATCH_END}, MaxFragments=2, MaxWords=24, MinWords=8"
+        )
+        query = db.query(Internship).join(
+            _documents, _documents.c.internship_id == Internship.id
+        ).filter(_documents.c.document.op("@@")(tsquery))
+    return query.filter(*visible_internship_filters()), rank, snippet
+
+
+def highlight(snippet: Optional[str]) -> Optional[str]:
+    """HTML-escape a snippet built by `search_query` and wrap its matches in <mark> tags"""
+    if snippet is None:
+        return None
+    return html.escape(snippet).replace(_MATCH_START, SNIPPET_START).replace(_MATCH_END, SNIPPET_END)
+
+
+def order_by_rank(rank):
+    return rank.asc() if IS_SQLITE else rank.desc()
+
+
+def search_internships(db: Session, q: str, skip: int = 0, limit: int = 20) -> Tuple[int, List[tuple]]:
+    """
+    Ranked full-text search over visible internships.
+
+    Returns:
+        (total matches, [(internship, score, snippet), ...]) for the requested page.
+        Higher scores are better on both backends; snippets are HTML-escaped
+        with the matched terms in <mark> tags.
+    """
+    built = search_query(db, q)
+    if built is None:
+        return 0, []
+    query, rank, snippet = built
+    total = query.count()
+    rows = query.options(joinedload(Internship.employer_profile)).add_columns(
+        rank.label("rank"), snippet.label("snippet")
+    ).order_by(order_by_rank(rank), Internship.id).offset(skip).limit(limit).all()
+    # bm25 is negative with lower = better; flip it so scores read the same way on both backends
+    return total, [
+        (internship, -score if IS_SQLITE else score, highlight(snippet_text))
+        for internship, score, snippet_text in rows
+    ]
+
+
+def matching_internship_ids(db: Session, q: str):
+    """Subquery of internship ids matching `q` (None when `q` has no searchable words)"""
+    if IS_SQLITE:
+        match = _fts5_query(q)
+        if match is None:
+            return None
+        return db.query(_fts.c.internship_id).filter(literal_column("internships_fts").op("MATCH")(match)).subquery()
+    if not re.search(r"\w", q):
+        return None
+    return db.query(_documents.c.internship_id).filter(
+        _documents.c.document.op("@@")(func.websearch_to_tsquery("english", q))
+    ).subquery()
+
+
+if __name__ == "__main__":
+    from app.db.session import engine
+    if setup_search(engine):
+        with engine.begin() as connection:
+            rebuild_search_index(connection)
+        print("Internship search index rebuilt")
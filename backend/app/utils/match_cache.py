@@ -0,0 +1,148 @@
+"""
+Per-process LRU/TTL cache for match results.
+
+`LRUCache` itself is generic (facet counts use it too); `match_cache` is
+the instance holding match results. Its entries are keyed by
+(student_profile.id, student_profile.updated_at, internship.id,
+internship.updated_at), so they go stale on their own as soon as either side
+is edited; the TTL only bounds how long unused entries linger.
+No external service is involved - every worker keeps its own cache.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Sequence
+from app.core.config import settings
+from app.utils.matching import SkillWeight, calculate_detailed_match, calculate_detailed_match_batch
+
+
+class LRUCache:
+    """Thread-safe LRU cache with a size bound, TTL and hit/miss/eviction counters"""
+
+    def __init__(self, maxsize: int = 10000, ttl_seconds: float = 600):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable):
+        """Return the cached value or None (counts a hit or a miss)"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+match_cache = LRUCache(
+    maxsize=settings.MATCH_CACHE_SIZE,
+    ttl_seconds=settings.MATCH_CACHE_TTL_SECONDS
+)
+
+
+def match_cache_key(student_profile, internship) -> Optional[tuple]:
+    """Cache key for a student/internship pair (None when either side is unsaved)"""
+    if student_profile is None or internship is None:
+        return None
+    if student_profile.id is None or internship.id is None:
+        return None
+    return (student_profile.id, student_profile.updated_at, internship.id, internship.updated_at)
+
+
+def cached_detailed_match(
+    student_profile,
+    internship,
+    user_skills: str,
+    required_skills: str,
+    user_level: str = None,
+    internship_level: str = None
+) -> dict:
+    """`calculate_detailed_match` memoized on profile and posting versions"""
+    key = match_cache_key(student_profile, internship)
+    if key is not None:
+        match_details = match_cache.get(key)
+        if match_details is not None:
+            return match_details
+
+    match_details = calculate_detailed_match(user_skills, required_skills, user_level, internship_level)
+    if key is not None:
+        match_cache.set(key, match_details)
+    return match_details
+
+
+def cached_detailed_match_batch(
+    student_profiles: Sequence,
+    students_skills: Sequence[str],
+    internship,
+    required_skills: str,
+    internship_level: str = None,
+    skill_weights: Optional[SkillWeight] = None
+) -> List[dict]:
+    """Batch variant: serves cached pairs and scores only the misses with NumPy.
+
+    Weighted (IDF) scores depend on the whole catalog and bypass the cache.
+    """
+    if skill_weights is not None:
+        return calculate_detailed_match_batch(
+            students_skills,
+            required_skills=required_skills,
+            internship_level=internship_level,
+            skill_weights=skill_weights
+        )
+
+    keys = [match_cache_key(student_profile, internship) for student_profile in student_profiles]
+    results = [match_cache.get(key) if key is not None else None for key in keys]
+
+    missing = [i for i, match_details in enumerate(results) if match_details is None]
+    if missing:
+        computed = calculate_detailed_match_batch(
+            [students_skills[i] for i in missing],
+            required_skills=required_skills,
+            internship_level=internship_level
+        )
+        for i, match_details in zip(missing, computed):
+            results[i] = match_details
+            if keys[i] is not None:
+                match_cache.set(keys[i], match_details)
+    return results
@@ -0,0 +1,127 @@
+"""
+Persisted application match scores.
+
+`Application.match_score` stores the overall match percentage so applicant
+lists can be ranked with ORDER BY in the database. Scores are computed when a
+student applies and recomputed in the background whenever the student's
+skills or the internship's skills/level change.
+"""
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.db.session import SessionLocal
+from app.models.application import Application
+from app.models.internship import Internship
+from app.models.profile import StudentProfile
+from app.utils.matching import calculate_detailed_match, calculate_detailed_match_batch
+
+# Internship fields that affect match scores
+MATCH_FIELDS = ('skills', 'required_skills', 'level')
+
+
+def student_skills_string(student_profile: Optional[StudentProfile]) -> str:
+    """Return a student's skills as the comma-separated string the matcher expects"""
+    if not student_profile or not student_profile.skills:
+        return ""
+    if isinstance(student_profile.skills, list):
+        return ", ".join(student_profile.skills)
+    return str(student_profile.skills)
+
+
+def compute_match_score(student_profile: Optional[StudentProfile], internship: Internship) -> float:
+    """Overall match percentage of a student for an internship"""
+    return calculate_detailed_match(
+        user_skills=student_skills_string(student_profile),
+        required_skills=internship.required_skills or internship.skills,
+        user_level=None,
+        internship_level=internship.level
+    )['match_percentage']
+
+
+def recompute_internship_match_scores(internship_id: str, db: Optional[Session] = None) -> int:
+    """
+    Recompute match scores for every application to an internship.
+
+    Args:
+        internship_id: Internship whose skills or level changed
+        db: Database session (optional, will create new one if not provided)
+
+    Returns:
+        int: Number of applications updated
+    """
+    close_session = False
+    if db is None:
+        db = SessionLocal()
+        close_session = True
+
+    try:
+        internship = db.query(Internship).filter(Internship.id == internship_id).first()
+        if not internship:
+            return 0
+
+        applications = db.query(Application).filter(Application.internship_id == internship_id).all()
+        if not applications:
+            return 0
+
+        profiles = {
+            profile.user_id: profile
+            for profile in db.query(StudentProfile).filter(
+                StudentProfile.user_id.in_([app.student_id for app in applications])
+            ).all()
+        }
+        all_match_details = calculate_detailed_match_batch(
+            [student_skills_string(profiles.get(app.student_id)) for app in applications],
+            required_skills=internship.required_skills or internship.skills,
+            internship_level=internship.level
+        )
+        for app, match_details in zip(applications, all_match_details):
+            app.match_score = match_details['match_percentage']
+
+        db.commit()
+        return len(applications)
+
+    except Exception as e:
+        db.rollback()
+        print(f"Failed to recompute match scores for internship {internship_id}: {e}")
+        return 0
+
+    finally:
+        if close_session:
+            db.close()
+
+
+def recompute_student_match_scores(student_id: int, db: Optional[Session] = None) -> int:
+    """
+    Recompute match scores for every application made by a student.
+
+    Args:
+        student_id: User id of the student whose skills changed
+        db: Database session (optional, will create new one if not provided)
+
+    Returns:
+        int: Number of applications updated
+    """
+    close_session = False
+    if db is None:
+        db = SessionLocal()
+        close_session = True
+
+    try:
+        student_profile = db.query(StudentProfile).filter(StudentProfile.user_id == student_id).first()
+        rows = db.query(Application, Internship).join(
+            Internship, Application.internship_id == Internship.id
+        ).filter(Application.student_id == student_id).all()
+
+        for app, internship in rows:
+            app.match_score = compute_match_score(student_profile, internship)
+
+        db.commit()
+        return len(rows)
+
+    except Exception as e:
+        db.rollback()
+        print(f"Failed to recompute match scores for student {student_id}: {e}")
+        return 0
+
+    finally:
+        if close_session:
+            db.close()
@@ -2,14 +2,76 @@
 Matching algorithm for calculating compatibility between interns and internships.
 This module provides functions to calculate match percentages based on skills and requirements.
 """
+import heapq
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
-def calculate_skills_match(user_skills: str, required_skills: str) -> float:
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is listed in requirements.txt
+    np = None
+
+LEVEL_HIERARCHY = {'beginner': 1, 'intermediate': 2, 'advanced': 3}
+
+# Skill scoring modes selectable per request:
+# - standard: every required skill counts the same
+# - idf: required skills are weighted by rarity (see app/utils/skill_frequency.py)
+SCORING_MODES = ('standard', 'idf')
+
+SkillWeight = Callable[[str], float]
+
+
+def parse_skill_set(skills: Union[str, Iterable[str], None]) -> set:
+    """
+    Parse a skills field into a set of normalized (stripped, lowercased) skills.
+
+    Accepts a comma-separated string (Internship.skills / required_skills) or a
+    list (StudentProfile.skills JSON array). Lists are joined with commas first so
+    that both forms normalize exactly the way the endpoints always have.
+    """
+    if not skills:
+        return set()
+    if not isinstance(skills, str):
+        skills = ", ".join(str(skill) for skill in skills)
+    return set(skill.strip().lower() for skill in skills.split(',') if skill.strip())
+
+
+def calculate_level_match(user_level: str = None, internship_level: str = None) -> tuple:
+    """
+    Calculate level compatibility.
+
+    Returns:
+        Tuple of (level_match_percentage, level_compatible)
+    """
+    if not (user_level and internship_level):
+        return 100.0, True
+
+    user_lvl = LEVEL_HIERARCHY.get(user_level.lower(), 1)
+    required_lvl = LEVEL_HIERARCHY.get(internship_level.lower(), 1)
+
+    # User should meet or exceed required level
+    if user_lvl >= required_lvl:
+        return 100.0, True
+    return (user_lvl / required_lvl) * 100, False
+
+
+def _weighted_skill_match(matching_skills: Iterable[str], required_skills: Iterable[str], skill_weights: SkillWeight) -> float:
+    """Share of the required skills' total weight covered by the matching skills (0-100)"""
+    total_weight = sum(skill_weights(skill) for skill in sorted(required_skills))
+    if not total_weight:
+        return 0.0
+    return (sum(skill_weights(skill) for skill in sorted(matching_skills)) / total_weight) * 100
+
+
+def calculate_skills_match(user_skills: str, required_skills: str, skill_weights: Optional[SkillWeight] = None) -> float:
     """
     Calculate the match percentage between user skills and required skills.
     
     Args:
         user_skills: Comma-separated string of user's skills
         required_skills: Comma-separated string of required skills for the internship
+        skill_weights: Optional weight per normalized skill (e.g. IDF); equal weights if omitted
     
     Returns:
         Float representing match percentage (0-100)
@@ -26,6 +88,8 @@ def calculate_skills_match(user_skills: str, required_skills: str) -> float:
 
     # Calculate exact matches
     matching_skills = user_skills_set.intersection(required_skills_set)
+    if skill_weights is not None:
+        return round(_weighted_skill_match(matching_skills, required_skills_set, skill_weights), 2)
     exact_match_percentage = (len(matching_skills) / len(required_skills_set)) * 100
 
     return round(exact_match_percentage, 2)
@@ -35,7 +99,8 @@ def calculate_detailed_match(
     user_skills: str,
     required_skills: str,
     user_level: str = None,
-    internship_level: str = None
+    internship_level: str = None,
+    skill_weights: Optional[SkillWeight] = None
 ) -> dict:
     """
     Calculate detailed match information including skills breakdown and level compatibility.
@@ -45,13 +110,14 @@ def calculate_detailed_match(
         required_skills: Comma-separated string of required skills
         user_level: User's experience level (optional)
         internship_level: Required experience level for internship (optional)
+        skill_weights: Optional weight per normalized skill (e.g. IDF); equal weights if omitted
     
     Returns:
         Dictionary containing match percentage, matched skills, missing skills, and level match
     """
     # Parse skills
-    user_skills_set = set(skill.strip().lower() for skill in (user_skills or "").split(',') if skill.strip())
-    required_skills_set = set(skill.strip().lower() for skill in (required_skills or "").split(',') if skill.strip())
+    user_skills_set = parse_skill_set(user_skills)
+    required_skills_set = parse_skill_set(required_skills)
     
     # Calculate skill match
     matching_skills = user_skills_set.intersection(required_skills_set)
@@ -59,26 +125,15 @@ def calculate_detailed_match(
     extra_skills = user_skills_set - required_skills_set
     
     # Calculate base match percentage
-    if required_skills_set:
-        skill_match = (len(matching_skills) / len(required_skills_set)) * 100
-    else:
+    if not required_skills_set:
         skill_match = 0.0
+    elif skill_weights is not None:
+        skill_match = _weighted_skill_match(matching_skills, required_skills_set, skill_weights)
+    else:
+        skill_match = (len(matching_skills) / len(required_skills_set)) * 100
     
     # Calculate level match bonus (if applicable)
-    level_match = 100.0
-    level_compatible = True
-    
-    if user_level and internship_level:
-        level_hierarchy = {'beginner': 1, 'intermediate': 2, 'advanced': 3}
-        user_lvl = level_hierarchy.get(user_level.lower(), 1)
-        required_lvl = level_hierarchy.get(internship_level.lower(), 1)
-        
-        # User should meet or exceed required level
-        if user_lvl >= required_lvl:
-            level_match = 100.0
-        else:
-            level_match = (user_lvl / required_lvl) * 100
-            level_compatible = False
+    level_match, level_compatible = calculate_level_match(user_level, internship_level)
     
     # Calculate overall match (70% skills, 30% level)
     overall_match = (skill_match * 0.7) + (level_match * 0.3)
@@ -94,3 +149,400 @@ def calculate_detailed_match(
         'total_required_skills': len(required_skills_set),
         'total_matched_skills': len(matching_skills)
     }
+
+
+
+def calculate_detailed_match_batch(
+    students_skills: Sequence,
+    required_skills: str,
+    internship_level: str = None,
+    user_levels: Optional[Sequence[str]] = None,
+    skill_weights: Optional[SkillWeight] = None
+) -> List[dict]:
+    """
+    Calculate detailed matches for many students against one internship at once.
+
+    Builds a students x required-skills boolean matrix and computes the skill,
+    level and overall scores for every student with NumPy in one pass. Every
+    numeric field is identical to what ``calculate_detailed_match`` returns for
+    the same student; skill lists contain the same skills.
+
+    Args:
+        students_skills: One skills field per student (comma-separated string or list)
+        required_skills: Comma-separated string of required skills
+        internship_level: Required experience level for internship (optional)
+        user_levels: One experience level per student (optional)
+        skill_weights: Per-skill weight function; weighted scores are
+            computed student by student
+
+    Returns:
+        List of match dictionaries, in the same order as ``students_skills``
+    """
+    if user_levels is None:
+        user_levels = [None] * len(students_skills)
+
+    if np is None or skill_weights is not None:
+        return [
+            calculate_detailed_match(skills, required_skills, level, internship_level, skill_weights)
+            for skills, level in zip(students_skills, user_levels)
+        ]
+
+    student_sets = [parse_skill_set(skills) for skills in students_skills]
+    required = sorted(parse_skill_set(required_skills))
+    required_set = set(required)
+    column = {skill: i for i, skill in enumerate(required)}
+    total_required = len(required)
+
+    # Student x skill membership matrix
+    has_skill = np.zeros((len(student_sets), total_required), dtype=bool)
+    for row, skills in enumerate(student_sets):
+        for skill in skills:
+            col = column.get(skill)
+            if col is not None:
+                has_skill[row, col] = True
+
+    matched_counts = has_skill.sum(axis=1)
+    if total_required:
+        skill_match = (matched_counts / total_required) * 100
+    else:
+        skill_match = np.zeros(len(student_sets))
+
+    # Level match: students below the required level get user/required * 100
+    level_match = np.full(len(student_sets), 100.0)
+    level_compatible = np.ones(len(student_sets), dtype=bool)
+    if internship_level:
+        required_lvl = LEVEL_HIERARCHY.get(internship_level.lower(), 1)
+        user_lvls = np.array([
+            LEVEL_HIERARCHY.get(level.lower(), 1) if level else required_lvl
+            for level in user_levels
+        ])
+        below = user_lvls < required_lvl
+        level_match = np.where(below, (user_lvls / required_lvl) * 100, 100.0)
+        level_compatible = ~below
+
+    overall_match = (skill_match * 0.7) + (level_match * 0.3)
+
+    # Round with Python's round() so results match the scalar function exactly
+    overall_list = overall_match.tolist()
+    skill_list = skill_match.tolist()
+    level_list = level_match.tolist()
+    compatible_list = level_compatible.tolist()
+    counts_list = matched_counts.tolist()
+
+    results = []
+    for row, skills in enumerate(student_sets):
+        row_mask = has_skill[row]
+        results.append({
+            'match_percentage': round(overall_list[row], 2),
+            'skill_match_percentage': round(skill_list[row], 2),
+            'level_match_percentage': round(level_list[row], 2),
+            'matching_skills': [skill for skill, hit in zip(required, row_mask) if hit],
+            'missing_skills': [skill for skill, hit in zip(required, row_mask) if not hit],
+            'extra_skills': list(skills - required_set),
+            'level_compatible': compatible_list[row],
+            'total_required_skills': total_required,
+            'total_matched_skills': counts_list[row]
+        })
+    return results
+
+
+class SkillVocabulary:
+    """
+    Global skill vocabulary that interns every normalized skill into a small integer id.
+
+    Skill sets are then represented as Python integers where bit ``i`` is set when
+    the skill with id ``i`` is present, so intersections are a single AND and
+    counts are a popcount.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def intern(self, skill: str) -> int:
+        """Return the id for a normalized skill, assigning a new one if needed"""
+        skill_id = self._ids.get(skill)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(skill)
+                if skill_id is None:
+                    skill_id = len(self._names)
+                    self._names.append(skill)
+                    self._ids[skill] = skill_id
+        return skill_id
+
+    def lookup(self, skill: str) -> Optional[int]:
+        """Return the id for a normalized skill, or None if it was never interned"""
+        return self._ids.get(skill)
+
+    def encode(self, skills: Union[str, Iterable[str], None]) -> int:
+        """Encode a skills field (string or list) into a bitset"""
+        bits = 0
+        for skill in parse_skill_set(skills):
+            bits |= 1 << self.intern(skill)
+        return bits
+
+    def encode_known(self, skills: Union[str, Iterable[str], None]) -> Tuple[int, List[str]]:
+        """
+        Encode a skills field without interning anything new.
+
+        Returns:
+            (bitset of the skills already in the vocabulary, the other skills)
+        """
+        bits = 0
+        unknown = []
+        for skill in parse_skill_set(skills):
+            skill_id = self._ids.get(skill)
+            if skill_id is None:
+                unknown.append(skill)
+            else:
+                bits |= 1 << skill_id
+        return bits, unknown
+
+    def decode(self, bits: int) -> List[str]:
+        """Decode a bitset back into the list of skill names"""
+        names = []
+        while bits:
+            lowest = bits & -bits
+            names.append(self._names[lowest.bit_length() - 1])
+            bits ^= lowest
+        return names
+
+
+class SkillMatchEngine:
+    """
+    Bitset-based matching engine over the internship catalog.
+
+    Each indexed internship keeps its required skills as a precomputed bitset, so
+    scoring a student against the whole catalog parses the student's skills once
+    and then costs one AND plus two popcounts per internship. Results have the
+    same shape and values as ``calculate_detailed_match``.
+
+    The engine also keeps an inverted index from skill id to internship ids, so
+    top-K recommendations only score postings that share a skill with the student.
+
+    Only ``index`` adds skills to the vocabulary. Student skills are encoded
+    lookup-only: a skill no posting requires can't match anything, and is
+    reported as an extra skill without being interned.
+    """
+
+    def __init__(self, vocabulary: Optional[SkillVocabulary] = None):
+        self.vocabulary = vocabulary or SkillVocabulary()
+        # internship_id -> (raw required skills, bitset, required count, level)
+        self._entries: Dict[str, tuple] = {}
+        # skill id -> ids of internships requiring that skill
+        self._postings: Dict[int, Set[str]] = defaultdict(set)
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, internship_id) -> bool:
+        return internship_id in self._entries
+
+    def index(self, internship_id: str, required_skills: str, level: str = None) -> None:
+        """Add or refresh an internship; unchanged skill strings are not re-parsed"""
+        required_skills = required_skills or ""
+        entry = self._entries.get(internship_id)
+        if entry is not None and entry[0] == required_skills:
+            if entry[3] != level:
+                self._entries[internship_id] = (entry[0], entry[1], entry[2], level)
+            return
+
+        bits = self.vocabulary.encode(required_skills)
+        with self._lock:
+            self._unlink(internship_id)
+            self._entries[internship_id] = (required_skills, bits, bits.bit_count(), level)
+            for skill_id in self._bit_ids(bits):
+                self._postings[skill_id].add(internship_id)
+
+    def replace(self, internships: Iterable[Tuple[str, str, str]]) -> None:
+        """
+        Swap the indexed set for (internship_id, required skills, level) triples.
+
+        The new entries and postings are built off to the side and swapped in
+        with one assignment, so concurrent readers see either the old or the
+        new set, never a partly filled one.
+        """
+        entries: Dict[str, tuple] = {}
+        postings: Dict[int, Set[str]] = defaultdict(set)
+        for internship_id, required_skills, level in internships:
+            required_skills = required_skills or ""
+            previous = self._entries.get(internship_id)
+            # Unchanged skill strings keep their bitset
+            bits = previous[1] if previous is not None and previous[0] == required_skills \
+                else self.vocabulary.encode(required_skills)
+            entries[internship_id] = (required_skills, bits, bits.bit_count(), level)
+            for skill_id in self._bit_ids(bits):
+                postings[skill_id].add(internship_id)
+        with self._lock:
+            self._entries, self._postings = entries, postings
+
+    def remove(self, internship_id: str) -> None:
+        """Drop an internship from the engine"""
+        with self._lock:
+            self._unlink(internship_id)
+            self._entries.pop(internship_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._postings.clear()
+
+    @staticmethod
+    def _bit_ids(bits: int) -> List[int]:
+        ids = []
+        while bits:
+            lowest = bits & -bits
+            ids.append(lowest.bit_length() - 1)
+            bits ^= lowest
+        return ids
+
+    def _unlink(self, internship_id: str) -> None:
+        entry = self._entries.get(internship_id)
+        if entry is None:
+            return
+        for skill_id in self._bit_ids(entry[1]):
+            posting = self._postings.get(skill_id)
+            if posting is not None:
+                posting.discard(internship_id)
+                if not posting:
+                    del self._postings[skill_id]
+
+    def _skill_match(self, matching_bits: int, required_bits: int, required_count: int,
+                     skill_weights: Optional[SkillWeight] = None) -> float:
+        if not required_count:
+            return 0.0
+        if skill_weights is not None:
+            decode = self.vocabulary.decode
+            return _weighted_skill_match(decode(matching_bits), decode(required_bits), skill_weights)
+        return (matching_bits.bit_count() / required_count) * 100
+
+    def _score(self, user_bits: int, entry: tuple, user_level: str = None,
+               skill_weights: Optional[SkillWeight] = None, unknown_skills: Sequence[str] = ()) -> dict:
+        _, required_bits, required_count, internship_level = entry
+        matching_bits = user_bits & required_bits
+        matched_count = matching_bits.bit_count()
+
+        skill_match = self._skill_match(matching_bits, required_bits, required_count, skill_weights)
+
+        level_match, level_compatible = calculate_level_match(user_level, internship_level)
+        overall_match = (skill_match * 0.7) + (level_match * 0.3)
+
+        decode = self.vocabulary.decode
+        return {
+            'match_percentage': round(overall_match, 2),
+            'skill_match_percentage': round(skill_match, 2),
+            'level_match_percentage': round(level_match, 2),
+            'matching_skills': decode(matching_bits),
+            'missing_skills': decode(required_bits & ~user_bits),
+            'extra_skills': decode(user_bits & ~required_bits) + list(unknown_skills),
+            'level_compatible': level_compatible,
+            'total_required_skills': required_count,
+            'total_matched_skills': matched_count
+        }
+
+    def match(self, user_skills, internship_id: str, user_level: str = None,
+              skill_weights: Optional[SkillWeight] = None) -> Optional[dict]:
+        """Score one student against one indexed internship (None if not indexed)"""
+        entry = self._entries.get(internship_id)
+        if entry is None:
+            return None
+        user_bits, unknown_skills = self.vocabulary.encode_known(user_skills)
+        return self._score(user_bits, entry, user_level, skill_weights, unknown_skills)
+
+    def match_all(
+        self,
+        user_skills,
+        internship_ids: Optional[Iterable[str]] = None,
+        user_level: str = None,
+        skill_weights: Optional[SkillWeight] = None
+    ) -> Dict[str, dict]:
+        """
+        Score one student against many indexed internships.
+
+        Args:
+            user_skills: Student skills (comma-separated string or list)
+            internship_ids: Internships to score (defaults to every indexed internship)
+            user_level: Student experience level (optional)
+            skill_weights: Optional weight per normalized skill (e.g. IDF)
+
+        Returns:
+            Dictionary mapping internship id to its detailed match
+        """
+        user_bits, unknown_skills = self.vocabulary.encode_known(user_skills)
+        entries = self._entries
+        if internship_ids is None:
+            internship_ids = list(entries)
+
+        results = {}
+        for internship_id in internship_ids:
+            entry = entries.get(internship_id)
+            if entry is not None:
+                results[internship_id] = self._score(user_bits, entry, user_level, skill_weights, unknown_skills)
+        return results
+
+
+    def candidates(self, user_skills) -> Set[str]:
+        """Return ids of indexed internships sharing at least one skill with the student"""
+        found: Set[str] = set()
+        for skill in parse_skill_set(user_skills):
+            skill_id = self.vocabulary.lookup(skill)
+            if skill_id is not None:
+                found.update(self._postings.get(skill_id, ()))
+        return found
+
+    def top_matches(
+        self,
+        user_skills,
+        internship_ids: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        min_score: float = 0.0,
+        user_level: str = None,
+        skill_weights: Optional[SkillWeight] = None
+    ) -> List[Tuple[str, dict]]:
+        """
+        Return the best matching internships, highest score first.
+
+        Only internships sharing at least one skill with the student are scored
+        (or ``internship_ids`` when given). Scores are computed as bare numbers,
+        the best ``limit`` are kept in a heap, and the detailed breakdown is built
+        only for the survivors.
+
+        Returns:
+            List of (internship_id, match details) tuples
+        """
+        user_bits, unknown_skills = self.vocabulary.encode_known(user_skills)
+        if internship_ids is None:
+            internship_ids = self.candidates(user_skills)
+
+        entries = self._entries
+        scored = []
+        for internship_id in internship_ids:
+            entry = entries.get(internship_id)
+            if entry is None:
+                continue
+            _, required_bits, required_count, internship_level = entry
+            skill_match = self._skill_match(user_bits & required_bits, required_bits, required_count, skill_weights)
+            level_match, _ = calculate_level_match(user_level, internship_level)
+            score = round((skill_match * 0.7) + (level_match * 0.3), 2)
+            if score >= min_score:
+                scored.append((score, internship_id, entry))
+
+        if limit is not None:
+            best = heapq.nlargest(limit, scored, key=lambda item: item[0])
+        else:
+            best = sorted(scored, key=lambda item: item[0], reverse=True)
+
+        return [
+            (internship_id, self._score(user_bits, entry, user_level, skill_weights, unknown_skills))
+            for _, internship_id, entry in best
+        ]
+
+
+# Process-wide engine shared by the internship endpoints
+match_engine = SkillMatchEngine()
@@ -0,0 +1,209 @@
+"""
+Approximate skill-set similarity with MinHash and locality-sensitive hashing.
+
+Optional companion to app/utils/matching.py for very large catalogs. Each
+internship's or student's skill set is summarized by a MinHash signature and
+split into LSH bands; two skill sets land in the same bucket of some band with
+a probability that rises steeply with their Jaccard similarity. Candidate
+lookup therefore touches only a few buckets, and the candidates are then
+rescored exactly with `calculate_detailed_match`.
+
+Precision/recall is controlled by `num_perm` (signature length) and the
+`bands` x `rows` split; `MinHashLSH.for_threshold` picks the split for a
+target Jaccard threshold.
+"""
+import hashlib
+import random
+import threading
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+from app.utils.matching import calculate_detailed_match, parse_skill_set
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is listed in requirements.txt
+    np = None
+
+# Mersenne prime used for the universal hash family (fits int64 products with 31-bit inputs)
+_PRIME = (1 << 31) - 1
+_MAX_HASH = (1 << 31) - 1
+
+
+def _skill_hash(skill: str) -> int:
+    """Stable 31-bit hash of a normalized skill (independent of PYTHONHASHSEED)"""
+    return int.from_bytes(hashlib.blake2b(skill.encode("utf-8"), digest_size=4).digest(), "big") & _MAX_HASH
+
+
+def _collision_probability(similarity: float, bands: int, rows: int) -> float:
+    return 1 - (1 - similarity ** rows) ** bands
+
+
+def _integrate(f, a: float, b: float, steps: int = 100) -> float:
+    width = (b - a) / steps
+    return sum(f(a + (i + 0.5) * width) for i in range(steps)) * width
+
+
+class MinHashLSH:
+    """
+    MinHash signatures stored in banded LSH buckets.
+
+    Args:
+        num_perm: Number of hash permutations (signature length)
+        bands: Number of LSH bands; `num_perm` must be divisible by it
+        kind: What is stored, "internship" or "student". Decides the direction
+            of the exact rescoring step.
+        seed: Seed for the hash permutations
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 32, kind: str = "internship", seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        if kind not in ("internship", "student"):
+            raise ValueError("kind must be 'internship' or 'student'")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.kind = kind
+
+        rng = random.Random(seed)
+        self._a = [rng.randint(1, _PRIME - 1) for _ in range(num_perm)]
+        self._b = [rng.randint(0, _PRIME - 1) for _ in range(num_perm)]
+        if np is not None:
+            self._a_arr = np.array(self._a, dtype=np.int64)
+            self._b_arr = np.array(self._b, dtype=np.int64)
+
+        self._buckets: List[Dict[Tuple[int, ...], Set[Hashable]]] = [defaultdict(set) for _ in range(bands)]
+        self._signatures: Dict[Hashable, Tuple[int, ...]] = {}
+        self._skills: Dict[Hashable, str] = {}
+        self._levels: Dict[Hashable, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_threshold(
+        cls,
+        threshold: float,
+        num_perm: int = 128,
+        false_positive_weight: float = 0.5,
+        false_negative_weight: float = 0.5,
+        **kwargs
+    ) -> "MinHashLSH":
+        """
+        Build an index whose bands/rows split best separates pairs above and
+        below a Jaccard `threshold`. Raise `false_negative_weight` for recall,
+        `false_positive_weight` for precision.
+        """
+        best = None
+        for bands in range(1, num_perm + 1):
+            if num_perm % bands:
+                continue
+            rows = num_perm // bands
+            false_positive = _integrate(lambda s: _collision_probability(s, bands, rows), 0.0, threshold)
+            false_negative = _integrate(lambda s: 1 - _collision_probability(s, bands, rows), threshold, 1.0)
+            error = false_positive * false_positive_weight + false_negative * false_negative_weight
+            if best is None or error < best[0]:
+                best = (error, bands)
+        return cls(num_perm=num_perm, bands=best[1], **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, skills) -> Optional[Tuple[int, ...]]:
+        """MinHash signature of a skills field (None for an empty skill set)"""
+        hashes = [_skill_hash(skill) for skill in parse_skill_set(skills)]
+        if not hashes:
+            return None
+        if np is not None:
+            values = (self._a_arr[:, None] * np.array(hashes, dtype=np.int64)[None, :] + self._b_arr[:, None]) % _PRIME
+            return tuple(values.min(axis=1).tolist())
+        return tuple(
+            min((a * h + b) % _PRIME for h in hashes)
+            for a, b in zip(self._a, self._b)
+        )
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        rows = self.rows
+        return [signature[band * rows:(band + 1) * rows] for band in range(self.bands)]
+
+    def add(self, key: Hashable, skills, level: str = None) -> None:
+        """Index (or re-index) an internship or student by its skills"""
+        signature = self.signature(skills)
+        with self._lock:
+            self._remove_locked(key)
+            if signature is None:
+                return
+            for band, band_key in enumerate(self._band_keys(signature)):
+                self._buckets[band][band_key].add(key)
+            self._signatures[key] = signature
+            self._skills[key] = skills if isinstance(skills, str) else ", ".join(skills)
+            self._levels[key] = level
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove_locked(key)
+
+    def _remove_locked(self, key: Hashable) -> None:
+        signature = self._signatures.pop(key, None)
+        self._skills.pop(key, None)
+        self._levels.pop(key, None)
+        if signature is None:
+            return
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def candidates(self, skills) -> Set[Hashable]:
+        """Keys sharing at least one LSH bucket with the given skills"""
+        signature = self.signature(skills)
+        if signature is None:
+            return set()
+        found: Set[Hashable] = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            found.update(self._buckets[band].get(band_key, ()))
+        return found
+
+    def estimated_similarity(self, key: Hashable, skills) -> float:
+        """MinHash estimate of the Jaccard similarity between a stored key and skills"""
+        stored = self._signatures.get(key)
+        signature = self.signature(skills)
+        if stored is None or signature is None:
+            return 0.0
+        return sum(1 for x, y in zip(stored, signature) if x == y) / self.num_perm
+
+    def query(
+        self,
+        skills,
+        limit: Optional[int] = None,
+        min_score: float = 0.0,
+        level: str = None,
+        exclude: Iterable[Hashable] = ()
+    ) -> List[Tuple[Hashable, dict]]:
+        """
+        Find approximate candidates and rescore them exactly.
+
+        For an internship index, `skills`/`level` describe the student; for a
+        student index, they describe the internship.
+
+        Returns:
+            List of (key, calculate_detailed_match result), best match first
+        """
+        excluded = set(exclude)
+        results = []
+        for key in self.candidates(skills):
+            if key in excluded:
+                continue
+            stored_skills = self._skills.get(key)
+            if stored_skills is None:
+                continue
+            if self.kind == "internship":
+                match_details = calculate_detailed_match(skills, stored_skills, level, self._levels.get(key))
+            else:
+                match_details = calculate_detailed_match(stored_skills, skills, self._levels.get(key), level)
+            if match_details['match_percentage'] >= min_score:
+                results.append((key, match_details))
+
+        results.sort(key=lambda item: item[1]['match_percentage'], reverse=True)
+        return results[:limit] if limit is not None else results
@@ -0,0 +1,84 @@
+"""
+Offer notification emails.
+
+Sent from a background task after the status change has committed, so the
+request that made the offer never waits on the mail provider. One query
+loads the student, internship and company of every application in the batch.
+"""
+from typing import List, Optional
+from sqlalchemy.orm import Session, joinedload
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.application import Application, ApplicationStatus
+from app.models.internship import Internship
+from app.utils.email import send_email
+
+
+def offer_email(student, internship, company_name: str) -> tuple:
+    """(subject, text body, HTML body) of the offer notification"""
+    frontend_url = getattr(settings, 'FRONTEND_URL', 'http://localhost:8081')
+    offer_link = f"{frontend_url}/student/offers"  # frontend route where student sees offers
+    name = getattr(student, 'full_name', None) or student.email
+    title = internship.title if internship else 'an internship'
+
+    subject = f"You have received an internship offer from {company_name}"
+    body = f"Hello {name},\n\nCongratulations! You have received an offer for the internship '{title}' from {company_name}.\n\nVisit your offers page to view and respond to the offer: {offer_link}\n\nBest regards,\nI-Intern Team"
+    html_body = f"<p>Hello {name},</p>" \
+                f"<p>Congratulations! You have received an offer for the internship '<strong>{title}</strong>' from <strong>{company_name}</strong>.</p>" \
+                f"<p><a href=\"{offer_link}\">Click here to view your offers and respond</a></p>" \
+                f"<p>Best regards,<br/>I-Intern Team</p>"
+    return subject, body, html_body
+
+
+def send_offer_notifications(application_ids: List[str], db: Optional[Session] = None) -> dict:
+    """
+    Email every student whose application is (still) in the offered status
+
+    Args:
+        application_ids: Applications that were just moved to offered
+        db: Database session (optional, will create new one if not provided)
+
+    Returns:
+        dict: Summary with the number of emails sent and failed
+    """
+    close_session = False
+    if db is None:
+        db = SessionLocal()
+        close_session = True
+
+    sent = failed = 0
+    try:
+        applications = db.query(Application).options(
+            joinedload(Application.student),
+            joinedload(Application.internship).joinedload(Internship.employer_profile),
+        ).filter(
+            Application.id.in_(application_ids),
+            Application.status == ApplicationStatus.OFFERED.value
+        ).all()
+
+        for application in applications:
+            student, internship = application.student, application.internship
+            if not student or not getattr(student, 'email', None):
+                print(f"No student email available to send offer notification for {application.id}")
+                continue
+            employer_profile = internship.employer_profile if internship else None
+            company_name = getattr(employer_profile, 'company_name', None) or 'I-Intern'
+            try:
+                if send_email(student.email, *offer_email(student, internship, company_name)):
+                    sent += 1
+                else:
+                    failed += 1
+            except Exception as e:
+                failed += 1
+                print(f"Failed to send offer notification email to {student.email}: {e}")
+
+        return {
+            "success": failed == 0,
+            "sent_count": sent,
+            "failed_count": failed,
+            "message": f"Sent {sent} offer notification(s), {failed} failed"
+        }
+
+    finally:
+        if close_session:
+            db.close()
@@ -0,0 +1,52 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor is an opaque, URL-safe encoding of the sort key of the last row on
+the previous page. The next page is read with `WHERE (key) < (cursor)` on an
+index over the sort key, so every page costs the same no matter how deep the
+client has scrolled (unlike OFFSET, which reads and discards skipped rows).
+"""
+import base64
+import json
+from typing import Any, List, Optional
+from sqlalchemy import and_, or_
+
+# Page size when a client asks for pages without giving a limit
+DEFAULT_PAGE_SIZE = 20
+
+# Upper bound for a single page
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque cursor for a row's sort key (dates/datetimes are stored as ISO strings)"""
+    payload = json.dumps([value.isoformat() if hasattr(value, "isoformat") else value for value in values],
+                         separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Sort key values of a cursor. Raises ValueError for malformed cursors."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def after_desc_nulls_last(column, id_column, last_value: Optional[Any], last_id: Any):
+    """
+    Filter for rows after (last_value, last_id) in
+    ORDER BY column DESC NULLS LAST, id_column DESC.
+    """
+    if last_value is None:
+        # Already inside the trailing NULL block
+        return and_(column.is_(None), id_column < last_id)
+    return or_(
+        column < last_value,
+        and_(column == last_value, id_column < last_id),
+        column.is_(None)
+    )
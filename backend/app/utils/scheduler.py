@@ -0,0 +1,226 @@
+"""
+In-process periodic job scheduler.
+
+`scheduler` runs each registered job every `interval_seconds` from an asyncio
+task started with the app (see app/main.py). Jobs are plain synchronous
+functions taking a Session and returning a summary dict; they run in a worker
+thread so the event loop is never blocked.
+
+Every worker process runs the same loops, so each run first takes the job's
+lease in `job_locks` (a single conditional UPDATE, or an INSERT for a job's
+first run). Only the worker that gets the lease runs the job; the lease lasts
+most of an interval, so the job runs about once per interval across all
+workers; the others keep checking every LEASE_RETRY_SECONDS and take over
+if the lease is not renewed. Lease times use the workers' UTC clocks.
+
+Each run is recorded in `job_runs` (start, duration, outcome, summary), and
+per-worker counters are available from `scheduler.stats()`.
+"""
+import asyncio
+import json
+import os
+import socket
+import time
+import traceback
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from sqlalchemy import delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.db.session import SessionLocal
+from app.models.scheduler import JobLock, JobRun
+from app.utils.applicant_counts import reconcile_applicant_counts
+from app.utils.application_stats import rebuild_daily_application_stats
+from app.utils.archive_internships import archive_expired_internships
+
+# Fraction of the interval a lease lasts; the rest absorbs timer drift between workers
+LEASE_FRACTION = 0.9
+
+# Workers that lost the lease try again this often, so a job still runs on
+# time when the worker that last ran it goes away
+LEASE_RETRY_SECONDS = 300
+
+# Keep job_runs rows this long
+RUN_HISTORY_DAYS = 30
+
+
+@dataclass
+class Job:
+    name: str
+    func: Callable[[Session], dict]
+    interval_seconds: float
+    initial_delay_seconds: float = 60.0
+    # Counters for this worker
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0
+    total_duration_ms: float = 0.0
+    last_started_at: Optional[datetime] = None
+    last_duration_ms: Optional[float] = None
+    last_success: Optional[bool] = None
+    last_error: Optional[str] = None
+
+    @property
+    def lease_seconds(self) -> float:
+        return self.interval_seconds * LEASE_FRACTION
+
+
+class Scheduler:
+    """Runs registered jobs periodically on the running event loop"""
+
+    def __init__(self):
+        self.jobs: Dict[str, Job] = {}
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._tasks: List[asyncio.Task] = []
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[Session], dict],
+        interval_seconds: float,
+        initial_delay_seconds: float = 60.0
+    ) -> Job:
+        job = Job(name, func, interval_seconds, initial_delay_seconds)
+        self.jobs[name] = job
+        return job
+
+    # ---------- leases ----------
+
+    def _acquire(self, db: Session, job: Job) -> bool:
+        """Take the job's lease if it is free (or already ours)"""
+        locks = JobLock.__table__
+        now = datetime.utcnow()
+        until = now + timedelta(seconds=job.lease_seconds)
+        result = db.execute(
+            update(locks)
+            .where(locks.c.name == job.name, or_(locks.c.locked_until < now, locks.c.owner == self.worker_id))
+            .values(owner=self.worker_id, locked_until=until)
+        )
+        if result.rowcount == 1:
+            db.commit()
+            return True
+        if db.get(JobLock, job.name) is not None:
+            db.rollback()
+            return False
+        try:
+            db.execute(locks.insert().values(name=job.name, owner=self.worker_id, locked_until=until))
+            db.commit()
+            return True
+        except IntegrityError:
+            # Another worker created the row first
+            db.rollback()
+            return False
+
+    # ---------- running ----------
+
+    def run_job(self, name: str, force: bool = False) -> Optional[dict]:
+        """
+        Run a job now in the calling thread.
+
+        Returns the job's summary, or None when another worker holds the
+        lease (unless `force`, which skips leader election).
+        """
+        job = self.jobs[name]
+        db = SessionLocal()
+        try:
+            if not force and not self._acquire(db, job):
+                job.skipped += 1
+                return None
+
+            run = JobRun(job_name=job.name, worker=self.worker_id, started_at=datetime.utcnow())
+            db.add(run)
+            db.commit()
+
+            job.last_started_at = run.started_at
+            start = time.perf_counter()
+            try:
+                result = job.func(db) or {}
+                success = bool(result.get("success", True))
+                error = result.get("error")
+            except Exception as e:
+                db.rollback()
+                result, success, error = {}, False, f"{e}\n{traceback.format_exc()}"
+            duration_ms = (time.perf_counter() - start) * 1000
+
+            job.runs += 1
+            job.failures += 0 if success else 1
+            job.total_duration_ms += duration_ms
+            job.last_duration_ms = round(duration_ms, 2)
+            job.last_success = success
+            job.last_error = error
+
+            run.finished_at = datetime.utcnow()
+            run.duration_ms = round(duration_ms)
+            run.success = success
+            run.result = json.dumps(result, default=str)[:10000]
+            run.error = error
+            db.commit()
+            return result
+        finally:
+            db.close()
+
+    async def _loop(self, job: Job) -> None:
+        await asyncio.sleep(job.initial_delay_seconds)
+        while True:
+            ran = True
+            try:
+                ran = await asyncio.to_thread(self.run_job, job.name) is not None
+            except Exception as e:
+                print(f"⚠️  Scheduled job {job.name} failed to run: {e}")
+            await asyncio.sleep(job.interval_seconds if ran else min(job.interval_seconds, LEASE_RETRY_SECONDS))
+
+    def start(self) -> None:
+        """Start one task per job on the running event loop"""
+        if self._tasks:
+            return
+        for job in self.jobs.values():
+            self._tasks.append(asyncio.create_task(self._loop(job), name=f"scheduler:{job.name}"))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> dict:
+        return {
+            "worker": self.worker_id,
+            "running": bool(self._tasks),
+            "jobs": {
+                job.name: {
+                    "interval_seconds": job.interval_seconds,
+                    "runs": job.runs,
+                    "failures": job.failures,
+                    "skipped": job.skipped,
+                    "avg_duration_ms": round(job.total_duration_ms / job.runs, 2) if job.runs else None,
+                    "last_duration_ms": job.last_duration_ms,
+                    "last_started_at": job.last_started_at,
+                    "last_success": job.last_success,
+                    "last_error": job.last_error,
+                }
+                for job in self.jobs.values()
+            },
+        }
+
+
+# ========== JOBS ==========
+
+def prune_job_runs(db: Session) -> dict:
+    """Delete job_runs rows older than RUN_HISTORY_DAYS"""
+    cutoff = datetime.utcnow() - timedelta(days=RUN_HISTORY_DAYS)
+    result = db.execute(delete(JobRun.__table__).where(JobRun.__table__.c.started_at < cutoff))
+    db.commit()
+    return {"success": True, "deleted_count": result.rowcount}
+
+
+def register_default_jobs(scheduler: Scheduler) -> None:
+    scheduler.add_job("archive_expired_internships", archive_expired_internships, interval_seconds=3600)
+    scheduler.add_job("reconcile_applicant_counts", reconcile_applicant_counts, interval_seconds=24 * 3600)
+    scheduler.add_job("rebuild_daily_application_stats", rebuild_daily_application_stats, interval_seconds=24 * 3600)
+    scheduler.add_job("prune_job_runs", prune_job_runs, interval_seconds=24 * 3600)
+
+
+scheduler = Scheduler()
+register_default_jobs(scheduler)
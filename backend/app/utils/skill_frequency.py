@@ -0,0 +1,139 @@
+"""
+Incrementally maintained skill document frequencies for IDF-weighted scoring.
+
+Every active (publicly visible) internship and every student profile counts as
+one document. The table is loaded from the database on first use and then
+kept current by session events: each flush stages the new skill set of any
+Internship/StudentProfile written through the ORM, and the staged changes are
+applied once the transaction commits (and dropped on rollback). A periodic
+full rebuild picks up deadlines passing and writes that bypass the ORM.
+"""
+import math
+import threading
+import time
+from collections import Counter
+from typing import Dict, FrozenSet, Hashable, Optional
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from app.models.internship import Internship
+from app.models.profile import StudentProfile
+from app.utils.internship_catalog import is_visible, visible_internship_filters
+from app.utils.matching import parse_skill_set
+from app.utils.skills import internship_skill_names, student_skill_names
+
+# Rebuild the table from the database at least this often
+REBUILD_TTL_SECONDS = 3600
+
+# Internship fields that change its skills or whether it counts as active
+_INTERNSHIP_FIELDS = ('skills', 'required_skills', 'status', 'is_suspended', 'deadline')
+_STUDENT_FIELDS = ('skills',)
+_STAGED_KEY = 'skill_frequency_updates'
+
+
+class SkillFrequencyTable:
+    """Document frequency per normalized skill, updated one document at a time"""
+
+    def __init__(self):
+        self._documents: Dict[Hashable, FrozenSet[str]] = {}
+        self._frequencies: Counter = Counter()
+        self._lock = threading.Lock()
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def document_count(self) -> int:
+        return len(self._documents)
+
+    def frequency(self, skill: str) -> int:
+        return self._frequencies.get(skill, 0)
+
+    def update(self, key: Hashable, skills: Optional[set]) -> None:
+        """Replace a document's skills (None or empty removes the document)"""
+        new_skills = frozenset(skills or ())
+        with self._lock:
+            old_skills = self._documents.pop(key, frozenset())
+            for skill in old_skills - new_skills:
+                self._frequencies[skill] -= 1
+                if self._frequencies[skill] <= 0:
+                    del self._frequencies[skill]
+            for skill in new_skills - old_skills:
+                self._frequencies[skill] += 1
+            if new_skills:
+                self._documents[key] = new_skills
+
+    def idf(self, skill: str) -> float:
+        """Smoothed inverse document frequency; rare skills weigh more, never zero"""
+        return math.log((1 + self.document_count) / (1 + self.frequency(skill))) + 1
+
+    def rebuild(self, db: Session) -> None:
+        """Recount every active internship and student profile"""
+        documents: Dict[Hashable, FrozenSet[str]] = {}
+        for row in db.query(Internship.id, Internship.skills, Internship.required_skills).filter(
+            *visible_internship_filters()
+        ).all():
+            skills = parse_skill_set(row.required_skills or row.skills)
+            if skills:
+                documents[('internship', row.id)] = frozenset(skills)
+        for row in db.query(StudentProfile.id, StudentProfile.skills).all():
+            skills = parse_skill_set(row.skills)
+            if skills:
+                documents[('student', row.id)] = frozenset(skills)
+
+        frequencies: Counter = Counter()
+        for skills in documents.values():
+            frequencies.update(skills)
+
+        with self._lock:
+            self._documents = documents
+            self._frequencies = frequencies
+            self.loaded_at = time.monotonic()
+
+    def ensure_loaded(self, db: Session) -> None:
+        if self.loaded_at is None or time.monotonic() - self.loaded_at > REBUILD_TTL_SECONDS:
+            self.rebuild(db)
+
+
+skill_frequencies = SkillFrequencyTable()
+
+
+def idf_weights(db: Session):
+    """Skill weight function for `calculate_detailed_match(..., skill_weights=...)`"""
+    skill_frequencies.ensure_loaded(db)
+    return skill_frequencies.idf
+
+
+def _changed(obj, fields) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+
+@event.listens_for(Session, "after_flush")
+def _stage_frequency_updates(session, flush_context):
+    # History and the new/dirty/deleted collections still show the flushed changes here
+    staged = session.info.setdefault(_STAGED_KEY, {})
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Internship):
+            if obj in session.new or _changed(obj, _INTERNSHIP_FIELDS):
+                active = is_visible(obj)
+                staged[('internship', obj.id)] = internship_skill_names(obj) if active else None
+        elif isinstance(obj, StudentProfile):
+            if obj in session.new or _changed(obj, _STUDENT_FIELDS):
+                staged[('student', obj.id)] = student_skill_names(obj)
+    for obj in session.deleted:
+        if isinstance(obj, Internship):
+            staged[('internship', obj.id)] = None
+        elif isinstance(obj, StudentProfile):
+            staged[('student', obj.id)] = None
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_frequency_updates(session):
+    staged = session.info.pop(_STAGED_KEY, None)
+    if not staged or skill_frequencies.loaded_at is None:
+        return
+    for key, skills in staged.items():
+        skill_frequencies.update(key, skills)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_frequency_updates(session, previous_transaction):
+    session.info.pop(_STAGED_KEY, None)
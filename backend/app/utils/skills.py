@@ -0,0 +1,103 @@
+"""
+Normalized skill tables (skills, internship_skills, student_skills).
+
+A `before_flush` listener keeps the association tables in sync whenever an
+Internship's `skills`/`required_skills` or a StudentProfile's `skills` are
+written through the ORM, so "which internships need X" and "which students
+know X" are indexed joins instead of Python scans over every row.
+"""
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import event, inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.models.internship import Internship
+from app.models.profile import StudentProfile
+from app.models.skill import Skill, InternshipSkill, StudentSkill
+from app.utils.matching import parse_skill_set
+
+INTERNSHIP_SKILL_FIELDS = ('skills', 'required_skills')
+STUDENT_SKILL_FIELDS = ('skills',)
+
+
+def internship_skill_names(internship) -> set:
+    """Normalized skills of an internship (same source the matcher uses)"""
+    return parse_skill_set(internship.required_skills or internship.skills)
+
+
+def student_skill_names(student_profile) -> set:
+    """Normalized skills of a student profile"""
+    return parse_skill_set(student_profile.skills)
+
+
+def _get_skill(db: Session, name: str, cache: Dict[str, Skill]) -> Skill:
+    skill = cache.get(name)
+    if skill is None:
+        skill = db.query(Skill).filter(Skill.name == name).first()
+        if skill is None:
+            # Insert-or-ignore, then re-select: two saves introducing the same
+            # new skill at once must not fail on the unique skills.name
+            dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+            db.execute(dialect.insert(Skill.__table__).on_conflict_do_nothing(index_elements=["name"]), [{"name": name}])
+            skill = db.query(Skill).filter(Skill.name == name).one()
+        cache[name] = skill
+    return skill
+
+
+def _sync_links(db: Session, links: list, names: set, link_class, cache: Dict[str, Skill]) -> None:
+    current = {link.skill.name: link for link in links if link.skill is not None}
+    for name, link in current.items():
+        if name not in names:
+            links.remove(link)  # delete-orphan removes the row
+    for name in names - set(current):
+        links.append(link_class(skill=_get_skill(db, name, cache)))
+
+
+def sync_internship_skills(db: Session, internship: Internship, cache: Optional[Dict[str, Skill]] = None) -> None:
+    """Make internship_skills match the internship's skill columns"""
+    with db.no_autoflush:
+        _sync_links(db, internship.skill_links, internship_skill_names(internship), InternshipSkill,
+                    cache if cache is not None else {})
+
+
+def sync_student_skills(db: Session, student_profile: StudentProfile, cache: Optional[Dict[str, Skill]] = None) -> None:
+    """Make student_skills match the profile's skills"""
+    with db.no_autoflush:
+        _sync_links(db, student_profile.skill_links, student_skill_names(student_profile), StudentSkill,
+                    cache if cache is not None else {})
+
+
+def _changed(obj, fields: Iterable[str]) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+
+@event.listens_for(Session, "before_flush")
+def _sync_skill_links(session, flush_context, instances):
+    cache: Dict[str, Skill] = {}
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, Internship):
+            if obj in session.new or _changed(obj, INTERNSHIP_SKILL_FIELDS):
+                sync_internship_skills(session, obj, cache)
+        elif isinstance(obj, StudentProfile):
+            if obj in session.new or _changed(obj, STUDENT_SKILL_FIELDS):
+                sync_student_skills(session, obj, cache)
+
+
+# ========== INDEXED LOOKUPS ==========
+
+def internship_ids_with_skill(db: Session, skill: str) -> List[str]:
+    """Ids of internships that require a skill"""
+    rows = db.query(InternshipSkill.internship_id).join(
+        Skill, InternshipSkill.skill_id == Skill.id
+    ).filter(Skill.name == skill.strip().lower()).all()
+    return [row.internship_id for row in rows]
+
+
+def student_user_ids_with_skill(db: Session, skill: str) -> List[int]:
+    """User ids of students whose profile lists a skill"""
+    rows = db.query(StudentProfile.user_id).join(
+        StudentSkill, StudentSkill.student_profile_id == StudentProfile.id
+    ).join(
+        Skill, StudentSkill.skill_id == Skill.id
+    ).filter(Skill.name == skill.strip().lower()).all()
+    return [row.user_id for row in rows]
@@ -0,0 +1,10 @@
+"""
+Benchmarks for the matching code.
+
+Run from the backend directory, e.g.:
+    python -m benchmarks.matching_benchmark
+    python -m benchmarks.lsh_benchmark
+    python -m benchmarks.catalog_benchmark
+
+Synthetic data comes from benchmarks.synthetic; results are printed as JSON.
+"""
@@ -0,0 +1,127 @@
+"""
+Query count and latency of the company applicant list.
+
+For every applicant count it seeds an in-memory SQLite database (one
+employer, its internships, students with work experiences and projects, one
+application each), then calls GET /applications/company/all-applicants and
+reports the number of SQL statements it ran and its p50/p99 latency.
+
+The statement count must not grow with the number of applicants; the script
+exits with status 1 if it does. tests/test_applicant_query_counts.py runs
+the same check under pytest.
+(selectinload sends at most 500 keys per IN list, so runs above 500
+applicants add one statement per loaded collection per extra 500.)
+
+Usage:
+    python -m benchmarks.applicants_benchmark --scales 10 100 500
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+
+# The benchmark never touches a real database
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi import Response
+from sqlalchemy import event
+from app.api.v1.endpoints.applications import get_all_company_applicants
+from app.models.company import EmployerProfile
+from app.utils.match_cache import match_cache
+from benchmarks.matching_benchmark import _in_memory_session_factory
+from benchmarks.synthetic import seed_applicants, seed_catalog
+from benchmarks.timing import run_metadata, summarize, time_calls
+
+SCALES = (10, 100, 500)
+
+
+@contextlib.contextmanager
+def count_queries(engine):
+    """Yields a one-item list holding the number of statements executed so far"""
+    counter = [0]
+
+    def before_cursor_execute(*args):
+        counter[0] += 1
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def bench_applicants(SessionFactory, employer_profile_id: int, requests: int) -> list:
+    def request(**params):
+        match_cache.clear()
+        db = SessionFactory()
+        try:
+            company = db.get(EmployerProfile, employer_profile_id)
+            with contextlib.redirect_stdout(io.StringIO()):
+                return get_all_company_applicants(
+                    response=Response(), skip=0, limit=params.get("limit"), cursor=None,
+                    status=params.get("status"), internship_id=None,
+                    db=db, current_company=company, skill_weights=None
+                )
+        finally:
+            db.close()
+
+    engine = SessionFactory.kw["bind"]
+    results = []
+    for name, params in (("all_applicants", {}), ("first_page", {"limit": 20}), ("pending", {"status": "pending"})):
+        with count_queries(engine) as queries:
+            returned = len(request(**params))
+        # The EmployerProfile lookup is the caller's, not the endpoint's
+        results.append(summarize(
+            name, time_calls(lambda: request(**params), [()] * requests),
+            returned=returned, queries=queries[0] - 1
+        ))
+    return results
+
+
+def run(scales, internships: int, requests: int, seed: int) -> dict:
+    report = {"benchmark": "company_applicants", **run_metadata(), "results": []}
+    for scale in scales:
+        SessionFactory = _in_memory_session_factory()
+        db = SessionFactory()
+        try:
+            seeded = seed_catalog(db, internships=internships, students=scale, seed=seed)
+            seed_applicants(db, seeded["student_ids"], seed=seed)
+        finally:
+            db.close()
+        for result in bench_applicants(SessionFactory, seeded["employer_profile_id"], requests):
+            report["results"].append({"applicants": scale, **result})
+    return report
+
+
+def query_counts_constant(report: dict) -> bool:
+    counts = {}
+    for result in report["results"]:
+        counts.setdefault(result["name"], set()).add(result["queries"])
+    return all(len(values) == 1 for values in counts.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES), help="applicants per run")
+    parser.add_argument("--internships", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=20, help="timed requests per case")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = run(args.scales, args.internships, args.requests, args.seed)
+    report["query_count_constant"] = query_counts_constant(report)
+    output = json.dumps(report, indent=2, default=str)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    if not report["query_count_constant"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Deadline-day load on the apply endpoint.
+
+`--concurrency` students (200 by default) apply to the same internship at
+once, each from its own thread and session, and every student submits twice
+with the same Idempotency-Key (a client retry). It reports throughput and
+p50/p99 latency of the submissions, and checks that exactly one application
+per student was stored and the internship's applicant_count agrees.
+
+Runs on a temporary SQLite file by default (writers serialize on the
+database lock); pass --database-url to load a PostgreSQL database instead.
+The script exits with status 1 if any duplicate slipped through.
+
+Usage:
+    python -m benchmarks.apply_load_benchmark --concurrency 200
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# The benchmark never touches a real database unless asked to
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.db.base import Base
+from app.api.v1.endpoints.applications import apply_for_internship
+from app.models.application import Application
+from app.models.internship import Internship, InternshipStatus
+from app.models.user import User
+from app.schemas.application import ApplicationCreate
+from benchmarks.synthetic import seed_catalog
+from benchmarks.timing import run_metadata, summarize
+
+
+def _session_factory(database_url: str):
+    connect_args = {"check_same_thread": False, "timeout": 60} if database_url.startswith("sqlite") else {}
+    engine = create_engine(database_url, connect_args=connect_args, pool_size=20, max_overflow=200)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def bench_apply(SessionFactory, internship_id: str, student_ids: list, concurrency: int) -> dict:
+    barrier = threading.Barrier(concurrency)
+    outcomes = {}
+    outcomes_lock = threading.Lock()
+
+    def submit(student_id: int, attempt: int) -> float:
+        if attempt == 0:
+            barrier.wait()
+        db = SessionFactory()
+        start = time.perf_counter()
+        try:
+            user = db.get(User, student_id)
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    apply_for_internship(
+                        ApplicationCreate(internship_id=internship_id), db=db, current_user=user,
+                        idempotency_key=f"apply-{student_id}"
+                    )
+                outcome = "ok"
+            except HTTPException as e:
+                outcome = str(e.status_code)
+            except Exception as e:
+                outcome = type(e).__name__
+        finally:
+            db.close()
+        latency = time.perf_counter() - start
+        with outcomes_lock:
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        return latency
+
+    def student(student_id: int) -> list:
+        # The first submission and its retry
+        return [submit(student_id, attempt) for attempt in range(2)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = [latency for pair in pool.map(student, student_ids[:concurrency]) for latency in pair]
+    wall = time.perf_counter() - start
+
+    return {
+        **summarize("apply_deadline_burst", latencies),
+        "concurrency": concurrency,
+        "wall_seconds": round(wall, 4),
+        "throughput_per_sec": round(len(latencies) / wall, 2),
+        "outcomes": outcomes,
+    }
+
+
+def run(database_url: str, concurrency: int, seed: int) -> dict:
+    SessionFactory = _session_factory(database_url)
+    db = SessionFactory()
+    try:
+        seeded = seed_catalog(db, internships=100, students=concurrency, seed=seed)
+        internship_id = db.query(Internship.id).filter(
+            Internship.status == InternshipStatus.ACTIVE.value
+        ).order_by(Internship.id).limit(1).scalar()
+    finally:
+        db.close()
+
+    result = bench_apply(SessionFactory, internship_id, seeded["student_ids"], concurrency)
+
+    db = SessionFactory()
+    try:
+        stored = db.query(func.count(Application.id)).filter(Application.internship_id == internship_id).scalar()
+        distinct = db.query(func.count(func.distinct(Application.student_id))).filter(
+            Application.internship_id == internship_id
+        ).scalar()
+        counter = db.query(Internship.applicant_count).filter(Internship.id == internship_id).scalar()
+    finally:
+        db.close()
+
+    result.update({
+        "applications_stored": stored,
+        "distinct_students": distinct,
+        "applicant_count": counter,
+        "consistent": stored == distinct == counter == concurrency,
+    })
+    return {"benchmark": "apply_load", **run_metadata(), "results": [result]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=200, help="students applying at once")
+    parser.add_argument("--database-url", help="database to load (default: a temporary SQLite file)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or f"sqlite:///{os.path.join(directory, 'apply_load.db')}"
+        report = run(database_url, args.concurrency, args.seed)
+    output = json.dumps(report, indent=2, default=str)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    if not report["results"][0]["consistent"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Memory footprint and read latency of the in-process internship catalog.
+
+For every catalog size it seeds an in-memory SQLite database, loads the
+catalog snapshot (see app/utils/internship_catalog.py) and reports:
+  - the time of a full reload
+  - the approximate bytes held by the snapshot, per entry and per 10k postings
+  - p50/p99 of the public listing (first page and a filtered page) and the
+    facet counts, served from the snapshot
+
+Usage:
+    python -m benchmarks.catalog_benchmark --scales 1000 10000
+"""
+import argparse
+import json
+import os
+import random
+import time
+
+# The benchmark never touches a real database
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi import Response
+from app.api.v1.endpoints.internships import _ListingFilters, read_internships
+from app.utils.internship_catalog import internship_catalog
+from app.utils.internship_facets import compute_facets, facet_cache
+from benchmarks.matching_benchmark import _in_memory_session_factory
+from benchmarks.synthetic import CATEGORIES, LOCATIONS, SCALES, seed_catalog
+from benchmarks.timing import run_metadata, summarize, time_calls
+
+
+def bench_catalog(db, requests: int, rng: random.Random) -> list:
+    start = time.perf_counter()
+    loaded = internship_catalog.reload(db)
+    reload_seconds = time.perf_counter() - start
+    memory = internship_catalog.memory_report()
+
+    def listing(filters):
+        return read_internships(response=Response(), cursor=None, limit=20, filters=filters, db=db)
+
+    def facets(filters):
+        facet_cache.clear()
+        return compute_facets(filters, cache_key=filters.cache_key())
+
+    filter_sets = [
+        (_ListingFilters(location=rng.choice(LOCATIONS), category=rng.choice(CATEGORIES), min_stipend=10000),)
+        for _ in range(requests)
+    ]
+    return [
+        {"name": "catalog_reload", "loaded": loaded, "seconds": round(reload_seconds, 4), "memory": memory},
+        summarize("listing_first_page", time_calls(listing, [(_ListingFilters(),)] * requests)),
+        summarize("listing_filtered_page", time_calls(listing, filter_sets)),
+        summarize("facets_uncached", time_calls(facets, filter_sets)),
+    ]
+
+
+def run(scales, requests: int, seed: int) -> dict:
+    report = {"benchmark": "internship_catalog", **run_metadata(), "results": []}
+    for scale in scales:
+        SessionFactory = _in_memory_session_factory()
+        db = SessionFactory()
+        try:
+            seed_catalog(db, internships=scale, students=1, seed=seed)
+            results = bench_catalog(db, requests, random.Random(seed))
+        finally:
+            db.close()
+        internship_catalog.invalidate()
+        for result in results:
+            report["results"].append({"internships": scale, **result})
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    parser.add_argument("--requests", type=int, default=200, help="requests per read benchmark")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = run(args.scales, args.requests, args.seed)
+    output = json.dumps(report, indent=2, default=str)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Recall and latency of the MinHash/LSH matcher against the exact path.
+
+For each query student the exact top-K is computed with
+`calculate_detailed_match` over the whole catalog and compared with the
+LSH candidates after exact rescoring. Recall@K counts an LSH result as a hit
+when its score reaches the exact K-th best score (so ties don't count as misses).
+
+Usage:
+    python -m benchmarks.lsh_benchmark --internships 10000 --queries 200
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+from app.utils.matching import calculate_detailed_match
+from app.utils.minhash import MinHashLSH
+from benchmarks.synthetic import skill_vocabulary, zipf_skill_sets
+from benchmarks.timing import percentile, run_metadata
+
+
+def run(internships: int, queries: int, top_k: int, num_perm: int, threshold: float, seed: int) -> dict:
+    rng = random.Random(seed)
+    vocabulary = skill_vocabulary(2000)
+    catalog = zipf_skill_sets(internships, vocabulary, rng, 3, 8)
+    students = zipf_skill_sets(queries, vocabulary, rng, 3, 12)
+
+    index = MinHashLSH.for_threshold(threshold, num_perm=num_perm, kind="internship")
+    build_start = time.perf_counter()
+    for i, skills in enumerate(catalog):
+        index.add(i, skills)
+    build_seconds = time.perf_counter() - build_start
+
+    exact_ms, lsh_ms, recalls = [], [], []
+    for skills in students:
+        start = time.perf_counter()
+        exact = sorted(
+            (calculate_detailed_match(skills, required)['match_percentage'] for required in catalog),
+            reverse=True
+        )[:top_k]
+        exact_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        approx = index.query(skills, limit=top_k)
+        lsh_ms.append((time.perf_counter() - start) * 1000)
+
+        kth_score = exact[-1]
+        hits = sum(1 for _, details in approx if details['match_percentage'] >= kth_score)
+        recalls.append(min(hits, top_k) / top_k)
+
+    return {
+        "benchmark": "lsh_vs_exact",
+        **run_metadata(),
+        "internships": internships,
+        "queries": queries,
+        "top_k": top_k,
+        "num_perm": num_perm,
+        "bands": index.bands,
+        "rows": index.rows,
+        "threshold": threshold,
+        "build_seconds": round(build_seconds, 3),
+        "recall_at_k": round(statistics.mean(recalls), 4),
+        "exact_ms": {"p50": round(percentile(exact_ms, 50), 3), "p99": round(percentile(exact_ms, 99), 3)},
+        "lsh_ms": {"p50": round(percentile(lsh_ms, 50), 3), "p99": round(percentile(lsh_ms, 99), 3)},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--internships", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--num-perm", type=int, default=128)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.internships, args.queries, args.top_k, args.num_perm, args.threshold, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Micro and end-to-end benchmarks for student/internship matching.
+
+For every catalog size it measures:
+  - calculate_skills_match and calculate_detailed_match on random
+    (student, internship) pairs drawn from the synthetic catalog
+  - the /internships/with-match handler called directly against an in-memory
+    SQLite database seeded with the catalog, both cold (match cache and skill
+    index cleared before every request) and warm (cache populated)
+
+and prints one JSON document with ops/sec and p50/p99 latencies, tagged with
+the current commit so runs can be compared.
+
+Usage:
+    python -m benchmarks.matching_benchmark --scales 1000 10000 100000
+    python -m benchmarks.matching_benchmark --scales 1000 --output results.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+
+# The benchmark never touches a real database
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.db.base import Base
+from app.models.internship import Internship
+from app.models.user import User
+from app.api.v1.endpoints.internships import read_internships_with_match
+from app.utils.match_cache import match_cache
+from app.utils.matching import calculate_skills_match, calculate_detailed_match, match_engine
+from app.utils.internship_catalog import internship_catalog
+from benchmarks.synthetic import SCALES, seed_catalog
+from benchmarks.timing import summarize, time_calls, run_metadata
+
+
+def _in_memory_session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _reset_match_state() -> None:
+    match_cache.clear()
+    match_engine.clear()
+    internship_catalog.invalidate()
+
+
+def _student_skills(profile) -> str:
+    return ", ".join(profile.skills or []) if isinstance(profile.skills, list) else str(profile.skills or "")
+
+
+def bench_functions(db, pairs: int, rng: random.Random) -> list:
+    internships = db.query(Internship.skills, Internship.required_skills, Internship.level).all()
+    students = [_student_skills(user.student_profile) for user in db.query(User).filter(User.role == "student").all()]
+
+    sampled = []
+    for _ in range(pairs):
+        internship = rng.choice(internships)
+        sampled.append((rng.choice(students), internship.required_skills or internship.skills, internship.level))
+
+    return [
+        summarize("calculate_skills_match", time_calls(
+            calculate_skills_match, [(user_skills, required) for user_skills, required, _ in sampled]
+        )),
+        summarize("calculate_detailed_match", time_calls(
+            calculate_detailed_match, [(user_skills, required, "", level) for user_skills, required, level in sampled]
+        )),
+    ]
+
+
+def bench_with_match(SessionFactory, student_ids: list, requests: int) -> list:
+    def request(student_id, limit=None, cold=False):
+        if cold:
+            _reset_match_state()
+        db = SessionFactory()
+        try:
+            user = db.get(User, student_id)
+            # Handler prints debug lines; keep stdout clean for the JSON report
+            with contextlib.redirect_stdout(io.StringIO()):
+                return read_internships_with_match(
+                    limit=limit, min_score=None, db=db, current_user=user, skill_weights=None
+                )
+        finally:
+            db.close()
+
+    students = [student_ids[i % len(student_ids)] for i in range(requests)]
+    results = []
+
+    cold = time_calls(lambda student_id: request(student_id, cold=True), [(s,) for s in students])
+    returned = len(request(students[0]))
+    results.append(summarize("with_match_cold", cold, results_per_request=returned))
+
+    # Same students again: every pair is now served from the match cache
+    warm = time_calls(request, [(s,) for s in students])
+    results.append(summarize("with_match_warm", warm, results_per_request=returned))
+
+    _reset_match_state()
+    request(students[0], limit=20)  # build the skill index outside the timed loop
+    top = time_calls(lambda student_id: request(student_id, limit=20), [(s,) for s in students])
+    results.append(summarize("with_match_top20_indexed", top))
+
+    _reset_match_state()
+    return results
+
+
+def run(scales, students: int, pairs: int, requests: int, seed: int) -> dict:
+    report = {"benchmark": "matching", **run_metadata(), "results": []}
+    for scale in scales:
+        rng = random.Random(seed)
+        SessionFactory = _in_memory_session_factory()
+        db = SessionFactory()
+        try:
+            seeded = seed_catalog(db, internships=scale, students=students, seed=seed)
+            results = bench_functions(db, pairs, rng)
+        finally:
+            db.close()
+        results += bench_with_match(SessionFactory, seeded["student_ids"], requests)
+        for result in results:
+            report["results"].append({"internships": scale, **result})
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES))
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument("--pairs", type=int, default=20000, help="function calls per benchmark")
+    parser.add_argument("--requests", type=int, default=10, help="with-match requests per benchmark")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = run(args.scales, args.students, args.pairs, args.requests, args.seed)
+    output = json.dumps(report, indent=2, default=str)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
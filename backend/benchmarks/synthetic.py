@@ -0,0 +1,181 @@
+"""
+Synthetic internship catalogs and student populations for benchmarks.
+
+Skill popularity follows a Zipf distribution over a vocabulary whose head is
+made of real, common skills ("Python", "SQL", "React", ...) and whose long
+tail is synthetic, so a few skills appear in most postings while most skills
+are rare - the shape the matching code sees in production.
+
+Rows are produced as plain dicts and written with bulk INSERTs, which keeps
+seeding 100k internships fast and bypasses the ORM flush listeners (the
+normalized skill tables and IDF frequencies are not needed by the benchmarks).
+"""
+import random
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from app.models.application import Application
+from app.models.company import EmployerProfile
+from app.models.internship import Internship
+from app.models.profile import Project, StudentProfile, WorkExperience
+from app.models.user import User
+
+# Catalog sizes exercised by default
+SCALES = (1000, 10000, 100000)
+
+COMMON_SKILLS = [
+    "Python", "JavaScript", "SQL", "React", "Java", "Communication", "Excel", "HTML", "CSS",
+    "Node.js", "Git", "Machine Learning", "Data Analysis", "C++", "TypeScript", "Figma",
+    "Django", "AWS", "Docker", "Marketing", "Content Writing", "Flutter", "Kotlin", "Go",
+    "Pandas", "TensorFlow", "PostgreSQL", "MongoDB", "Photoshop", "Public Speaking",
+]
+LEVELS = ["Beginner", "Intermediate", "Advanced"]
+TYPES = ["Remote", "Hybrid", "In-office"]
+LOCATIONS = ["Remote", "Bengaluru", "Pune", "Mumbai", "Delhi", "Hyderabad", "Chennai"]
+CATEGORIES = ["Engineering", "Design", "Marketing", "Data Science", "Operations", "Content"]
+STATUSES = ["active"] * 17 + ["closed", "draft", "archived"]
+APPLICATION_STATUSES = ["pending"] * 6 + ["reviewed", "shortlisted", "offered", "accepted", "rejected", "hired"]
+
+
+def skill_vocabulary(size: int = 2000) -> List[str]:
+    """Common skills first (most popular), then synthetic long-tail skills"""
+    tail = [f"Skill {i}" for i in range(max(0, size - len(COMMON_SKILLS)))]
+    return (COMMON_SKILLS + tail)[:size]
+
+
+class ZipfSkillSampler:
+    """Draws skill sets whose skill popularity follows a Zipf distribution"""
+
+    def __init__(self, vocabulary: List[str], rng: random.Random, exponent: float = 1.1):
+        self.vocabulary = vocabulary
+        self.rng = rng
+        self._weights = [1.0 / (rank + 1) ** exponent for rank in range(len(vocabulary))]
+
+    def sample(self, low: int, high: int) -> List[str]:
+        size = self.rng.randint(low, high)
+        return list(dict.fromkeys(self.rng.choices(self.vocabulary, weights=self._weights, k=size)))
+
+
+def zipf_skill_sets(count: int, vocabulary: List[str], rng: random.Random, low: int, high: int) -> List[str]:
+    """`count` comma-separated skill strings with `low`..`high` draws each"""
+    sampler = ZipfSkillSampler(vocabulary, rng)
+    return [", ".join(sampler.sample(low, high)) for _ in range(count)]
+
+
+def internship_rows(
+    count: int,
+    employer_profile_id: int,
+    rng: random.Random,
+    vocabulary: Optional[List[str]] = None
+) -> List[Dict]:
+    """Column dicts for `count` internships (3-8 skills each, mostly active)"""
+    sampler = ZipfSkillSampler(vocabulary or skill_vocabulary(), rng)
+    today = date.today()
+    rows = []
+    for i in range(count):
+        skills = ", ".join(sampler.sample(3, 8))
+        rows.append({
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "title": f"{rng.choice(CATEGORIES)} Intern {i}",
+            "description": f"Synthetic internship {i}",
+            "employer_profile_id": employer_profile_id,
+            "is_suspended": rng.random() < 0.01,
+            "location": rng.choice(LOCATIONS),
+            "stipend": rng.randrange(0, 50001, 1000),
+            "duration": f"{rng.choice([1, 2, 3, 6])} months",
+            "type": rng.choice(TYPES),
+            "level": rng.choice(LEVELS),
+            "category": rng.choice(CATEGORIES),
+            "skills": skills,
+            "required_skills": skills if rng.random() < 0.5 else None,
+            "deadline": today + timedelta(days=rng.randint(-30, 120)) if rng.random() < 0.9 else None,
+            "date_posted": today - timedelta(days=rng.randint(0, 180)),
+            "status": rng.choice(STATUSES),
+        })
+    return rows
+
+
+def student_skill_lists(count: int, rng: random.Random, vocabulary: Optional[List[str]] = None) -> List[List[str]]:
+    """JSON skill arrays (as stored on StudentProfile.skills), 4-12 draws each"""
+    sampler = ZipfSkillSampler(vocabulary or skill_vocabulary(), rng)
+    return [sampler.sample(4, 12) for _ in range(count)]
+
+
+def seed_catalog(db: Session, internships: int, students: int, seed: int = 42) -> Dict:
+    """
+    Insert one employer, `internships` internships and `students` students.
+
+    Returns:
+        dict with the employer profile id and the student user ids
+    """
+    rng = random.Random(seed)
+    vocabulary = skill_vocabulary()
+
+    employer_user = User(email="benchmark-employer@example.com", hashed_password="x", role="employer")
+    db.add(employer_user)
+    db.flush()
+    employer_profile = EmployerProfile(user_id=employer_user.id, company_name="Benchmark Corp")
+    db.add(employer_profile)
+    db.flush()
+
+    batch_size = 5000
+    rows = internship_rows(internships, employer_profile.id, rng, vocabulary)
+    for start in range(0, len(rows), batch_size):
+        db.execute(insert(Internship), rows[start:start + batch_size])
+
+    skill_lists = student_skill_lists(students, rng, vocabulary)
+    db.execute(insert(User), [
+        {"email": f"benchmark-student-{i}@example.com", "hashed_password": "x", "role": "student",
+         "full_name": f"Student {i}"}
+        for i in range(students)
+    ])
+    student_ids = [
+        row.id for row in db.query(User.id).filter(User.role == "student").order_by(User.id).all()
+    ]
+    db.execute(insert(StudentProfile), [
+        {"user_id": user_id, "skills": skills, "university": "Benchmark University"}
+        for user_id, skills in zip(student_ids, skill_lists)
+    ])
+    db.commit()
+
+    return {"employer_profile_id": employer_profile.id, "student_ids": student_ids}
+
+
+def seed_applicants(db: Session, student_ids: List[int], seed: int = 42, per_student: int = 1) -> List[str]:
+    """
+    Give every student two work experiences, two projects and `per_student`
+    applications to random internships.
+
+    Returns:
+        the application ids
+    """
+    rng = random.Random(seed)
+    internship_ids = [row.id for row in db.query(Internship.id).order_by(Internship.id).all()]
+    today = date.today()
+    db.execute(insert(WorkExperience), [
+        {"user_id": user_id, "company": f"Company {i}", "position": "Intern",
+         "start_date": today - timedelta(days=365), "end_date": today - timedelta(days=180),
+         "description": "Synthetic work experience"}
+        for user_id in student_ids for i in range(2)
+    ])
+    db.execute(insert(Project), [
+        {"user_id": user_id, "title": f"Project {i}", "description": "Synthetic project",
+         "technologies": "Python, SQL"}
+        for user_id in student_ids for i in range(2)
+    ])
+    rows = []
+    for user_id in student_ids:
+        for internship_id in rng.sample(internship_ids, min(per_student, len(internship_ids))):
+            rows.append({
+                "id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "student_id": user_id,
+                "internship_id": internship_id,
+                "status": rng.choice(APPLICATION_STATUSES),
+                "application_date": datetime.utcnow() - timedelta(days=rng.randint(0, 90)),
+                "match_score": round(rng.random() * 100, 2) if rng.random() < 0.9 else None,
+            })
+    db.execute(insert(Application), rows)
+    db.commit()
+    return [row["id"] for row in rows]
@@ -0,0 +1,54 @@
+"""
+Timing helpers shared by the benchmarks.
+"""
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, List, Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def summarize(name: str, latencies_seconds: List[float], **extra) -> dict:
+    """ops/sec and p50/p99 (milliseconds) for a list of per-call latencies"""
+    total = sum(latencies_seconds)
+    latencies_ms = [latency * 1000 for latency in latencies_seconds]
+    result = {
+        "name": name,
+        "calls": len(latencies_seconds),
+        "ops_per_sec": round(len(latencies_seconds) / total, 2) if total else None,
+        "p50_ms": round(percentile(latencies_ms, 50), 4),
+        "p99_ms": round(percentile(latencies_ms, 99), 4),
+    }
+    result.update(extra)
+    return result
+
+
+def time_calls(func: Callable, arguments: Sequence[tuple]) -> List[float]:
+    """Call `func(*args)` for every tuple in `arguments`; return per-call latencies in seconds"""
+    latencies = []
+    clock = time.perf_counter
+    for args in arguments:
+        start = clock()
+        func(*args)
+        latencies.append(clock() - start)
+    return latencies
+
+
+def run_metadata() -> dict:
+    """Commit and interpreter info so JSON results can be compared across commits"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script
+Creates the application_events log and backfills a history for existing
+applications from their timestamps:
+
+- created (-> pending) at application_date
+- pending -> offered at offer_sent_date
+- offered -> accepted/declined at offer_response_date
+- -> hired at hired_date
+- any other current status (reviewed, shortlisted, rejected, ...) is entered
+  from pending at updated_at (or application_date)
+
+Applications that already have events are skipped, so it is safe to re-run.
+
+Usage:
+    python create_application_events.py
+"""
+
+import sys
+import os
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import select
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.models import Application, ApplicationEvent
+from app.models.application import ApplicationStatus
+
+BATCH_SIZE = 1000
+
+PENDING = ApplicationStatus.PENDING.value
+OFFERED = ApplicationStatus.OFFERED.value
+ACCEPTED = ApplicationStatus.ACCEPTED.value
+DECLINED = ApplicationStatus.DECLINED.value
+HIRED = ApplicationStatus.HIRED.value
+
+
+def _naive(value):
+    # Event times are naive UTC
+    return value.replace(tzinfo=None) if value is not None and value.tzinfo is not None else value
+
+
+def history(application):
+    """(from_status, to_status, at) events reconstructed from an application's timestamps"""
+    applied_at = _naive(application.application_date)
+    events = [(None, PENDING, applied_at)]
+    status = PENDING
+    if application.offer_sent_date:
+        events.append((status, OFFERED, _naive(application.offer_sent_date)))
+        status = OFFERED
+    if application.offer_response_date and application.status in (ACCEPTED, DECLINED, HIRED):
+        response = DECLINED if application.status == DECLINED else ACCEPTED
+        events.append((status, response, _naive(application.offer_response_date)))
+        status = response
+    if application.hired_date:
+        events.append((status, HIRED, _naive(application.hired_date)))
+        status = HIRED
+    if application.status != status:
+        events.append((status, application.status, _naive(application.updated_at) or applied_at))
+    return events
+
+
+def migrate_database():
+    """Create application_events and backfill it"""
+    
+    db = SessionLocal()
+    
+    try:
+        print("\n" + "=" * 60)
+        print("🔧 Database Migration: Application Event Log")
+        print("=" * 60 + "\n")
+        
+        print("⏳ Creating application_events table...")
+        Base.metadata.create_all(bind=engine, tables=[ApplicationEvent.__table__])
+        print("✅ Table is in place")
+        
+        print("⏳ Backfilling events for existing applications...")
+        logged = select(ApplicationEvent.application_id)
+        applications = db.query(Application).filter(Application.id.not_in(logged)).yield_per(BATCH_SIZE)
+        rows, backfilled = [], 0
+        for application in applications:
+            backfilled += 1
+            for from_status, to_status, at in history(application):
+                rows.append({
+                    "application_id": application.id,
+                    "internship_id": application.internship_id,
+                    "student_id": application.student_id,
+                    "from_status": from_status,
+                    "to_status": to_status,
+                    "created_at": at,
+                })
+        for start in range(0, len(rows), BATCH_SIZE):
+            db.execute(ApplicationEvent.__table__.insert(), rows[start:start + BATCH_SIZE])
+        db.commit()
+        print(f"✅ Wrote {len(rows)} event(s) for {backfilled} application(s)")
+        
+        print("\n" + "=" * 60)
+        print("✅ DATABASE MIGRATION COMPLETED SUCCESSFULLY!")
+        print("=" * 60 + "\n")
+        
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate_database()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script
+Creates the daily_application_stats rollup table and fills it from the
+applications table.
+
+Safe to re-run: the rollup is recomputed from scratch.
+
+Usage:
+    python create_daily_application_stats.py
+"""
+
+import sys
+import os
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.models import DailyApplicationStat
+from app.utils.application_stats import rebuild_daily_application_stats
+
+
+def migrate_database():
+    """Create daily_application_stats and backfill it"""
+    
+    db = SessionLocal()
+    
+    try:
+        print("\n" + "=" * 60)
+        print("🔧 Database Migration: Daily Application Stats Rollup")
+        print("=" * 60 + "\n")
+        
+        print("⏳ Creating daily_application_stats table...")
+        Base.metadata.create_all(bind=engine, tables=[DailyApplicationStat.__table__])
+        print("✅ Table is in place")
+        
+        print("⏳ Rebuilding rollup from applications...")
+        result = rebuild_daily_application_stats(db)
+        if not result["success"]:
+            raise Exception(result["error"])
+        print(f"✅ {result['message']}")
+        
+        print("\n" + "=" * 60)
+        print("✅ DATABASE MIGRATION COMPLETED SUCCESSFULLY!")
+        print("=" * 60 + "\n")
+        
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate_database()
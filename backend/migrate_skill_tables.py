@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script
+Creates the normalized skill tables (skills, internship_skills, student_skills)
+and backfills them from Internship.skills / required_skills and
+StudentProfile.skills.
+
+Safe to re-run: existing associations are diffed, not duplicated.
+
+Usage:
+    python migrate_skill_tables.py
+"""
+
+import sys
+import os
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.models import Internship, StudentProfile, Skill, InternshipSkill, StudentSkill
+from app.utils.skills import sync_internship_skills, sync_student_skills
+
+BATCH_SIZE = 500
+
+
+def migrate_database():
+    """Create the skill tables and backfill them from existing rows"""
+    
+    db = SessionLocal()
+    
+    try:
+        print("\n" + "=" * 60)
+        print("🔧 Database Migration: Normalized Skill Tables")
+        print("=" * 60 + "\n")
+        
+        print("⏳ Creating skills, internship_skills and student_skills tables...")
+        Base.metadata.create_all(
+            bind=engine,
+            tables=[Skill.__table__, InternshipSkill.__table__, StudentSkill.__table__]
+        )
+        print("✅ Tables and indexes are in place")
+        
+        cache = {}
+        
+        print("⏳ Backfilling internship skills...")
+        internship_ids = [row.id for row in db.query(Internship.id).order_by(Internship.id).all()]
+        for start in range(0, len(internship_ids), BATCH_SIZE):
+            batch = db.query(Internship).filter(Internship.id.in_(internship_ids[start:start + BATCH_SIZE])).all()
+            for internship in batch:
+                sync_internship_skills(db, internship, cache)
+            db.commit()
+        print(f"✅ Backfilled skills for {len(internship_ids)} internship(s)")
+        
+        print("⏳ Backfilling student skills...")
+        profile_ids = [row.id for row in db.query(StudentProfile.id).order_by(StudentProfile.id).all()]
+        for start in range(0, len(profile_ids), BATCH_SIZE):
+            batch = db.query(StudentProfile).filter(StudentProfile.id.in_(profile_ids[start:start + BATCH_SIZE])).all()
+            for student_profile in batch:
+                sync_student_skills(db, student_profile, cache)
+            db.commit()
+        print(f"✅ Backfilled skills for {len(profile_ids)} student profile(s)")
+        
+        print(f"\n📊 Distinct skills: {db.query(Skill).count()}")
+        
+        print("\n" + "=" * 60)
+        print("✅ DATABASE MIGRATION COMPLETED SUCCESSFULLY!")
+        print("=" * 60 + "\n")
+        
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate_database()
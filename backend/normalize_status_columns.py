@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Database Migration Script
+Rewrites applications.status and internships.status to their canonical
+lowercase values (see ApplicationStatus / InternshipStatus), adds the
+status indexes and, on PostgreSQL, the NOT NULL / CHECK constraints.
+
+- Internships with a NULL, empty or unknown status were visible before and
+  become 'active'.
+- Applications with a NULL or empty status become 'pending'; legacy
+  spellings and frontend labels ("Under Review", "offer_rejected", ...) map
+  to their canonical status (see STATUS_ALIASES). If any application status
+  is unknown, the migration lists the values and stops before rewriting
+  anything; add them to STATUS_ALIASES and re-run.
+
+Safe to re-run.
+
+Usage:
+    python normalize_status_columns.py
+"""
+
+import sys
+import os
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy import text
+from app.db.session import SessionLocal
+from app.models.application import ApplicationStatus
+from app.models.internship import InternshipStatus
+from app.utils.application_stats import rebuild_daily_application_stats
+
+INDEXES = [
+    ("ix_applications_internship_status", "applications", "internship_id, status"),
+    ("ix_internships_status_deadline", "internships", "status, deadline"),
+]
+
+# (table, constraint, enum, default, status for unknown values - None: stop the migration)
+CONSTRAINTS = [
+    ("applications", "ck_applications_status", ApplicationStatus, ApplicationStatus.PENDING, None),
+    ("internships", "ck_internships_status", InternshipStatus, InternshipStatus.ACTIVE, InternshipStatus.ACTIVE),
+]
+
+
+def canonical_values(db, table, enum_cls, fallback):
+    """{stored value: canonical value} for every distinct status of `table`"""
+    values = [row[0] for row in db.execute(text(f"SELECT DISTINCT status FROM {table}")).all()]
+    mapping, unknown = {}, []
+    for value in values:
+        try:
+            mapping[value] = enum_cls.parse(value).value
+        except ValueError:
+            if fallback is None:
+                unknown.append(value)
+                continue
+            mapping[value] = fallback.value
+            print(f"⚠️  Unknown {table} status {value!r} -> {fallback.value!r}")
+    if unknown:
+        raise Exception(f"Unknown {table} status value(s): {', '.join(repr(value) for value in unknown)}; "
+                        f"map them in STATUS_ALIASES before migrating")
+    return mapping
+
+
+def normalize_table(db, table, mapping):
+    """Rewrite every distinct status value of `table` to its canonical form"""
+    changed = 0
+    for value, canonical in mapping.items():
+        if value == canonical:
+            continue
+        if value is None:
+            result = db.execute(text(f"UPDATE {table} SET status = :new WHERE status IS NULL"), {"new": canonical})
+        else:
+            result = db.execute(text(f"UPDATE {table} SET status = :new WHERE status = :old"),
+                                {"new": canonical, "old": value})
+        changed += result.rowcount
+    db.commit()
+    return changed
+
+
+def migrate_database():
+    """Normalize status columns, then add indexes and constraints"""
+
+    db = SessionLocal()
+
+    try:
+        print("\n" + "=" * 60)
+        print("🔧 Database Migration: Canonical Status Values")
+        print("=" * 60 + "\n")
+
+        # Check every table before rewriting any
+        mappings = {table: canonical_values(db, table, enum_cls, fallback)
+                    for table, _, enum_cls, _, fallback in CONSTRAINTS}
+        for table, mapping in mappings.items():
+            print(f"⏳ Normalizing {table}.status...")
+            changed = normalize_table(db, table, mapping)
+            print(f"✅ Rewrote {changed} row(s)")
+
+        for name, table, columns in INDEXES:
+            print(f"⏳ Creating {name} on {table} ({columns})...")
+            try:
+                db.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+                db.commit()
+                print(f"✅ Successfully created {name}")
+            except Exception as e:
+                print(f"⚠️  Note: {e}")
+                db.rollback()
+
+        if db.get_bind().dialect.name == "postgresql":
+            for table, name, enum_cls, default, _ in CONSTRAINTS:
+                allowed = ", ".join(f"'{status.value}'" for status in enum_cls)
+                print(f"⏳ Adding NOT NULL, default and {name} to {table}.status...")
+                try:
+                    db.execute(text(f"ALTER TABLE {table} ALTER COLUMN status SET DEFAULT '{default.value}'"))
+                    db.execute(text(f"ALTER TABLE {table} ALTER COLUMN status SET NOT NULL"))
+                    db.execute(text(f"ALTER TABLE {table} ADD CONSTRAINT {name} CHECK (status IN ({allowed}))"))
+                    db.commit()
+                    print(f"✅ Constraints added to {table}.status")
+                except Exception as e:
+                    print(f"⚠️  Note: {e}")
+                    db.rollback()
+        else:
+            print("ℹ️  Not PostgreSQL: skipping ALTER TABLE constraints (enforced by the models)")
+
+        # Rollup rows are keyed by status; recount them under the canonical values
+        print("⏳ Rebuilding daily application stats...")
+        result = rebuild_daily_application_stats(db)
+        if not result["success"]:
+            raise Exception(result["error"])
+        print(f"✅ {result['message']}")
+
+        print("\n" + "=" * 60)
+        print("✅ DATABASE MIGRATION COMPLETED SUCCESSFULLY!")
+        print("=" * 60 + "\n")
+
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    migrate_database()
@@ -0,0 +1,77 @@
+"""
+N+1 regression check for the employer applicant lists.
+
+Seeds an in-memory SQLite database at two sizes and asserts that the number
+of SQL statements each endpoint runs does not grow with the number of
+applicants.
+
+Usage (from backend/):
+    python -m pytest tests
+"""
+import contextlib
+import io
+import os
+
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest
+from fastapi import Response
+from app.api.v1.endpoints.applications import get_all_company_applicants, get_applicants_with_match_score
+from app.models.company import EmployerProfile
+from app.models.internship import Internship
+from app.utils.match_cache import match_cache
+from benchmarks.applicants_benchmark import count_queries
+from benchmarks.matching_benchmark import _in_memory_session_factory
+from benchmarks.synthetic import seed_applicants, seed_catalog
+
+SMALL, LARGE = 10, 60
+
+
+def _seeded(students: int, internships: int):
+    SessionFactory = _in_memory_session_factory()
+    db = SessionFactory()
+    try:
+        seeded = seed_catalog(db, internships=internships, students=students)
+        seed_applicants(db, seeded["student_ids"])
+        internship_id = db.query(Internship.id).order_by(Internship.id).limit(1).scalar()
+    finally:
+        db.close()
+    return SessionFactory, seeded["employer_profile_id"], internship_id
+
+
+def _query_count(SessionFactory, employer_profile_id: int, call) -> int:
+    match_cache.clear()
+    db = SessionFactory()
+    try:
+        company = db.get(EmployerProfile, employer_profile_id)
+        with count_queries(SessionFactory.kw["bind"]) as queries, contextlib.redirect_stdout(io.StringIO()):
+            returned = call(db, company)
+        assert returned
+        return queries[0]
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("params", [{}, {"limit": 20}])
+def test_all_company_applicants_query_count_is_constant(params):
+    def call(db, company):
+        return get_all_company_applicants(
+            response=Response(), skip=0, limit=params.get("limit"), cursor=None,
+            status=None, internship_id=None,
+            db=db, current_company=company, skill_weights=None
+        )
+
+    counts = [_query_count(*_seeded(students, internships=5)[:2], call) for students in (SMALL, LARGE)]
+    assert counts[0] == counts[1]
+
+
+def test_internship_applicants_query_count_is_constant():
+    counts = []
+    for students in (SMALL, LARGE):
+        # One internship, so every student applies to it
+        SessionFactory, employer_profile_id, internship_id = _seeded(students, internships=1)
+        counts.append(_query_count(SessionFactory, employer_profile_id, lambda db, company: get_applicants_with_match_score(
+            internship_id, skip=0, limit=None, db=db, current_company=company, skill_weights=None
+        )))
+    assert counts[0] == counts[1]
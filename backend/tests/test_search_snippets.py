@@ -0,0 +1,53 @@
+"""
+Search snippets are HTML-escaped apart from the <mark> tags around matches.
+
+Indexes a posting whose description holds markup and the private-use
+characters the search uses to delimit matches, on an in-memory SQLite
+database with FTS5.
+
+Usage (from backend/):
+    python -m pytest tests
+"""
+import os
+
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.models.company import EmployerProfile
+from app.models.internship import Internship, InternshipStatus
+from app.models.user import User
+from app.utils import internship_search
+from benchmarks.matching_benchmark import _in_memory_session_factory
+
+# \ue000/\ue001 delimit matches inside the search; in stored text they may at most become <mark> tags
+DESCRIPTION = '<script>alert("x")</script> Python <b onmouseover=alert(1)>developer</b> \ue000<i>stray</i>\ue001'
+
+
+def test_snippet_is_escaped_apart_from_mark_tags():
+    SessionFactory = _in_memory_session_factory()
+    assert internship_search.setup_search(SessionFactory.kw["bind"])
+    db = SessionFactory()
+    try:
+        employer = User(email="search-employer@example.com", hashed_password="x", role="employer")
+        db.add(employer)
+        db.flush()
+        profile = EmployerProfile(user_id=employer.id, company_name="Search Corp")
+        db.add(profile)
+        db.flush()
+        db.add(Internship(
+            id="search-snippet", title="Intern", description=DESCRIPTION,
+            employer_profile_id=profile.id, status=InternshipStatus.ACTIVE.value
+        ))
+        db.commit()
+
+        total, rows = internship_search.search_internships(db, "python")
+    finally:
+        db.close()
+
+    assert total == 1
+    snippet = rows[0][2]
+    assert "<mark>Python</mark>" in snippet
+    assert "&lt;script&gt;" in snippet and "&lt;b onmouseover" in snippet
+    # Nothing but the <mark> tags survives as markup
+    markup_free = snippet.replace("<mark>", "").replace("</mark>", "")
+    assert "<" not in markup_free and ">" not in markup_free
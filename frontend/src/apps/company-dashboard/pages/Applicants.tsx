@@ -86,6 +86,7 @@ export const Applicants: React.FC = () => {
         const transformedStatus = app.status.toLowerCase().includes('review') ? 'Under Review' : 
                 app.status.toLowerCase() === 'accepted' || app.status.toLowerCase() === 'offer accepted' || app.status.toLowerCase() === 'offer_accepted' ? 'Offer Accepted' :
                 app.status.toLowerCase() === 'offered' ? 'Offered' : 
+                app.status.toLowerCase() === 'declined' || app.status.toLowerCase() === 'offer_rejected' ? 'Offer Rejected' :
                 app.status.toLowerCase() === 'rejected' ? 'Rejected' : 
                 app.status.toLowerCase() === 'hired' ? 'Hired' :
                 'Applied';
@@ -186,6 +187,7 @@ export const Applicants: React.FC = () => {
           status: details.status ? (details.status.toLowerCase().includes('review') ? 'Under Review' : 
                    details.status.toLowerCase() === 'accepted' || details.status.toLowerCase() === 'offer accepted' ? 'Offer Accepted' :
                    details.status.toLowerCase() === 'offered' ? 'Offered' :
+                   details.status.toLowerCase() === 'declined' || details.status.toLowerCase() === 'offer_rejected' ? 'Offer Rejected' :
                    details.status.toLowerCase() === 'rejected' ? 'Rejected' :
                    details.status.toLowerCase() === 'hired' ? 'Hired' : 'Applied') : 'Applied',
           applicationDate: details.applied_date ? new Date(details.applied_date) : new Date(),
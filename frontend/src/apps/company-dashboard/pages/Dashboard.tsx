@@ -24,6 +24,7 @@ import { NotificationSystem, useNotifications } from '../components/Notification
 import { apiClient } from '@/api';
 import { applicationService } from '@/services/application.service';
 import type { DashboardStats, Internship, Applicant } from '@/shared/types';
+import { toInternshipDisplayStatus } from '@/shared/lib/utils';
 
 export const Dashboard: React.FC = () => {
   const [isLoading, setIsLoading] = useState(true);
@@ -67,7 +68,7 @@ export const Dashboard: React.FC = () => {
           location: item.location || 'Remote',
           stipend: item.stipend || 0,
           applicantCount: item.applicant_count || 0, // Use the actual count from backend
-          status: (item.status || 'Active') as 'Active' | 'Closed' | 'Draft',
+          status: toInternshipDisplayStatus(item.status),
           datePosted: item.date_posted ? new Date(item.date_posted) : new Date(),
           deadline: item.deadline ? new Date(item.deadline) : new Date(Date.now() + 30 * 24 * 60 * 60 * 1000),
           description: item.description || '',
@@ -101,6 +102,7 @@ export const Dashboard: React.FC = () => {
             status: item.status.toLowerCase().includes('review') ? 'Under Review' : 
                     item.status.toLowerCase() === 'accepted' || item.status.toLowerCase() === 'offer accepted' || item.status.toLowerCase() === 'offer_accepted' ? 'Offer Accepted' :
                     item.status.toLowerCase() === 'offered' ? 'Offered' : 
+                    item.status.toLowerCase() === 'declined' || item.status.toLowerCase() === 'offer_rejected' ? 'Offer Rejected' :
                     item.status.toLowerCase() === 'rejected' ? 'Rejected' : 
                     item.status.toLowerCase() === 'hired' ? 'Hired' :
                     'Applied',
@@ -6,6 +6,7 @@ import { Card, CardContent, CardHeader, CardTitle } from '@/shared/components/ui
 import { Button } from '@/shared/components/ui/button';
 import { Badge } from '@/shared/components/ui/badge';
 import { internshipService, InternshipResponse } from '@/services/internship.service';
+import { toInternshipDisplayStatus } from '@/shared/lib/utils';
 
 export const EditInternshipPage: React.FC = () => {
   const navigate = useNavigate();
@@ -45,7 +46,7 @@ export const EditInternshipPage: React.FC = () => {
       try {
         setIsLoading(true);
         const data = await internshipService.getCompanyInternshipById(id);
-        setInternship(data);
+        setInternship({ ...data, status: toInternshipDisplayStatus(data.status) });
         setFormData({
           title: data.title || '',
           description: data.description || '',
@@ -59,7 +60,7 @@ export const EditInternshipPage: React.FC = () => {
           skills: data.skills || '',
           benefits: data.benefits || '',
           deadline: data.deadline ? data.deadline.split('T')[0] : '',
-          status: (data.status as 'Active' | 'Closed' | 'Draft') || 'Active'
+          status: toInternshipDisplayStatus(data.status)
         });
       } catch (error) {
         console.error('Error fetching internship:', error);
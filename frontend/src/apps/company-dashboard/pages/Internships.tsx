@@ -18,7 +18,7 @@ import { DataTable, Column } from '../components/data-table/DataTable';
 import { Button } from '@/shared/components/ui/button';
 import { Badge } from '@/shared/components/ui/badge';
 import { Card, CardContent } from '@/shared/components/ui/card';
-import { formatCurrency, formatDate, getStatusColor } from '@/shared/lib/utils';
+import { formatCurrency, formatDate, getStatusColor, toInternshipDisplayStatus } from '@/shared/lib/utils';
 import { useAuth } from '../../../auth/AuthContext';
 import { InternshipDetailsModal } from '../components/InternshipDetailsModal';
 import type { Internship } from '@/shared/types';
@@ -59,7 +59,7 @@ export const Internships: React.FC = () => {
         location: item.location || 'Remote',
         stipend: item.stipend || 0,
         applicantCount: item.applicant_count || 0, // Use the actual count from backend
-        status: (item.status || 'Active') as 'Active' | 'Closed' | 'Draft',
+        status: toInternshipDisplayStatus(item.status),
         datePosted: item.date_posted ? new Date(item.date_posted) : new Date(),
         deadline: item.deadline ? new Date(item.deadline) : new Date(Date.now() + 30 * 24 * 60 * 60 * 1000),
         description: item.description || '',
@@ -68,6 +68,7 @@ export const QuickApprovalPage: React.FC = () => {
         status: app.status.toLowerCase().includes('review') ? 'Under Review' : 
                 app.status.toLowerCase() === 'accepted' || app.status.toLowerCase() === 'offer accepted' || app.status.toLowerCase() === 'offer_accepted' ? 'Offer Accepted' :
                 app.status.toLowerCase() === 'offered' ? 'Offered' : 
+                app.status.toLowerCase() === 'declined' || app.status.toLowerCase() === 'offer_rejected' ? 'Offer Rejected' :
                 app.status.toLowerCase() === 'rejected' ? 'Rejected' : 
                 app.status.toLowerCase() === 'hired' ? 'Hired' :
                 'Applied',
@@ -43,4 +43,18 @@ export function getStatusColor(status: string | undefined) {
     default:
       return 'text-gray-600 bg-gray-100';
   }
-}
\ No newline at end of file
+}
+
+// The backend returns internship statuses in lowercase ('active', 'closed', ...);
+// the dashboards display and compare them as 'Active' | 'Closed' | 'Draft'
+export function toInternshipDisplayStatus(status: string | null | undefined): 'Active' | 'Closed' | 'Draft' {
+  switch ((status || 'active').toLowerCase()) {
+    case 'draft':
+      return 'Draft';
+    case 'closed':
+    case 'archived':
+      return 'Closed';
+    default:
+      return 'Active';
+  }
+}